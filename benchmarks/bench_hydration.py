@@ -0,0 +1,65 @@
+"""Records/sec for turning query results into model instances.
+
+    python benchmarks/bench_hydration.py [--rows 10000] [--repeat 5]
+
+Both cases time the current code. ``validated`` is ``ModelFilter(trusted=False)``:
+FilteredDatabaseRecord plus Model.__init__, which re-runs every field's
+validation. ``trusted`` is the default ModelFilter path, which decodes raw pages
+with the fields' deserializers and skips that validation. The speedup is
+``trusted`` over ``validated``; it is not a comparison with an older release.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+module_path = os.path.join(os.path.dirname(__file__), "..")
+sys.path.append(module_path)
+
+from benchmarks.payloads import BenchModel, make_pages
+from notion_api.domains.databases_domain import FilteredDatabaseRecord
+from notion_api.orm.orm_models import ModelFilter
+
+
+def hydrate_validated(pages):
+    model_filter = ModelFilter(BenchModel, trusted=False)
+    return [
+        model_filter._create_instance_from_record(FilteredDatabaseRecord.from_dict(p))
+        for p in pages
+    ]
+
+
+def hydrate_trusted(pages):
+    model_filter = ModelFilter(BenchModel)
+    return [model_filter._create_instance_from_page(p) for p in pages]
+
+
+def measure(func, pages, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(pages)
+        best = min(best, time.perf_counter() - start)
+    return len(pages) / best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    pages = make_pages(args.rows)
+    results = {
+        "validated": measure(hydrate_validated, pages, args.repeat),
+        "trusted": measure(hydrate_trusted, pages, args.repeat),
+    }
+    for name, rate in results.items():
+        print(f"{name:>10}: {rate:>12,.0f} records/sec")
+    speedup = results["trusted"] / results["validated"]
+    print(f"{'speedup':>10}: {speedup:>12.2f}x (trusted / validated)")
+
+
+if __name__ == "__main__":
+    main()
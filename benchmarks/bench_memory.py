@@ -0,0 +1,84 @@
+"""Memory held by a hydrated filter result.
+
+    python benchmarks/bench_memory.py [--rows 100000]
+
+Compares keeping FilteredDatabaseRecords next to the instances (the old
+``filter_database_records`` + hydrate flow), regular models, and
+``compact=True`` models. The synthetic query payload is generated while tracing,
+so "retained" includes whatever part of it the result still references.
+"""
+
+import argparse
+import gc
+import os
+import sys
+import tracemalloc
+
+module_path = os.path.join(os.path.dirname(__file__), "..")
+sys.path.append(module_path)
+
+from benchmarks.payloads import (
+    BenchModel,
+    CompactBenchModel,
+    iter_query_responses,
+    make_query_responses,
+)
+from notion_api.domains.databases_domain import FilteredDatabaseRecord
+from notion_api.orm.orm_models import ModelFilter
+
+
+def hydrate_with_records(rows):
+    model_filter = ModelFilter(BenchModel, trusted=False)
+    records = [
+        FilteredDatabaseRecord.from_dict(p)
+        for page in make_query_responses(rows)
+        for p in page["results"]
+    ]
+    return records, [model_filter._create_instance_from_record(r) for r in records]
+
+
+def hydrate_streaming(model_class):
+    def hydrate(rows):
+        model_filter = ModelFilter(model_class)
+        instances = []
+        # ページ単位で処理し、処理済みのレスポンスは解放する (filter と同じ流れ)
+        for page in iter_query_responses(rows):
+            instances.extend(
+                model_filter._create_instance_from_page(p) for p in page["results"]
+            )
+        return instances
+
+    return hydrate
+
+
+def measure(func, rows):
+    gc.collect()
+    tracemalloc.start()
+    result = func(rows)
+    gc.collect()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return retained, peak
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100000)
+    args = parser.parse_args(argv)
+
+    cases = {
+        "records+models": hydrate_with_records,
+        "models": hydrate_streaming(BenchModel),
+        "compact models": hydrate_streaming(CompactBenchModel),
+    }
+    for name, func in cases.items():
+        retained, peak = measure(func, args.rows)
+        print(
+            f"{name:>15}: retained {retained / 2**20:8.1f} MiB "
+            f"({retained / args.rows:6.0f} B/row), peak {peak / 2**20:8.1f} MiB"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+import os
+import random
+import sys
+import uuid
+
+module_path = os.path.join(os.path.dirname(__file__), "..")
+sys.path.append(module_path)
+
+from notion_api.orm import models
+
+SELECT_OPTIONS = ["a", "b", "c"]
+MULTI_SELECT_OPTIONS = ["x", "y", "z"]
+
+
+def _bench_model(name, compact=False):
+    namespace = {
+        "username": models.CharField("Username", max_length=1000, is_required=True),
+        "number": models.IntegerField("Number", is_required=True),
+        "selects": models.SelectField(
+            "Selects",
+            [models.SelectField.option(name, "default") for name in SELECT_OPTIONS],
+            is_required=True,
+        ),
+        "multi_selects": models.MultiSelectField(
+            "MultiSelects",
+            [
+                models.MultiSelectField.option(name, "default")
+                for name in MULTI_SELECT_OPTIONS
+            ],
+        ),
+        "date_field": models.DateField("DateField"),
+        "bool_field": models.BoolField("BoolField"),
+        "table_name": classmethod(lambda cls: "bench_table"),
+    }
+    return type(models.Model)(name, (models.Model,), namespace, compact=compact)
+
+
+BenchModel = _bench_model("BenchModel")
+CompactBenchModel = _bench_model("CompactBenchModel", compact=True)
+
+
+def make_page(i, rng=random):
+    """Build one synthetic page object as returned by ``v1/databases/{id}/query``."""
+    timestamp = f"2024-{1 + i % 12:02d}-{1 + i % 28:02d}T00:00:00.000Z"
+    return {
+        "object": "page",
+        "id": str(uuid.UUID(int=i)),
+        "created_time": timestamp,
+        "last_edited_time": timestamp,
+        "archived": False,
+        "properties": {
+            "Name": {
+                "id": "title",
+                "type": "title",
+                "title": [{"type": "text", "plain_text": f"row {i}"}],
+            },
+            "Username": {
+                "id": "u",
+                "type": "rich_text",
+                "rich_text": [{"type": "text", "plain_text": f"user{i}"}],
+            },
+            "Number": {"id": "n", "type": "number", "number": i},
+            "Selects": {
+                "id": "s",
+                "type": "select",
+                "select": {"name": rng.choice(SELECT_OPTIONS)},
+            },
+            "MultiSelects": {
+                "id": "m",
+                "type": "multi_select",
+                "multi_select": [
+                    {"name": name}
+                    for name in rng.sample(MULTI_SELECT_OPTIONS, rng.randint(0, 3))
+                ],
+            },
+            "DateField": {
+                "id": "d",
+                "type": "date",
+                "date": {"start": timestamp[:10]} if i % 5 else None,
+            },
+            "BoolField": {"id": "b", "type": "checkbox", "checkbox": i % 2 == 0},
+        },
+    }
+
+
+def make_pages(n, seed=0):
+    rng = random.Random(seed)
+    return [make_page(i, rng) for i in range(n)]
+
+
+def iter_query_responses(n, page_size=100, seed=0):
+    """Yield ``n`` synthetic pages as paginated query response bodies, lazily."""
+    rng = random.Random(seed)
+    for start in range(0, n, page_size):
+        end = min(start + page_size, n)
+        yield {
+            "object": "list",
+            "results": [make_page(i, rng) for i in range(start, end)],
+            "has_more": end < n,
+            "next_cursor": str(end) if end < n else None,
+        }
+
+
+def make_query_responses(n, page_size=100, seed=0):
+    return list(iter_query_responses(n, page_size, seed))
+
+
+def make_database_response(i):
+    """Build one ``GET v1/databases/{id}`` response as the API client returns it."""
+    user = {"object": "user", "id": str(uuid.UUID(int=0))}
+    properties = {
+        "Name": {"id": "title", "name": "Name", "type": "title", "title": {}},
+        "Username": {
+            "id": "u",
+            "name": "Username",
+            "type": "rich_text",
+            "rich_text": {},
+        },
+        "Number": {"id": "n", "name": "Number", "type": "number", "number": {}},
+        "Selects": {
+            "id": "s",
+            "name": "Selects",
+            "type": "select",
+            "select": {"options": [{"name": name} for name in SELECT_OPTIONS]},
+        },
+        "MultiSelects": {
+            "id": "m",
+            "name": "MultiSelects",
+            "type": "multi_select",
+            "multi_select": {
+                "options": [{"name": name} for name in MULTI_SELECT_OPTIONS]
+            },
+        },
+        "DateField": {"id": "d", "name": "DateField", "type": "date", "date": {}},
+        "BoolField": {
+            "id": "b",
+            "name": "BoolField",
+            "type": "checkbox",
+            "checkbox": {},
+        },
+    }
+    return {
+        "code": 200,
+        "body": {
+            "object": "database",
+            "id": str(uuid.UUID(int=i)),
+            "cover": None,
+            "icon": None,
+            "created_time": "2024-01-01T00:00:00.000Z",
+            "created_by": user,
+            "last_edited_by": user,
+            "last_edited_time": "2024-01-01T00:00:00.000Z",
+            "title": [
+                {
+                    "type": "text",
+                    "text": {"content": "bench_table", "link": None},
+                    "annotations": {
+                        "bold": False,
+                        "italic": False,
+                        "strikethrough": False,
+                        "underline": False,
+                        "code": False,
+                        "color": "default",
+                    },
+                    "plain_text": "bench_table",
+                    "href": None,
+                }
+            ],
+            "description": [],
+            "is_inline": False,
+            "properties": properties,
+            "parent": {"type": "page_id", "page_id": str(uuid.UUID(int=0))},
+            "url": "",
+            "public_url": None,
+            "archived": False,
+            "in_trash": False,
+            "request_id": str(uuid.UUID(int=i)),
+        },
+    }
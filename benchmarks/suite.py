@@ -0,0 +1,312 @@
+"""Throughput and peak memory of the ORM hot paths, checked against a baseline.
+
+    python benchmarks/suite.py                  # 1k/10k/100k rows vs baseline.json
+    python benchmarks/suite.py --sizes 1000 --cases from_dict model_init
+    python benchmarks/suite.py --save-baseline  # record the current numbers
+
+Each case is timed over ``--repeat`` repetitions (best one wins); a repetition
+loops the case until it takes at least 0.2s, like ``timeit``'s autorange, so
+small sizes are not lost in scheduler noise. Each case is also traced once with
+tracemalloc for its peak allocation. The whole suite runs ``--runs`` times (5 by
+default, at least 3), each in a fresh process because throughput also varies
+between processes. The median throughput is kept, together with the runs'
+spread (their largest deviation from that median). Record and check with the
+same ``--runs`` so both sides have the same noise.
+
+A case fails when even its fastest run is slower than the baseline median by
+more than its tolerance: ``--tolerance`` if given, otherwise twice the spread
+recorded in the baseline, kept between 10% and 25%. A case also fails if its
+peak memory grows by more than ``--memory-tolerance``. Peak memory is
+deterministic, throughput is not: baselines are machine-specific, so record one
+on the machine that runs the check.
+"""
+
+import argparse
+import gc
+import json
+import math
+import multiprocessing
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+module_path = os.path.join(os.path.dirname(__file__), "..")
+sys.path.append(module_path)
+
+from benchmarks.payloads import BenchModel, make_database_response, make_pages
+from notion_api.domains.databases_domain import FilteredDatabaseRecord, NewDatabase
+from notion_api.orm.meta import TITLE_PROPERTY
+from notion_api.orm.orm_models import ModelFilter
+from notion_api.utils.database_record_ops import DatabaseRecord
+
+DEFAULT_SIZES = (1000, 10000, 100000)
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+DATABASE_ID = "00000000-0000-0000-0000-000000000000"
+# スループットの許容幅は記録時のばらつきの SPREAD_FACTOR 倍
+# (ばらつきの大きいベースラインで退行を見逃さないよう MAX_TOLERANCE で抑える)
+SPREAD_FACTOR = 2
+MIN_TOLERANCE = 0.1
+MAX_TOLERANCE = 0.25
+# 小さいケースはこの秒数に達するまで繰り返して 1 回の計測とする
+MIN_TIMING = 0.2
+# 1 回の計測ではばらつきが分からずベースラインとも比べられない
+MIN_RUNS = 3
+DEFAULT_RUNS = 5
+# ばらつきを記録していない古いベースライン向け
+DEFAULT_TOLERANCE = 0.1
+
+
+# ----------------------------------------------------------------
+# cases: setup(rows) -> data (untimed), run(data) (timed)
+# ----------------------------------------------------------------
+
+
+def _setup_pages(rows):
+    return make_pages(rows)
+
+
+def _setup_records(rows):
+    return [FilteredDatabaseRecord.from_dict(p) for p in make_pages(rows)]
+
+
+def _setup_kwargs(rows):
+    model_filter = ModelFilter(BenchModel)
+    return [
+        {
+            name: getattr(instance, name)
+            for name in BenchModel._meta.attrs
+            if getattr(instance, name) is not None
+        }
+        for instance in map(model_filter._create_instance_from_page, make_pages(rows))
+    ]
+
+
+def _setup_instances(rows):
+    return [BenchModel(**kwargs) for kwargs in _setup_kwargs(rows)]
+
+
+def _setup_conditions(rows):
+    # 1 回の filter 呼び出しで組み立てる条件は数個なので、行数分の呼び出しを測る
+    model_filter = ModelFilter(BenchModel)
+    return model_filter, [
+        {
+            "number": {"greater_than": i},
+            "selects": {"equals": "a"},
+            "multi_selects": {"contains": "x"},
+            "date_field": {"on_or_after": "2024-01-01"},
+        }
+        for i in range(rows)
+    ]
+
+
+def _setup_databases(rows):
+    return [make_database_response(i) for i in range(rows)]
+
+
+def _run_from_dict(pages):
+    return [FilteredDatabaseRecord.from_dict(p) for p in pages]
+
+
+def _run_hydrate(records):
+    # Model.filter が使う既定の (信頼済み) 経路
+    model_filter = ModelFilter(BenchModel)
+    return [model_filter._create_instance_from_record(r) for r in records]
+
+
+def _run_hydrate_validated(records):
+    model_filter = ModelFilter(BenchModel, trusted=False)
+    return [model_filter._create_instance_from_record(r) for r in records]
+
+
+def _run_model_init(kwargs_list):
+    return [BenchModel(**kwargs) for kwargs in kwargs_list]
+
+
+def _run_record(instances):
+    fields = [
+        (name, field.record_name, field) for name, field in BenchModel._meta.fields
+    ]
+    payloads = []
+    for instance in instances:
+        record = DatabaseRecord(DATABASE_ID)
+        record.add_property(TITLE_PROPERTY, instance.username, None)
+        for name, record_name, field in fields:
+            record.add_property(record_name, getattr(instance, name), field)
+        payloads.append(record.to_dict())
+    return payloads
+
+
+def _run_filter_build(data):
+    model_filter, conditions = data
+    return [model_filter._build_filter_params(**c) for c in conditions]
+
+
+def _run_new_database(responses):
+    return [NewDatabase(r) for r in responses]
+
+
+CASES = {
+    "from_dict": (_setup_pages, _run_from_dict),
+    "hydrate": (_setup_records, _run_hydrate),
+    "hydrate_validated": (_setup_records, _run_hydrate_validated),
+    "model_init": (_setup_kwargs, _run_model_init),
+    "record": (_setup_instances, _run_record),
+    "filter_build": (_setup_conditions, _run_filter_build),
+    "new_database": (_setup_databases, _run_new_database),
+}
+
+
+# ----------------------------------------------------------------
+# measurement
+# ----------------------------------------------------------------
+
+
+def _time(run, data, number):
+    gc.collect()
+    # timeit と同じく計測中は GC を止めて揺らぎを減らす
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        for _ in range(number):
+            run(data)
+        return (time.perf_counter() - start) / number
+    finally:
+        gc.enable()
+
+
+def measure(case, rows, repeat):
+    setup, run = CASES[case]
+    data = setup(rows)
+    # timeit の autorange と同じく 1 回の計測が MIN_TIMING 秒以上になるまで繰り返す
+    elapsed = _time(run, data, 1)
+    number = max(1, math.ceil(MIN_TIMING / max(elapsed, 1e-9)))
+    best = min(_time(run, data, number) for _ in range(repeat))
+
+    gc.collect()
+    tracemalloc.start()
+    result = run(data)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del result
+    return {"rows_per_sec": rows / best, "peak_bytes": peak}
+
+
+def _run_once(cases, sizes, repeat):
+    return {
+        f"{case}/{rows}": measure(case, rows, repeat)
+        for case in cases
+        for rows in sizes
+    }
+
+
+def run_suite(cases, sizes, repeat, runs=DEFAULT_RUNS):
+    """Median throughput over ``runs`` runs, with its largest relative deviation."""
+    # 速度はプロセスごとに揺らぐので、実行ごとに新しいプロセスで計測してばらつきに含める
+    context = multiprocessing.get_context("spawn")
+    samples = {}
+    for _ in range(runs):
+        with context.Pool(1) as pool:
+            measurements = pool.apply(_run_once, (cases, sizes, repeat))
+        for key, measurement in measurements.items():
+            samples.setdefault(key, []).append(measurement)
+    results = {}
+    for key, measurements in samples.items():
+        throughputs = [m["rows_per_sec"] for m in measurements]
+        median = statistics.median(throughputs)
+        results[key] = {
+            "rows_per_sec": median,
+            "best_rows_per_sec": max(throughputs),
+            "peak_bytes": max(m["peak_bytes"] for m in measurements),
+            "spread": max(abs(t - median) for t in throughputs) / median,
+        }
+    return results
+
+
+def compare(results, baseline, tolerance=None, memory_tolerance=0.1):
+    """Return one message per metric that regressed beyond its tolerance.
+
+    ``tolerance=None`` derives each case's tolerance from the spread recorded
+    in the baseline.
+    """
+    regressions = []
+    for key, current in sorted(results.items()):
+        expected = baseline.get(key)
+        if expected is None:
+            continue
+        allowed = tolerance
+        if allowed is None:
+            spread = expected.get("spread")
+            allowed = (
+                DEFAULT_TOLERANCE
+                if spread is None
+                else min(MAX_TOLERANCE, max(MIN_TOLERANCE, SPREAD_FACTOR * spread))
+            )
+        # 計測の揺らぎは遅くなる方にしか出ないので今回の最速の回で比べる
+        best = current.get("best_rows_per_sec", current["rows_per_sec"])
+        floor = expected["rows_per_sec"] * (1 - allowed)
+        if best < floor:
+            regressions.append(
+                f"{key}: {best:,.0f} rows/sec, "
+                f"baseline {expected['rows_per_sec']:,.0f} "
+                f"(tolerance {allowed:.0%})"
+            )
+        ceiling = expected["peak_bytes"] * (1 + memory_tolerance)
+        if current["peak_bytes"] > ceiling:
+            regressions.append(
+                f"{key}: peak {current['peak_bytes'] / 2**20:.1f} MiB, "
+                f"baseline {expected['peak_bytes'] / 2**20:.1f} MiB"
+            )
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--cases", nargs="+", choices=sorted(CASES), default=CASES)
+    parser.add_argument("--sizes", nargs="+", type=int, default=DEFAULT_SIZES)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS)
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--tolerance", type=float, default=None)
+    parser.add_argument("--memory-tolerance", type=float, default=0.1)
+    parser.add_argument("--save-baseline", action="store_true")
+    args = parser.parse_args(argv)
+    if args.runs < MIN_RUNS:
+        parser.error(f"--runs must be at least {MIN_RUNS}")
+
+    results = run_suite(args.cases, args.sizes, args.repeat, args.runs)
+    for key, r in results.items():
+        print(
+            f"{key:>24}: {r['rows_per_sec']:>12,.0f} rows/sec "
+            f"(±{r['spread']:.0%}), peak {r['peak_bytes'] / 2**20:8.1f} MiB"
+        )
+
+    if args.save_baseline:
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline) as f:
+                baseline = json.load(f)
+        baseline.update(results)
+        with open(args.baseline, "w") as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"Saved baseline to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --save-baseline first")
+        return 0
+    with open(args.baseline) as f:
+        regressions = compare(
+            results, json.load(f), args.tolerance, args.memory_tolerance
+        )
+    for message in regressions:
+        print(f"REGRESSION {message}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
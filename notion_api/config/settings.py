@@ -1,5 +1,34 @@
 import os
 
 API_BASE_URL = "https://api.notion.com/"
-TIMEOUT = 30  # 秒
+TIMEOUT = 30  # 秒 (読み取りタイムアウトの既定値)
+CONNECT_TIMEOUT = float(os.getenv("NOTION_CONNECT_TIMEOUT", 10))  # 秒
+READ_TIMEOUT = float(os.getenv("NOTION_READ_TIMEOUT", TIMEOUT))  # 秒
+
+# requests のコネクションプール (pool_maxsize はホストごとの保持接続数)
+POOL_CONNECTIONS = int(os.getenv("NOTION_POOL_CONNECTIONS", 10))
+POOL_MAXSIZE = int(os.getenv("NOTION_POOL_MAXSIZE", 32))
+# "shared": 全スレッドで 1 つのセッション / "per_thread": スレッドごとのセッション
+SESSION_MODE = os.getenv("NOTION_SESSION_MODE", "shared")
 API_KEY = os.getenv("NOTION_API_KEY")
+
+# クライアント側のレート制限 (Notion API の平均上限は 3 リクエスト/秒)
+RATE_LIMIT_PER_SECOND = float(os.getenv("NOTION_RATE_LIMIT_PER_SECOND", 3))
+RATE_LIMIT_BURST = int(os.getenv("NOTION_RATE_LIMIT_BURST", 3))
+
+# 429 / 5xx のリトライ設定
+MAX_RETRIES = int(os.getenv("NOTION_MAX_RETRIES", 5))
+RETRY_BACKOFF_BASE = 0.5  # 秒
+RETRY_BACKOFF_MAX = 30  # 秒
+
+# get_notion_databases のスキーマキャッシュ (TTL を 0 にすると無効)
+SCHEMA_CACHE_TTL = float(os.getenv("NOTION_SCHEMA_CACHE_TTL", 300))  # 秒
+SCHEMA_CACHE_MAX_ENTRIES = 256
+
+# Model.filter の結果キャッシュ (モデルごとに cache_ttl を設定すると有効)
+QUERY_CACHE_MAX_BYTES = int(os.getenv("NOTION_QUERY_CACHE_MAX_BYTES", 64 * 2**20))
+
+# LocalReplica の全件照合 (アーカイブされたページの検出) を行う間隔
+REPLICA_RECONCILE_INTERVAL = float(
+    os.getenv("NOTION_REPLICA_RECONCILE_INTERVAL", 3600)
+)  # 秒
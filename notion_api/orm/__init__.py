@@ -1,4 +1,9 @@
 from .orm_models import Model
+from .queryset import Q, QuerySet
+from .bulk import BulkResult
+from .replica import LocalReplica
+from .indexes import IndexedTable
+from .migrations import MigrationPlan, MigrationResult, migrate_models
 from .fields import (
     CharField,
     IntegerField,
@@ -11,6 +16,7 @@ from .fields import (
 
 class models:
     Model = Model
+    Q = Q
     CharField = CharField
     IntegerField = IntegerField
     SelectField = SelectField
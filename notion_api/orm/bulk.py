@@ -0,0 +1,45 @@
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, List, Optional
+
+DEFAULT_CONCURRENCY = 4
+
+
+@dataclass
+class BulkResult:
+    index: int
+    page_id: Optional[str] = None
+    response: Optional[dict] = None
+    error: Optional[BaseException] = None
+
+    @property
+    def ok(self):
+        return self.error is None
+
+
+def run_bulk(
+    operation: Callable[[Any], dict],
+    items: Iterable[Any],
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> List[BulkResult]:
+    """Run ``operation`` over ``items`` on a bounded thread pool.
+
+    A failing item is recorded in its ``BulkResult`` instead of aborting the rest of
+    the batch. Results are returned in input order.
+    """
+    if concurrency < 1:
+        raise ValueError("Concurrency must be 1 or greater")
+
+    def run(index, item):
+        try:
+            response = operation(item)
+        except Exception as e:
+            return BulkResult(index=index, error=e)
+        return BulkResult(index=index, page_id=response.get("id"), response=response)
+
+    items = list(items)
+    if not items:
+        return []
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(items))) as executor:
+        futures = [executor.submit(run, i, item) for i, item in enumerate(items)]
+        return [future.result() for future in futures]
@@ -15,6 +15,14 @@ class BaseField:
     def run(self, value):
         pass
 
+    def serialize(self, value):
+        """Python 値を Notion のプロパティ値に変換する"""
+        raise ValueError(f"Unsupported field type: {type(self)}")
+
+    def deserialize(self, prop):
+        """Notion のプロパティ値を Python 値に変換する"""
+        raise ValueError(f"Unsupported field type: {type(self)}")
+
 
 class CharField(BaseField):
     def __init__(self, record_name, max_length=1000, is_required=False):
@@ -30,6 +38,14 @@ class CharField(BaseField):
             raise ValueError(f"Length of {self.record_name} is too long")
         return value
 
+    def serialize(self, value):
+        if value is None:
+            return {"rich_text": []}
+        return {"rich_text": [{"text": {"content": value}}]}
+
+    def deserialize(self, prop):
+        return prop["rich_text"][0]["plain_text"] if prop["rich_text"] else None
+
 
 class SelectField(BaseField):
     def __init__(self, record_name, options, is_required=False):
@@ -70,6 +86,14 @@ class SelectField(BaseField):
             raise ValueError(f"{self.record_name} must be one of {self.options}")
         return value
 
+    def serialize(self, value):
+        if value is None:
+            return {"select": None}
+        return {"select": {"name": value}}
+
+    def deserialize(self, prop):
+        return prop["select"]["name"] if prop["select"] else None
+
 
 class IntegerField(BaseField):
     def __init__(self, record_name, is_required=False):
@@ -82,6 +106,12 @@ class IntegerField(BaseField):
             raise ValueError(f"{self.record_name} must be an integer")
         return value
 
+    def serialize(self, value):
+        return {"number": value}
+
+    def deserialize(self, prop):
+        return prop["number"]
+
 
 class MultiSelectField(BaseField):
     def __init__(self, record_name, options, is_required=False):
@@ -128,6 +158,12 @@ class MultiSelectField(BaseField):
             )
         return value
 
+    def serialize(self, value):
+        return {"multi_select": [{"name": item} for item in value or []]}
+
+    def deserialize(self, prop):
+        return [option["name"] for option in prop["multi_select"]]
+
 
 class DateField(BaseField):
     def __init__(self, record_name, is_required=False):
@@ -151,6 +187,14 @@ class DateField(BaseField):
                 f"{self.record_name} must be a string in YYYY-MM-DD format or a datetime object"
             )
 
+    def serialize(self, value):
+        if value is None:
+            return {"date": None}
+        return {"date": {"start": value}}
+
+    def deserialize(self, prop):
+        return prop["date"]["start"] if prop["date"] else None
+
 
 class BoolField(BaseField):
     def __init__(self, record_name, is_required=False):
@@ -162,3 +206,9 @@ class BoolField(BaseField):
         if not isinstance(value, bool):
             raise ValueError(f"{self.record_name} must be a boolean")
         return value
+
+    def serialize(self, value):
+        return {"checkbox": bool(value)}
+
+    def deserialize(self, prop):
+        return prop["checkbox"]
@@ -0,0 +1,211 @@
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List
+
+from .fields import (
+    CharField,
+    IntegerField,
+    SelectField,
+    MultiSelectField,
+    DateField,
+    BoolField,
+)
+from .meta import TITLE_PROPERTY
+
+try:
+    import numpy as np
+except ImportError:  # numpy は _as_frame を使う場合のみ必要
+    np = None
+
+
+@dataclass
+class CategoricalColumn:
+    """Dictionary-encoded column: ``categories[codes[i]]``, code -1 for empty."""
+
+    codes: Any
+    categories: List[str]
+
+    def __len__(self):
+        return len(self.codes)
+
+    def to_list(self):
+        return [self.categories[c] if c >= 0 else None for c in self.codes.tolist()]
+
+
+@dataclass
+class MultiCategoricalColumn:
+    """Row ``i`` holds ``categories[c]`` for ``c in codes[offsets[i]:offsets[i + 1]]``."""
+
+    offsets: Any
+    codes: Any
+    categories: List[str]
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def row(self, i):
+        start, end = self.offsets[i], self.offsets[i + 1]
+        return [self.categories[c] for c in self.codes[start:end].tolist()]
+
+    def to_list(self):
+        return [self.row(i) for i in range(len(self))]
+
+
+class ModelFrame:
+    """Columnar query result: one array-like column per model field."""
+
+    def __init__(self, model_class, page_ids, columns):
+        self.model_class = model_class
+        self.page_ids = page_ids
+        self.columns = columns
+
+    def __len__(self):
+        return len(self.page_ids)
+
+    def __getitem__(self, field_name):
+        return self.columns[field_name]
+
+    def __repr__(self):
+        return (
+            f"<ModelFrame {self.model_class.__name__}: {len(self)} rows, "
+            f"columns={list(self.columns)}>"
+        )
+
+    @classmethod
+    def from_pages(cls, model_class, pages: Iterable[Dict[str, Any]]):
+        if np is None:
+            raise ImportError(
+                "_as_frame requires numpy. Install it with `pip install numpy`."
+            )
+        builders = [
+            (record_name, _column_builder(model_class._meta.by_attr[attr], decode))
+            for attr, record_name, decode in model_class._meta.deserializers
+        ]
+        page_ids = []
+        for page in pages:
+            page_ids.append(page["id"])
+            properties = page["properties"]
+            for record_name, builder in builders:
+                builder.append(properties.get(record_name))
+        columns = {
+            attr: builder.finish()
+            for (attr, _, _), (_, builder) in zip(
+                model_class._meta.deserializers, builders
+            )
+        }
+        return cls(model_class, page_ids, columns)
+
+
+def _column_builder(field, decode):
+    if field.record_name == TITLE_PROPERTY or isinstance(field, CharField):
+        return _ObjectColumnBuilder(decode)
+    elif isinstance(field, IntegerField):
+        return _NumberColumnBuilder()
+    elif isinstance(field, BoolField):
+        return _BoolColumnBuilder()
+    elif isinstance(field, DateField):
+        return _DateColumnBuilder()
+    elif isinstance(field, SelectField):
+        return _CategoryColumnBuilder(field.options)
+    elif isinstance(field, MultiSelectField):
+        return _MultiCategoryColumnBuilder(field.options)
+    else:
+        raise ValueError(f"Unsupported field type: {type(field)}")
+
+
+class _ObjectColumnBuilder:
+    def __init__(self, decode):
+        self.decode = decode
+        self.values = []
+
+    def append(self, prop):
+        self.values.append(None if prop is None else self.decode(prop))
+
+    def finish(self):
+        column = np.empty(len(self.values), dtype=object)
+        column[:] = self.values
+        return column
+
+
+class _NumberColumnBuilder:
+    """int64 (float64 for fractional numbers), or float64 with NaN when any cell is empty."""
+
+    def __init__(self):
+        self.values = []
+        self.has_empty = False
+
+    def append(self, prop):
+        value = None if prop is None else prop["number"]
+        if value is None:
+            self.has_empty = True
+            value = np.nan
+        self.values.append(value)
+
+    def finish(self):
+        if self.has_empty:
+            return np.array(self.values, dtype=np.float64)
+        return np.array(self.values)
+
+
+class _BoolColumnBuilder:
+    def __init__(self):
+        self.values = []
+
+    def append(self, prop):
+        self.values.append(False if prop is None else bool(prop["checkbox"]))
+
+    def finish(self):
+        return np.array(self.values, dtype=bool)
+
+
+class _DateColumnBuilder:
+    """datetime64[D] of the start date, NaT for empty cells."""
+
+    def __init__(self):
+        self.values = []
+
+    def append(self, prop):
+        date = None if prop is None else prop["date"]
+        self.values.append(date["start"][:10] if date else "NaT")
+
+    def finish(self):
+        return np.array(self.values, dtype="datetime64[D]")
+
+
+class _CategoryColumnBuilder:
+    def __init__(self, options):
+        self.categories = [option["name"] for option in options]
+        self.index = {name: i for i, name in enumerate(self.categories)}
+        self.codes = []
+
+    def code(self, name):
+        code = self.index.get(name)
+        if code is None:
+            # スキーマ外のオプション (Notion 側で追加されたもの)
+            code = self.index[name] = len(self.categories)
+            self.categories.append(name)
+        return code
+
+    def append(self, prop):
+        select = None if prop is None else prop["select"]
+        self.codes.append(self.code(select["name"]) if select else -1)
+
+    def finish(self):
+        return CategoricalColumn(np.array(self.codes, dtype=np.int32), self.categories)
+
+
+class _MultiCategoryColumnBuilder(_CategoryColumnBuilder):
+    def __init__(self, options):
+        super().__init__(options)
+        self.offsets = [0]
+
+    def append(self, prop):
+        if prop is not None:
+            self.codes.extend(self.code(o["name"]) for o in prop["multi_select"])
+        self.offsets.append(len(self.codes))
+
+    def finish(self):
+        return MultiCategoricalColumn(
+            np.array(self.offsets, dtype=np.int64),
+            np.array(self.codes, dtype=np.int32),
+            self.categories,
+        )
@@ -0,0 +1,249 @@
+import threading
+import weakref
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+
+from .fields import (
+    IntegerField,
+    SelectField,
+    MultiSelectField,
+    DateField,
+    BoolField,
+)
+from notion_api.utils.filter_evaluator import compile_filter
+
+# database id (ハイフンなし) -> そのデータベースを保持している IndexedTable
+_tables = defaultdict(weakref.WeakSet)
+_tables_lock = threading.Lock()
+
+
+def tables_for(database_id):
+    with _tables_lock:
+        return list(_tables.get(database_id.replace("-", ""), ()))
+
+
+class HashIndex:
+    """value -> page ids, for select, multi_select and checkbox properties."""
+
+    def __init__(self, extract):
+        self.extract = extract
+        self.buckets = defaultdict(set)
+
+    def add(self, page_id, prop):
+        for value in self.extract(prop):
+            self.buckets[value].add(page_id)
+
+    def discard(self, page_id, prop):
+        for value in self.extract(prop):
+            bucket = self.buckets.get(value)
+            if bucket is not None:
+                bucket.discard(page_id)
+                if not bucket:
+                    del self.buckets[value]
+
+    def lookup(self, name, value):
+        if name in ("equals", "contains"):
+            return set(self.buckets.get(value, ()))
+        if name == "is_empty":
+            return set(self.buckets.get(None, ()))
+        return None
+
+
+class SortedIndex:
+    """Values kept sorted alongside their page ids, for number and date properties.
+
+    Empty cells are not stored, so only the range conditions are answered here.
+    """
+
+    def __init__(self, extract):
+        self.extract = extract
+        self.keys = []
+        self.page_ids = []
+
+    def add(self, page_id, prop):
+        value = self.extract(prop)
+        if value is not None:
+            i = bisect_right(self.keys, value)
+            self.keys.insert(i, value)
+            self.page_ids.insert(i, page_id)
+
+    def discard(self, page_id, prop):
+        value = self.extract(prop)
+        if value is None:
+            return
+        i = bisect_left(self.keys, value)
+        end = bisect_right(self.keys, value)
+        for j in range(i, end):
+            if self.page_ids[j] == page_id:
+                del self.keys[j]
+                del self.page_ids[j]
+                return
+
+    def lookup(self, name, value):
+        if isinstance(value, bool) or not isinstance(value, (int, float, str)):
+            return None
+        try:
+            start, end = self._range(name, value)
+        except TypeError:
+            # 数値の列に文字列で問い合わせた場合など
+            return None
+        return set(self.page_ids[start:end])
+
+    def _range(self, name, value):
+        if name == "equals":
+            start, end = bisect_left(self.keys, value), bisect_right(self.keys, value)
+        elif name in ("greater_than", "after"):
+            start, end = bisect_right(self.keys, value), len(self.keys)
+        elif name in ("greater_than_or_equal_to", "on_or_after"):
+            start, end = bisect_left(self.keys, value), len(self.keys)
+        elif name in ("less_than", "before"):
+            start, end = 0, bisect_left(self.keys, value)
+        elif name in ("less_than_or_equal_to", "on_or_before"):
+            start, end = 0, bisect_right(self.keys, value)
+        else:
+            raise TypeError(f"Unsupported range condition: {name}")
+        return start, end
+
+
+class DateIndex(SortedIndex):
+    # 日付部分だけを保持するので、日付のみ (YYYY-MM-DD) の条件だけを索引で答える
+    def lookup(self, name, value):
+        if not isinstance(value, str) or len(value) != 10:
+            return None
+        return super().lookup(name, value)
+
+
+def _select_values(prop):
+    select = prop.get("select")
+    return [select["name"] if select else None]
+
+
+def _multi_select_values(prop):
+    # 空のセルは None のバケットに入れて is_empty に答えられるようにする
+    return [option["name"] for option in prop.get("multi_select") or ()] or [None]
+
+
+def _checkbox_values(prop):
+    return [bool(prop.get("checkbox"))]
+
+
+def _number_value(prop):
+    return prop.get("number")
+
+
+def _date_value(prop):
+    date = prop.get("date")
+    return date["start"][:10] if date else None
+
+
+def build_index(field):
+    if isinstance(field, SelectField):
+        return "select", HashIndex(_select_values)
+    elif isinstance(field, MultiSelectField):
+        return "multi_select", HashIndex(_multi_select_values)
+    elif isinstance(field, BoolField):
+        return "checkbox", HashIndex(_checkbox_values)
+    elif isinstance(field, IntegerField):
+        return "number", SortedIndex(_number_value)
+    elif isinstance(field, DateField):
+        return "date", DateIndex(_date_value)
+    return None
+
+
+class IndexedTable:
+    """In-memory copy of a database's pages with secondary indexes per model field.
+
+    Indexes are built from the model's select, multi-select, checkbox, number and
+    date fields. Writes made through the ORM to the same database are applied to
+    every live table, so results stay current without reloading. It can be passed
+    to ``Model.filter(..., _replica=table)``.
+    """
+
+    def __init__(self, model_class, database_id, pages=()):
+        self.model_class = model_class
+        self.database_id = database_id
+        self.pages = {}
+        # record_name -> (filter_type, index)
+        self.indexes = {}
+        for attr, field in model_class._meta.fields:
+            index = build_index(field)
+            if index is not None:
+                self.indexes[field.record_name] = index
+        self._lock = threading.RLock()
+        for page in pages:
+            self.upsert(page)
+        with _tables_lock:
+            _tables[database_id.replace("-", "")].add(self)
+
+    @classmethod
+    def load(cls, model_class, database_id):
+        from notion_api.services.v1.databases import DataBaseService
+
+        return cls(
+            model_class, database_id, DataBaseService().iter_query_results(database_id)
+        )
+
+    def __len__(self):
+        return len(self.pages)
+
+    def upsert(self, page):
+        with self._lock:
+            self.remove(page["id"])
+            self.pages[page["id"]] = page
+            properties = page["properties"]
+            for record_name, (_, index) in self.indexes.items():
+                # プロパティが無いページも空のセルとして索引に入れる
+                index.add(page["id"], properties.get(record_name) or {})
+
+    def remove(self, page_id):
+        with self._lock:
+            page = self.pages.pop(page_id, None)
+            if page is None:
+                return
+            properties = page["properties"]
+            for record_name, (_, index) in self.indexes.items():
+                index.discard(page_id, properties.get(record_name) or {})
+
+    def apply(self, page):
+        """Apply a page object returned by a create, update or archive request."""
+        if page.get("archived") or page.get("in_trash"):
+            self.remove(page["id"])
+        elif "properties" in page:
+            self.upsert(page)
+
+    def query(self, filter_params=None):
+        filter_ = (filter_params or {}).get("filter")
+        predicate = compile_filter(filter_)
+        with self._lock:
+            candidates = self._candidates(filter_)
+            if candidates is None:
+                pages = list(self.pages.values())
+            else:
+                pages = [self.pages[page_id] for page_id in candidates]
+        # 索引は候補の絞り込みにだけ使い、最終判定は評価器で行う
+        return [page for page in pages if predicate(page)]
+
+    def _candidates(self, filter_):
+        """Page ids that may match ``filter_``, or ``None`` when no index applies."""
+        if filter_ is None:
+            return None
+        if "and" in filter_:
+            sets = [self._candidates(f) for f in filter_["and"]]
+            sets = sorted((s for s in sets if s is not None), key=len)
+            if not sets:
+                return None
+            return set.intersection(*sets)
+        if "or" in filter_:
+            sets = [self._candidates(f) for f in filter_["or"]]
+            if not sets or any(s is None for s in sets):
+                return None
+            return set().union(*sets)
+        entry = self.indexes.get(filter_.get("property"))
+        if entry is None:
+            return None
+        filter_type, index = entry
+        condition = filter_.get(filter_type)
+        if not isinstance(condition, dict) or len(condition) != 1:
+            return None
+        name, value = next(iter(condition.items()))
+        return index.lookup(name, value)
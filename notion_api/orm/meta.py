@@ -0,0 +1,120 @@
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Callable, Mapping, Optional, Tuple
+
+from .fields import BaseField
+
+TITLE_PROPERTY = "Name"
+
+
+def serialize_title(value):
+    return {"title": [{"text": {"content": value}}]}
+
+
+def deserialize_title(prop):
+    return prop["title"][0]["plain_text"] if prop["title"] else None
+
+
+@dataclass(frozen=True)
+class FieldTable:
+    """Immutable per-model field metadata, built once when the class is created."""
+
+    fields: Tuple[Tuple[str, BaseField], ...]
+    attrs: Tuple[str, ...]
+    by_attr: Mapping[str, BaseField]
+    record_to_attr: Mapping[str, str]
+    attr_to_record: Mapping[str, str]
+    required: Tuple[str, ...]
+    serializers: Tuple[Tuple[str, str, Callable], ...]
+    # 検証付きの復元と信頼済みの復元 (Model._from_notion, ModelFrame) で共用する
+    deserializers: Tuple[Tuple[str, str, Callable], ...]
+    title_attr: Optional[str] = None
+    compact: bool = False
+
+    @classmethod
+    def build(cls, fields, compact=False):
+        fields = tuple(fields)
+        by_attr = {attr: field for attr, field in fields}
+        record_to_attr = {field.record_name: attr for attr, field in fields}
+        return cls(
+            fields=fields,
+            attrs=tuple(by_attr),
+            by_attr=MappingProxyType(by_attr),
+            record_to_attr=MappingProxyType(record_to_attr),
+            attr_to_record=MappingProxyType(
+                {attr: field.record_name for attr, field in fields}
+            ),
+            required=tuple(attr for attr, field in fields if field.is_required),
+            serializers=tuple(
+                (
+                    attr,
+                    field.record_name,
+                    (
+                        serialize_title
+                        if field.record_name == TITLE_PROPERTY
+                        else field.serialize
+                    ),
+                )
+                for attr, field in fields
+            ),
+            deserializers=tuple(
+                (
+                    attr,
+                    field.record_name,
+                    (
+                        deserialize_title
+                        if field.record_name == TITLE_PROPERTY
+                        else field.deserialize
+                    ),
+                )
+                for attr, field in fields
+            ),
+            title_attr=record_to_attr.get(TITLE_PROPERTY),
+            compact=compact,
+        )
+
+
+class ModelMeta(type):
+    """Collects the ``BaseField`` attributes of a model class into ``_meta``.
+
+    ``class M(Model, compact=True)`` additionally gives the class generated
+    ``__slots__`` for its fields, so instances carry no ``__dict__``. The field
+    definitions then live only in ``M._meta``; ``M.<field>`` is the slot descriptor.
+    """
+
+    def __new__(mcs, name, bases, namespace, compact=False, **kwargs):
+        fields = {}
+        for base in reversed(bases):
+            for attr, field in getattr(base, "_meta", EMPTY_TABLE).fields:
+                fields[attr] = field
+        for attr, value in namespace.items():
+            if isinstance(value, BaseField):
+                fields[attr] = value
+
+        if compact:
+            namespace = dict(namespace)
+            slotted = set()
+            for base in bases:
+                for klass in base.__mro__:
+                    slotted.update(getattr(klass, "__slots__", ()))
+            for attr in fields:
+                namespace.pop(attr, None)
+            namespace["__slots__"] = tuple(
+                attr for attr in (*fields, *INSTANCE_SLOTS) if attr not in slotted
+            )
+
+        cls = super().__new__(mcs, name, bases, namespace, **kwargs)
+        cls._meta = FieldTable.build(fields.items(), compact=compact)
+        # 旧来のインスタンス属性名を互換のためクラス属性として残す
+        cls._field_mapping = cls._meta.record_to_attr
+        cls._reverse_mapping = cls._meta.attr_to_record
+        return cls
+
+    def __init__(cls, name, bases, namespace, compact=False, **kwargs):
+        super().__init__(name, bases, namespace, **kwargs)
+
+
+# フィールド以外にインスタンスが持つ属性
+INSTANCE_SLOTS = ("page_id", "_snapshot")
+
+EMPTY_TABLE = FieldTable.build(())
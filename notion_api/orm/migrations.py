@@ -0,0 +1,198 @@
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from .meta import TITLE_PROPERTY
+
+
+@dataclass
+class MigrationPlan:
+    """The smallest ``PATCH v1/databases/{id}`` that brings a database up to a model.
+
+    ``properties`` is the request body's ``properties`` object; ``operations`` and
+    ``conflicts`` describe it for humans. Properties that exist only in Notion are
+    never removed, and type changes are reported as conflicts instead of applied.
+    """
+
+    database_id: str
+    properties: Dict[str, Any] = field(default_factory=dict)
+    operations: List[str] = field(default_factory=list)
+    conflicts: List[str] = field(default_factory=list)
+
+    @property
+    def has_changes(self):
+        return bool(self.properties)
+
+    def format(self):
+        lines = [f"Database {self.database_id}:"]
+        lines += [f"  {operation}" for operation in self.operations]
+        lines += [f"  ! {conflict}" for conflict in self.conflicts]
+        if not self.operations and not self.conflicts:
+            lines.append("  no changes")
+        return "\n".join(lines)
+
+    def __str__(self):
+        return self.format()
+
+
+def desired_properties(model_class):
+    """Database properties as ``create_notion_database`` expects them for ``model_class``."""
+    properties = {TITLE_PROPERTY: {"title": {}}}
+    for field_name, model_field in model_class._meta.fields:
+        if model_field.record_name != TITLE_PROPERTY:
+            properties[model_field.record_name] = model_class.choose_field(model_field)
+    return properties
+
+
+def fetch_schema(database_id):
+    """Fetch and parse the current schema, bypassing the schema cache.
+
+    A cached schema can be up to ``NOTION_SCHEMA_CACHE_TTL`` seconds old, which
+    is too stale to diff a migration against.
+    """
+    from notion_api.services.v1.databases import DataBaseService
+
+    d = DataBaseService()
+    d.invalidate_schema(database_id)
+    return d.get_notion_databases(database_id)
+
+
+def plan_migration(model_class, database, renames=None):
+    """Diff ``model_class`` against a fetched ``Database`` and return a ``MigrationPlan``.
+
+    ``renames`` maps current Notion property names to the model's record names.
+    """
+    renames = dict(renames or {})
+    plan = MigrationPlan(database.id)
+    existing = dict(database.properties)
+
+    # データベースには必ずタイトルプロパティが 1 つあるので名前だけ合わせる
+    title_name = next(
+        (name for name, prop in existing.items() if prop.type == "title"), None
+    )
+    if title_name not in (None, TITLE_PROPERTY) and TITLE_PROPERTY not in existing:
+        renames.setdefault(title_name, TITLE_PROPERTY)
+
+    for old_name, new_name in renames.items():
+        if old_name not in existing:
+            if new_name not in existing:
+                plan.conflicts.append(
+                    f"cannot rename {old_name!r}: no such property in Notion"
+                )
+            continue
+        if new_name in existing:
+            plan.conflicts.append(
+                f"cannot rename {old_name!r} to {new_name!r}: {new_name!r} exists"
+            )
+            continue
+        existing[new_name] = existing.pop(old_name)
+        plan.properties[old_name] = {"name": new_name}
+        plan.operations.append(f"rename {old_name!r} -> {new_name!r}")
+
+    renamed_from = {
+        body["name"]: old_name
+        for old_name, body in plan.properties.items()
+        if "name" in body
+    }
+    for name, desired in desired_properties(model_class).items():
+        desired_type, config = next(iter(desired.items()))
+        prop = existing.get(name)
+        key = renamed_from.get(name, name)
+        if prop is None:
+            plan.properties[name] = desired
+            plan.operations.append(f"add {name!r} ({desired_type})")
+        elif prop.type != desired_type:
+            plan.conflicts.append(
+                f"{name!r} is {prop.type} in Notion but {desired_type} in the model"
+            )
+        elif desired_type in ("select", "multi_select"):
+            current = getattr(prop, desired_type) or {}
+            current_names = [o["name"] for o in current.get("options", [])]
+            missing = [
+                option
+                for option in config["options"]
+                if option["name"] not in current_names
+            ]
+            if missing:
+                # 既存のオプションも渡さないと削除される
+                options = [{"name": n} for n in current_names] + missing
+                plan.properties.setdefault(key, {})[desired_type] = {"options": options}
+                plan.operations.append(
+                    f"add options to {name!r}: "
+                    + ", ".join(option["name"] for option in missing)
+                )
+    return plan
+
+
+def apply_migration(plan, force=False):
+    """Send ``plan`` as one PATCH request; refuses plans with conflicts unless ``force``."""
+    from notion_api.services.v1.databases import DataBaseService
+
+    if plan.conflicts and not force:
+        raise ValueError(f"Migration has conflicts:\n{plan.format()}")
+    if not plan.has_changes:
+        return None
+    from .orm_models import ModelFilter
+
+    response = DataBaseService().update_notion_database(
+        plan.database_id, plan.properties
+    )
+    # リネーム後はキャッシュ済みのページのプロパティ名が古くなる
+    ModelFilter.query_cache.invalidate_database(plan.database_id)
+    return response
+
+
+@dataclass
+class MigrationResult:
+    """One target of ``migrate_models``: its plan and the PATCH response, if sent."""
+
+    model_class: type
+    database_id: str
+    plan: MigrationPlan
+    response: Optional[dict] = None
+
+
+def migrate_models(targets, dry_run=False, force=False, concurrency=None, renames=None):
+    """Migrate several ``(model_class, database_id)`` pairs.
+
+    Schemas are fetched concurrently (one thread per target unless
+    ``concurrency`` is given), then the changed databases are patched the same
+    way. Every request still goes through the shared rate limiter, so many
+    models take several rounds rather than a single round-trip.
+    ``renames`` maps a model class to its renames. Returns one
+    ``MigrationResult`` per target, in order.
+    """
+    targets = list(targets)
+    if not targets:
+        return []
+    renames = renames or {}
+    workers = min(concurrency or len(targets), len(targets))
+
+    def plan_target(target):
+        model_class, database_id = target
+        database = fetch_schema(database_id)
+        return MigrationResult(
+            model_class,
+            database_id,
+            plan_migration(model_class, database, renames.get(model_class)),
+        )
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # 最初に失敗したスキーマ取得の例外がそのまま送出される
+        results = list(executor.map(plan_target, targets))
+        if dry_run:
+            return results
+
+        conflicting = [r.plan for r in results if r.plan.conflicts]
+        if conflicting and not force:
+            raise ValueError(
+                "Migration has conflicts:\n"
+                + "\n".join(plan.format() for plan in conflicting)
+            )
+        changed = [r for r in results if r.plan.has_changes]
+        responses = executor.map(
+            lambda r: apply_migration(r.plan, force=force), changed
+        )
+        for result, response in zip(changed, responses):
+            result.response = response
+    return results
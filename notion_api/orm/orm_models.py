@@ -8,7 +8,23 @@ from .fields import (
     DateField,
     BoolField,
 )
+from .bulk import DEFAULT_CONCURRENCY, run_bulk
+from .meta import ModelMeta, TITLE_PROPERTY
+from .frames import ModelFrame
+from .migrations import (
+    MigrationPlan,
+    apply_migration,
+    desired_properties,
+    fetch_schema,
+    plan_migration,
+)
+from .indexes import tables_for
+from .queryset import QuerySetDescriptor
 from notion_api.domains.databases_domain import DatabaseTitle
+from notion_api.utils.cache import QueryCache, filter_cache_key
+from notion_api.utils.filter_evaluator import filter_pages, sort_pages
+from notion_api.utils.filter_tree import combine, simplify, split_filter
+from notion_api.utils.partition import DEFAULT_PARTITIONS, TIMESTAMP_PARTITIONS
 from notion_api.utils.databases_filter_builders import (
     FilterComposer,
     NumberFilterBuilder,
@@ -20,33 +36,352 @@ from notion_api.utils.databases_filter_builders import (
 )
 
 
+# order_by で使えるフィールド以外の並べ替えキー
+TIMESTAMP_SORTS = ("created_time", "last_edited_time")
+
+
 class ModelFilter:
-    def __init__(self, model_class):
-        self.model_class = model_class
+    # プロセス内で共有するクエリ結果キャッシュ (Model.cache_ttl > 0 のモデルのみ使用)
+    query_cache = QueryCache()
 
-    def filter(self, database_id, _operator="and", **kwargs):
+    def __init__(self, model_class, trusted=True):
+        self.model_class = model_class
+        # サーバーから返ったデータは Model.__init__ の検証を省略して復元する
+        self.trusted = trusted
+
+    def filter(
+        self,
+        database_id,
+        _operator="and",
+        _prefetch=0,
+        _as_frame=False,
+        _replica=None,
+        order_by=None,
+        limit=None,
+        only=None,
+        _q=None,
+        _partition_by=None,
+        _partitions=DEFAULT_PARTITIONS,
+        **kwargs,
+    ):
         from notion_api.services.v1.databases import DataBaseService
 
         d = DataBaseService()
+        partition = None
+        if _partition_by is not None:
+            partition = (self._partition_target(_partition_by), _partitions)
+        filter_params = self._filter_params(_operator, _q, kwargs)
+        sorts = self._build_sorts(order_by)
+        ttl = self.model_class.cache_ttl
+        if _replica is not None:
+            if _replica.database_id.replace("-", "") != database_id.replace("-", ""):
+                raise ValueError(
+                    f"Replica is for database {_replica.database_id}, not {database_id}"
+                )
+            # レプリカはリクエストを送らないので通信の指定とは組み合わせられない
+            if _prefetch or _partition_by is not None:
+                raise ValueError(
+                    "_prefetch and _partition_by cannot be combined with _replica"
+                )
+            pages = self._sort_and_limit(_replica.query(filter_params), sorts, limit)
+            pages = self._project(pages, only)
+        elif ttl:
+            pages = self._cached_pages(database_id, filter_params, ttl)
+            if pages is None:
+                generation = self.query_cache.generation(database_id)
+                pages = list(
+                    self._iter_query(
+                        d,
+                        database_id,
+                        filter_params,
+                        None,
+                        prefetch=_prefetch,
+                        partition=partition,
+                    )
+                )
+                self._store_pages(database_id, filter_params, pages, generation)
+            # キャッシュには条件に一致する全件があるので並べ替えと件数制限はローカルで行う
+            pages = self._project(self._sort_and_limit(pages, sorts, limit), only)
+        else:
+            filter_properties = None
+            if only is not None:
+                schema = d.get_notion_databases(database_id)
+                filter_properties = self._filter_property_ids(schema, only)
+            pages = self._iter_query(
+                d,
+                database_id,
+                filter_params,
+                sorts,
+                prefetch=_prefetch,
+                limit=limit,
+                filter_properties=filter_properties,
+                partition=partition,
+            )
+
+        if _as_frame:
+            # モデルインスタンスを作らずにフィールドごとの列へ直接デコードする
+            return ModelFrame.from_pages(self.model_class, pages)
+        return [self._create_instance_from_page(page) for page in pages]
+
+    async def afilter(
+        self,
+        database_id,
+        _operator="and",
+        order_by=None,
+        limit=None,
+        only=None,
+        _q=None,
+        **kwargs,
+    ):
+        from notion_api.services.v1.async_databases import AsyncDataBaseService
+
+        d = AsyncDataBaseService()
+        filter_params = self._filter_params(_operator, _q, kwargs)
+        sorts = self._build_sorts(order_by)
+        ttl = self.model_class.cache_ttl
+        if ttl:
+            pages = self._cached_pages(database_id, filter_params, ttl)
+            if pages is None:
+                generation = self.query_cache.generation(database_id)
+                pages = await self._aquery(d, database_id, filter_params, None)
+                self._store_pages(database_id, filter_params, pages, generation)
+            pages = self._project(self._sort_and_limit(pages, sorts, limit), only)
+            return [self._create_instance_from_page(page) for page in pages]
+
+        filter_properties = None
+        if only is not None:
+            schema = await d.get_notion_databases(database_id)
+            filter_properties = self._filter_property_ids(schema, only)
+        pages = await self._aquery(
+            d, database_id, filter_params, sorts, limit, filter_properties
+        )
+        return [self._create_instance_from_page(page) for page in pages]
+
+    async def _aquery(
+        self, d, database_id, filter_params, sorts, limit=None, filter_properties=None
+    ):
+        from notion_api.services.v1.databases import (
+            drop_properties,
+            with_sort_properties,
+        )
+
+        filters = split_filter(filter_params.get("filter"))
+        added = []
+        if len(filters) > 1 and filter_properties and sorts:
+            # 結果はローカルで並べ替えるので並べ替えに使うプロパティも取得する
+            filter_properties, added = with_sort_properties(
+                await d.get_notion_databases(database_id), sorts, filter_properties
+            )
+        pages = {}
+        for filter_ in filters:
+            body = {"filter": filter_} if filter_ is not None else {}
+            async for page in d.iter_query_results(
+                database_id,
+                self._query_body(body, sorts),
+                limit=limit,
+                filter_properties=filter_properties,
+            ):
+                pages.setdefault(page["id"], page)
+        if len(filters) == 1:
+            return list(pages.values())
+        pages = self._sort_and_limit(list(pages.values()), sorts, limit)
+        return drop_properties(pages, added)
+
+    def _build_sorts(self, order_by):
+        """``["-number", "date_field"]`` -> Notion ``sorts``."""
+        if isinstance(order_by, str):
+            order_by = [order_by]
+        sorts = []
+        for name in order_by or ():
+            direction = "ascending"
+            if name.startswith("-"):
+                name, direction = name[1:], "descending"
+            if name in TIMESTAMP_SORTS:
+                sorts.append({"timestamp": name, "direction": direction})
+                continue
+            field = self.model_class._meta.by_attr.get(name)
+            if field is None:
+                raise ValueError(f"Invalid order_by field: {name}")
+            sorts.append({"property": field.record_name, "direction": direction})
+        return sorts
+
+    def _partition_target(self, name):
+        """The property name (or timestamp) a partitioned scan splits on."""
+        if name in TIMESTAMP_PARTITIONS:
+            return name
+        field = self.model_class._meta.by_attr.get(name)
+        if not isinstance(field, (IntegerField, DateField)):
+            raise ValueError(
+                f"Partition field must be a number or date field, or one of "
+                f"{TIMESTAMP_PARTITIONS}: {name}"
+            )
+        return field.record_name
+
+    def _only_record_names(self, only):
+        by_attr = self.model_class._meta.by_attr
+        invalid_fields = [name for name in only if name not in by_attr]
+        if invalid_fields:
+            raise ValueError(f"Invalid only fields: {', '.join(invalid_fields)}")
+        return [by_attr[name].record_name for name in only]
+
+    def _filter_property_ids(self, schema, only):
+        """Property ids for the ``only`` fields, as ``filter_properties`` expects."""
+        ids = []
+        for record_name in self._only_record_names(only):
+            if record_name not in schema.properties:
+                raise ValueError(f"Property {record_name!r} is not in the database")
+            ids.append(schema.properties[record_name].id)
+        return ids
+
+    def _project(self, pages, only):
+        """Drop the properties ``only`` leaves out, as ``filter_properties`` does."""
+        if only is None:
+            return pages
+        record_names = set(self._only_record_names(only))
+        return [
+            dict(
+                page,
+                properties={
+                    name: prop
+                    for name, prop in page["properties"].items()
+                    if name in record_names
+                },
+            )
+            for page in pages
+        ]
+
+    @staticmethod
+    def _query_body(filter_params, sorts):
+        if not sorts:
+            return filter_params
+        return dict(filter_params, sorts=sorts)
+
+    @staticmethod
+    def _sort_and_limit(pages, sorts, limit):
+        if sorts:
+            pages = sort_pages(sorts, pages)
+        if limit is not None:
+            if limit < 1:
+                raise ValueError("Limit must be 1 or greater")
+            pages = list(pages)[:limit]
+        return pages
+
+    def _cached_pages(self, database_id, filter_params, ttl):
+        pages = self.query_cache.get(filter_cache_key(database_id, filter_params), ttl)
+        if pages is None:
+            # 条件を絞り込んだだけのクエリはキャッシュ済みの結果をローカルで評価する
+            superset = self.query_cache.find_superset(database_id, filter_params, ttl)
+            if superset is not None:
+                pages = filter_pages(filter_params, superset)
+        return pages
+
+    def _store_pages(self, database_id, filter_params, pages, generation):
+        self.query_cache.put(
+            filter_cache_key(database_id, filter_params),
+            database_id,
+            pages,
+            generation,
+            filter_params=filter_params,
+        )
+
+    def _build_filter_params(self, _operator="and", **kwargs):
         filter_composer = FilterComposer()
 
         for field_name, conditions in kwargs.items():
             if field_name == "_operator":
                 continue
-            field = getattr(self.model_class, field_name, None)
-            if isinstance(field, BaseField):
-                filter_builder = self._get_filter_builder(field)
-                for condition, value in conditions.items():
-                    filter_method = getattr(filter_builder, condition, None)
-                    if filter_method:
-                        filter_composer.add_filter(filter_method(value).build())
-
-        filter_params = filter_composer.build(_operator)
-        filtered_records = d.filter_database_records(database_id, filter_params)
+            field = self.model_class._meta.by_attr.get(field_name)
+            if field is not None:
+                filters = [
+                    self._build_condition(field, condition, value)
+                    for condition, value in conditions.items()
+                ]
+                # 同じフィールドの複数条件は _operator に関係なく and で結ぶ (範囲指定)
+                field_filter = combine("and", filters)
+                if field_filter is not None:
+                    filter_composer.add_filter(field_filter)
+
+        return filter_composer.build(_operator)
+
+    def _filter_params(self, _operator, _q, kwargs):
+        filter_ = self._build_filter_params(_operator, **kwargs)["filter"]
+        if _q is not None:
+            filter_ = combine("and", [filter_, _q.resolve(self.model_class)])
+        filter_ = simplify(filter_)
+        return {"filter": filter_} if filter_ is not None else {}
+
+    def _iter_query(
+        self,
+        d,
+        database_id,
+        filter_params,
+        sorts,
+        prefetch=0,
+        limit=None,
+        filter_properties=None,
+        partition=None,
+    ):
+        """Query pages, splitting filters nested deeper than Notion allows.
+
+        ``partition`` is ``(partition_by, partitions)`` for a parallel
+        partitioned scan (see ``DataBaseService.query_partitioned``).
+        """
+        if partition is not None:
+            partition_by, partitions = partition
+            return d.query_partitioned(
+                database_id,
+                self._query_body(filter_params, sorts),
+                partition_by=partition_by,
+                partitions=partitions,
+                limit=limit,
+                filter_properties=filter_properties,
+            )
+        filters = split_filter(filter_params.get("filter"))
+        if len(filters) == 1:
+            body = {"filter": filters[0]} if filters[0] is not None else {}
+            return d.iter_query_results(
+                database_id,
+                self._query_body(body, sorts),
+                prefetch=prefetch,
+                limit=limit,
+                filter_properties=filter_properties,
+            )
+        from notion_api.services.v1.databases import (
+            drop_properties,
+            with_sort_properties,
+        )
 
-        return [
-            self._create_instance_from_record(record) for record in filtered_records
-        ]
+        added = []
+        if filter_properties and sorts:
+            # 結果はローカルで並べ替えるので並べ替えに使うプロパティも取得する
+            filter_properties, added = with_sort_properties(
+                d.get_notion_databases(database_id), sorts, filter_properties
+            )
+        pages = {}
+        for filter_ in filters:
+            for page in d.iter_query_results(
+                database_id,
+                self._query_body({"filter": filter_}, sorts),
+                limit=limit,
+                filter_properties=filter_properties,
+            ):
+                pages.setdefault(page["id"], page)
+        pages = self._sort_and_limit(list(pages.values()), sorts, limit)
+        return drop_properties(pages, added)
+
+    def _build_condition(self, field, condition, value):
+        """One Notion property filter, or ``None`` if the builder has no ``condition``."""
+        filter_builder = self._get_filter_builder(field)
+        if condition.startswith("_") or condition == "build":
+            return None
+        filter_method = getattr(filter_builder, condition, None)
+        if filter_method is None:
+            return None
+        if condition in ("is_empty", "is_not_empty"):
+            if not value:
+                return None
+            return filter_method().build()
+        return filter_method(value).build()
 
     @staticmethod
     def _get_filter_builder(field):
@@ -66,134 +401,207 @@ class ModelFilter:
             raise ValueError(f"Unsupported field type: {type(field)}")
 
     def _create_instance_from_record(self, record):
+        return self._hydrate(record.id, record.properties)
+
+    def _create_instance_from_page(self, page):
+        return self._hydrate(page["id"], page["properties"])
+
+    def _hydrate(self, page_id, record_properties):
+        if self.trusted:
+            return self.model_class._from_notion(page_id, record_properties)
+
         properties = {}
-        for field_name, field in vars(self.model_class).items():
-            if isinstance(field, BaseField):
-                record_name = field.record_name
-                if record_name in record.properties:
-                    prop = record.properties[record_name]
-                    if isinstance(field, CharField):
-                        properties[field_name] = (
-                            prop["rich_text"][0]["plain_text"]
-                            if prop["rich_text"]
-                            else None
-                        )
-                    elif isinstance(field, IntegerField):
-                        properties[field_name] = prop["number"]
-                    elif isinstance(field, SelectField):
-                        properties[field_name] = (
-                            prop["select"]["name"] if prop["select"] else None
-                        )
-                    elif isinstance(field, MultiSelectField):
-                        properties[field_name] = [
-                            option["name"] for option in prop["multi_select"]
-                        ]
-                    elif isinstance(field, DateField):
-                        properties[field_name] = (
-                            prop["date"]["start"] if prop["date"] else None
-                        )
-                    elif isinstance(field, BoolField):
-                        properties[field_name] = prop["checkbox"]
+        for (
+            field_name,
+            record_name,
+            deserialize,
+        ) in self.model_class._meta.deserializers:
+            if record_name in record_properties:
+                properties[field_name] = deserialize(record_properties[record_name])
 
         instance = self.model_class(**properties)
-        instance.page_id = record.id  # Store the page_id in the instance
+        instance.page_id = page_id  # Store the page_id in the instance
+        instance._mark_clean()
         return instance
 
 
-class Model:
+def _snapshot(values):
+    # フィールド順の値のタプル。multi_select のリストはその場で変更されうるのでコピーする
+    return tuple(list(value) if type(value) is list else value for value in values)
+
+
+class Model(metaclass=ModelMeta):
+    # compact=True のサブクラスが __dict__ を持たないようにする
+    __slots__ = ()
+
+    # filter 結果をキャッシュする秒数。0 ならキャッシュしない
+    cache_ttl = 0
+
+    # Model.objects の既定のデータベース (using() で上書きできる)
+    database_id = None
+    objects = QuerySetDescriptor()
+
     def __init__(self, **kwargs):
-        # Create a mapping of record_name to field_name and vice versa
-        self._field_mapping = {}
-        self._reverse_mapping = {}
-        for field_name, field in vars(self.__class__).items():
-            if isinstance(field, BaseField):
-                self._field_mapping[field.record_name] = field_name
-                self._reverse_mapping[field_name] = field.record_name
+        meta = self._meta
 
         # Check for invalid fields
         invalid_fields = [
             key
             for key in kwargs
-            if key not in self._field_mapping and key not in self._reverse_mapping
+            if key not in meta.record_to_attr and key not in meta.by_attr
         ]
         if invalid_fields:
             raise AttributeError(f"Invalid fields: {', '.join(invalid_fields)}")
 
         # Check for missing required fields
-        required_fields = [
-            field_name
-            for field_name, field in vars(self.__class__).items()
-            if isinstance(field, BaseField) and field.is_required
-        ]
-        missing_fields = [field for field in required_fields if field not in kwargs]
+        missing_fields = [field for field in meta.required if field not in kwargs]
         if missing_fields:
             raise ValueError(f"Missing required fields: {', '.join(missing_fields)}")
 
+        # 未指定のフィールドはクラス属性 (BaseField) ではなく None にする
+        for field_name in meta.by_attr:
+            setattr(self, field_name, None)
+
         for key, value in kwargs.items():
-            field_name = self._field_mapping.get(key, key)
-            if hasattr(self.__class__, field_name):
-                field = getattr(self.__class__, field_name)
-                if isinstance(field, BaseField):
-                    setattr(self, field_name, field.run(value))
-                else:
-                    setattr(self, field_name, value)
+            field_name = meta.record_to_attr.get(key, key)
+            setattr(self, field_name, meta.by_attr[field_name].run(value))
+
+    @classmethod
+    def _from_notion(cls, page_id, record_properties):
+        """Build an instance from server-returned properties without validation."""
+        instance = cls.__new__(cls)
+        values = []
+        for field_name, record_name, decode in cls._meta.deserializers:
+            prop = record_properties.get(record_name)
+            values.append(None if prop is None else decode(prop))
+        if cls._meta.compact:
+            for field_name, value in zip(cls._meta.attrs, values):
+                setattr(instance, field_name, value)
+        else:
+            instance.__dict__.update(zip(cls._meta.attrs, values))
+        instance.page_id = page_id
+        instance._snapshot = _snapshot(values)
+        return instance
 
     def is_valid(self):
-        fields = [v for v in vars(self.__class__).values() if isinstance(v, BaseField)]
-        for field in fields:
-            field_name = self._field_mapping.get(field.record_name, field.record_name)
-            if field.is_required and getattr(self, field_name) is None:
+        for field_name in self._meta.required:
+            if getattr(self, field_name) is None:
                 return False
         return True
 
+    def _field_errors(self):
+        """Validation messages for every field whose current value is rejected."""
+        errors = []
+        for field_name, field in self._meta.fields:
+            value = getattr(self, field_name)
+            if value is None:
+                if field.is_required:
+                    errors.append(f"{field.record_name} is required")
+                continue
+            try:
+                field.run(value)
+            except ValueError as e:
+                errors.append(str(e))
+        return errors
+
     def save(self, database_id):
-        if not self.is_valid():
-            raise ValueError("Invalid model")
         from notion_api.services.v1.databases import DataBaseService
 
         d = DataBaseService()
+        record = self._build_record(database_id)
+
+        new_record = d.insert_record(database_id, record.to_dict())
+        self._record_written(database_id, [new_record])
+        self._after_save(new_record)
+        return new_record
+
+    async def asave(self, database_id):
+        from notion_api.services.v1.async_databases import AsyncDataBaseService
+
+        d = AsyncDataBaseService()
+        record = self._build_record(database_id)
+
+        new_record = await d.insert_record(database_id, record.to_dict())
+        self._record_written(database_id, [new_record])
+        self._after_save(new_record)
+        return new_record
+
+    @staticmethod
+    def _record_written(database_id, pages=()):
+        """Invalidate cached queries and update in-memory tables after a write."""
+        if not database_id:
+            return
+        ModelFilter.query_cache.invalidate_database(database_id)
+        tables = tables_for(database_id)
+        for page in pages:
+            for table in tables:
+                table.apply(page)
+
+    def _after_save(self, new_record):
+        self.page_id = new_record["id"]
+        self._mark_clean()
+
+    @classmethod
+    def bulk_create(cls, database_id, instances, concurrency=DEFAULT_CONCURRENCY):
+        from notion_api.services.v1.databases import DataBaseService
+
+        instances = list(instances)
+        records = []
+        errors = []
+        for index, instance in enumerate(instances):
+            # __init__ 後に代入された値もここで検証する
+            field_errors = instance._field_errors()
+            if field_errors:
+                errors.append(f"{index}: {', '.join(field_errors)}")
+                continue
+            try:
+                records.append(instance._build_record(database_id).to_dict())
+            except ValueError as e:
+                errors.append(f"{index}: {e}")
+        if errors:
+            raise ValueError(f"Invalid models: {'; '.join(errors)}")
+
+        d = DataBaseService()
+        results = []
+        try:
+            results = run_bulk(
+                lambda record: d.insert_record(database_id, record),
+                records,
+                concurrency,
+            )
+        finally:
+            cls._record_written(database_id, [r.response for r in results if r.ok])
+        for result in results:
+            if result.ok:
+                instances[result.index]._after_save(result.response)
+        return results
+
+    def _build_record(self, database_id):
+        if not self.is_valid():
+            raise ValueError("Invalid model")
         from notion_api.utils.database_record_ops import DatabaseRecord
 
         record = DatabaseRecord(database_id)
 
         # Add "Name" property as title
-        title_field = next(
-            (
-                f
-                for f in vars(self.__class__).values()
-                if isinstance(f, BaseField) and f.record_name == "Name"
-            ),
-            None,
-        )
-        if title_field:
-            title_value = getattr(
-                self, self._field_mapping.get("Name", "Name"), str(self)
-            )
+        meta = self._meta
+        if meta.title_attr:
+            title_value = getattr(self, meta.title_attr, str(self))
         else:
             title_value = (
                 f"{self.__class__.__name__}_{id(self)}"  # デフォルトのタイトル
             )
-        record.add_property("Name", title_value, CharField("Name"))
+        record.add_property(TITLE_PROPERTY, title_value, None)
 
-        for field_name, field in vars(self.__class__).items():
-            if isinstance(field, BaseField) and field.record_name != "Name":
-                value = getattr(self, field_name)
-                record.add_property(field.record_name, value, field)
+        for field_name, record_name, serialize in meta.serializers:
+            if record_name != TITLE_PROPERTY:
+                record.properties[record_name] = serialize(getattr(self, field_name))
 
-        new_record = d.insert_record(database_id, record.to_dict())
-        return new_record
+        return record
 
     def __str__(self):
-        title_field = next(
-            (
-                f
-                for f in vars(self.__class__).values()
-                if isinstance(f, BaseField) and f.record_name == "タイトル"
-            ),
-            None,
-        )
-        if title_field:
-            field_name = self._field_mapping.get("タイトル", "タイトル")
+        field_name = self._meta.record_to_attr.get("タイトル")
+        if field_name:
             return getattr(self, field_name, f"<{self.__class__.__name__}>")
         return f"<{self.__class__.__name__}>"
 
@@ -220,37 +628,204 @@ class Model:
             raise ValueError(f"Invalid field type: {field.__class__.__name__}")
 
     @classmethod
-    def filter(cls, database_id, _operator="and", **kwargs):
+    def filter(
+        cls,
+        database_id,
+        _operator="and",
+        _prefetch=0,
+        _as_frame=False,
+        _replica=None,
+        order_by=None,
+        limit=None,
+        only=None,
+        _q=None,
+        _partition_by=None,
+        _partitions=DEFAULT_PARTITIONS,
+        **kwargs,
+    ):
         model_filter = ModelFilter(cls)
-        return model_filter.filter(database_id, _operator=_operator, **kwargs)
+        return model_filter.filter(
+            database_id,
+            _operator=_operator,
+            _prefetch=_prefetch,
+            _as_frame=_as_frame,
+            _replica=_replica,
+            order_by=order_by,
+            limit=limit,
+            only=only,
+            _q=_q,
+            _partition_by=_partition_by,
+            _partitions=_partitions,
+            **kwargs,
+        )
+
+    @classmethod
+    async def afilter(
+        cls,
+        database_id,
+        _operator="and",
+        order_by=None,
+        limit=None,
+        only=None,
+        _q=None,
+        **kwargs,
+    ):
+        model_filter = ModelFilter(cls)
+        return await model_filter.afilter(
+            database_id,
+            _operator=_operator,
+            order_by=order_by,
+            limit=limit,
+            only=only,
+            _q=_q,
+            **kwargs,
+        )
 
     def get_page_id(self):
         return self.page_id
 
     def update(self, database_id, page_id=None):
+        from notion_api.services.v1.databases import DataBaseService
+
+        page_id, record = self._build_update_record(database_id, page_id)
+        if not record.properties:
+            return None  # 変更なし
+        d = DataBaseService()
+
+        updated_record = d.update_record(page_id, record)
+        self._record_written(database_id, [updated_record])
+        self._mark_clean()
+        return updated_record
+
+    async def aupdate(self, database_id, page_id=None):
+        from notion_api.services.v1.async_databases import AsyncDataBaseService
+
+        page_id, record = self._build_update_record(database_id, page_id)
+        if not record.properties:
+            return None  # 変更なし
+        d = AsyncDataBaseService()
+
+        updated_record = await d.update_record(page_id, record)
+        self._record_written(database_id, [updated_record])
+        self._mark_clean()
+        return updated_record
+
+    @classmethod
+    def bulk_update(
+        cls, database_id, instances, fields=None, concurrency=DEFAULT_CONCURRENCY
+    ):
+        from notion_api.services.v1.databases import DataBaseService
+
+        if fields is not None:
+            invalid_fields = [name for name in fields if name not in cls._meta.by_attr]
+            if invalid_fields:
+                raise AttributeError(f"Invalid fields: {', '.join(invalid_fields)}")
+
+        instances = list(instances)
+        updates = []
+        errors = []
+        for index, instance in enumerate(instances):
+            field_errors = instance._field_errors()
+            if field_errors:
+                errors.append(f"{index}: {', '.join(field_errors)}")
+                continue
+            try:
+                updates.append(
+                    instance._build_update_record(database_id, fields=fields)
+                )
+            except ValueError as e:
+                errors.append(f"{index}: {e}")
+        if errors:
+            raise ValueError(f"Invalid models: {'; '.join(errors)}")
+
+        d = DataBaseService()
+
+        def update_record(index):
+            page_id, record = updates[index]
+            if not record.properties:
+                return {"id": page_id}  # 変更なし
+            updated_record = d.update_record(page_id, record)
+            instances[index]._mark_clean()
+            return updated_record
+
+        results = []
+        try:
+            results = run_bulk(update_record, range(len(updates)), concurrency)
+        finally:
+            cls._record_written(database_id, [r.response for r in results if r.ok])
+        return results
+
+    @classmethod
+    def bulk_delete(cls, database_id, page_ids, concurrency=DEFAULT_CONCURRENCY):
+        from notion_api.services.v1.databases import DataBaseService
+
+        page_ids = list(page_ids)
+        if not all(page_ids):
+            raise ValueError("Page ID is required for every record")
+
+        d = DataBaseService()
+        results = []
+        try:
+            results = run_bulk(d.delete_record, page_ids, concurrency)
+        finally:
+            cls._record_written(database_id, [r.response for r in results if r.ok])
+        return results
+
+    def _build_update_record(self, database_id, page_id=None, fields=None):
         if not self.is_valid():
             raise ValueError("Invalid model")
         if page_id is None:
             page_id = self.get_page_id()
         if not page_id:
             raise ValueError("Page ID is required for update operation")
-        from notion_api.services.v1.databases import DataBaseService
+        if fields is None and page_id == self.get_page_id():
+            # 取得・保存済みのインスタンスは変更されたフィールドだけを送る
+            fields = self.get_dirty_fields()
         from notion_api.utils.database_record_ops import DatabaseRecord
 
-        d = DataBaseService()
+        meta = self._meta
+        serializers = meta.serializers
+        if fields is not None:
+            invalid_fields = [name for name in fields if name not in meta.by_attr]
+            if invalid_fields:
+                raise AttributeError(f"Invalid fields: {', '.join(invalid_fields)}")
+            fields = set(fields)
+            serializers = [entry for entry in serializers if entry[0] in fields]
+
         record = DatabaseRecord(database_id)
 
-        for field_name, field in vars(self.__class__).items():
-            if isinstance(field, BaseField):
-                value = getattr(self, field_name)
-                record.add_property(field.record_name, value, field)
+        for field_name, record_name, serialize in serializers:
+            record.properties[record_name] = serialize(getattr(self, field_name))
 
-        updated_record = d.update_record(page_id, record)
-        return updated_record
+        return page_id, record
 
     def get_page_id(self):
         return getattr(self, "page_id", None)
 
+    def _mark_clean(self):
+        self._snapshot = _snapshot(
+            getattr(self, field_name, None) for field_name in self._meta.attrs
+        )
+
+    def get_dirty_fields(self):
+        """Names of fields changed since the instance was fetched or saved.
+
+        Returns ``None`` for instances that were never fetched or saved, meaning
+        every field has to be sent.
+        """
+        snapshot = getattr(self, "_snapshot", None)
+        if snapshot is None:
+            return None
+        return [
+            field_name
+            for field_name, value in zip(self._meta.attrs, snapshot)
+            if getattr(self, field_name, None) != value
+        ]
+
+    def is_dirty(self):
+        dirty_fields = self.get_dirty_fields()
+        return dirty_fields is None or bool(dirty_fields)
+
     def delete(self):
         if not hasattr(self, "page_id") or not self.page_id:
             raise ValueError("Cannot delete a record without a page_id")
@@ -261,6 +836,24 @@ class Model:
 
         deleted_record = d.delete_record(self.page_id)
 
+        return self._after_delete(deleted_record)
+
+    async def adelete(self):
+        if not hasattr(self, "page_id") or not self.page_id:
+            raise ValueError("Cannot delete a record without a page_id")
+
+        from notion_api.services.v1.async_databases import AsyncDataBaseService
+
+        d = AsyncDataBaseService()
+
+        deleted_record = await d.delete_record(self.page_id)
+
+        return self._after_delete(deleted_record)
+
+    def _after_delete(self, deleted_record):
+        # delete() はデータベース ID を受け取らないので親から辿る
+        parent = deleted_record.get("parent") or {}
+        self._record_written(parent.get("database_id"), [deleted_record])
         if deleted_record["archived"]:
             # Clear the page_id after successful deletion
             self.page_id = None
@@ -275,23 +868,68 @@ class Model:
         d = DataBaseService()
 
         deleted_record = d.delete_record(page_id)
+        cls._record_written(database_id, [deleted_record])
 
         return deleted_record["archived"]
 
     @classmethod
-    def migrate(cls, parent_id=None):
-        db_property = {
-            "Name": {"title": {}},
-        }
+    async def adelete_by_id(cls, database_id, page_id):
+        from notion_api.services.v1.async_databases import AsyncDataBaseService
 
-        fields = [v for v in vars(cls).values() if isinstance(v, BaseField)]
+        d = AsyncDataBaseService()
 
-        for field in fields:
-            db_property[field.record_name] = cls.choose_field(field)
+        deleted_record = await d.delete_record(page_id)
+        cls._record_written(database_id, [deleted_record])
 
-        database_title = DatabaseTitle(content=cls.table_name())
+        return deleted_record["archived"]
+
+    @classmethod
+    def get_schema(cls, database_id, use_cache=True):
+        from notion_api.services.v1.databases import DataBaseService
+
+        return DataBaseService().get_notion_databases(database_id, use_cache=use_cache)
+
+    @classmethod
+    def migrate(
+        cls, parent_id=None, database_id=None, dry_run=False, renames=None, force=False
+    ):
+        """Create the database, or bring an existing one up to date.
+
+        With ``database_id`` the current schema is fetched and only the missing
+        properties, renames (``{"old": "new"}``) and select options are patched.
+        ``dry_run`` returns the plan without sending it.
+        """
         from notion_api.services.v1.databases import DataBaseService
 
+        if database_id is not None:
+            plan = plan_migration(cls, fetch_schema(database_id), renames)
+            if not dry_run:
+                apply_migration(plan, force=force)
+            return {
+                "code": 200,
+                "message": (
+                    plan.format()
+                    if dry_run
+                    else f"Database {cls.table_name()} migrated successfully"
+                ),
+                "database_id": database_id,
+                "plan": plan,
+            }
+
+        db_property = desired_properties(cls)
+        database_title = DatabaseTitle(content=cls.table_name())
+        if dry_run:
+            return {
+                "code": 200,
+                "message": f"Would create database {cls.table_name()}",
+                "database_id": None,
+                "plan": MigrationPlan(
+                    None,
+                    db_property,
+                    [f"create database {cls.table_name()!r}"],
+                ),
+            }
+
         db_service = DataBaseService()
         result = db_service.create_notion_database(
             title=database_title, parent_id=parent_id, properties=db_property
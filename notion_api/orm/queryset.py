@@ -0,0 +1,337 @@
+from itertools import islice
+
+from notion_api.utils.filter_tree import combine, negate, simplify, split_filter
+
+# タイトルプロパティの ID は常に "title"。件数だけ必要なときはこれだけ取得する
+TITLE_PROPERTY_ID = "title"
+
+
+class Q:
+    """A filter condition that can be combined with ``&``, ``|`` and ``~``.
+
+    Keyword arguments take the same form as ``Model.filter``; several of them
+    are joined with ``and``. The tree is compiled into Notion compound filters
+    when the query runs, flattening redundant nesting and merging ranges::
+
+        Q(number={"greater_than": 40}) | ~Q(selects={"equals": "a"})
+    """
+
+    def __init__(self, *children, _connector="and", _negated=False, **conditions):
+        if _connector not in ("and", "or"):
+            raise ValueError("Connector must be 'and' or 'or'")
+        self.children = list(children) + list(conditions.items())
+        self.connector = _connector
+        self.negated = _negated
+
+    def _combine(self, other, connector):
+        if not isinstance(other, Q):
+            raise TypeError(f"Cannot combine Q with {type(other).__name__}")
+        return Q(self, other, _connector=connector)
+
+    def __and__(self, other):
+        return self._combine(other, "and")
+
+    def __or__(self, other):
+        return self._combine(other, "or")
+
+    def __invert__(self):
+        return Q(*self.children, _connector=self.connector, _negated=not self.negated)
+
+    def resolve(self, model_class):
+        """The Notion filter object for ``model_class``, or ``None`` if empty."""
+        filters = []
+        for child in self.children:
+            if isinstance(child, Q):
+                filters.append(child.resolve(model_class))
+            else:
+                filters.append(build_field_filter(model_class, *child))
+        filter_ = combine(self.connector, filters)
+        if self.negated and filter_ is not None:
+            filter_ = negate(filter_)
+        return simplify(filter_)
+
+    def __repr__(self):
+        children = ", ".join(
+            repr(c) if isinstance(c, Q) else f"{c[0]}={c[1]!r}" for c in self.children
+        )
+        prefix = "~" if self.negated else ""
+        return f"{prefix}Q({self.connector}: {children})"
+
+
+def build_field_filter(model_class, field_name, conditions):
+    """Filter for one ``field={condition: value, ...}``; conditions are and-ed."""
+    from .orm_models import ModelFilter
+
+    field = model_class._meta.by_attr.get(field_name)
+    if field is None:
+        raise ValueError(f"Invalid filter field: {field_name}")
+    model_filter = ModelFilter(model_class)
+    filters = []
+    for condition, value in conditions.items():
+        filter_ = model_filter._build_condition(field, condition, value)
+        if filter_ is None:
+            raise ValueError(
+                f"Invalid condition for {field_name}: {condition}={value!r}"
+            )
+        filters.append(filter_)
+    return combine("and", filters)
+
+
+class QuerySet:
+    """A lazy query over one Notion database.
+
+    ``filter``/``exclude``/``order_by``/``only`` and slicing return new querysets
+    and send nothing. Iterating streams the query page by page, so stopping
+    early (``first()``, ``exists()``, a slice, or ``break``) stops the requests.
+    A queryset that has been fully iterated keeps its results.
+
+    ::
+
+        top = (
+            TestModel.objects.using(database_id)
+            .filter(number={"greater_than": 40})
+            .exclude(selects={"equals": "a"})
+            .order_by("-number")[:50]
+        )
+    """
+
+    def __init__(self, model_class, database_id=None):
+        self.model_class = model_class
+        self.database_id = database_id
+        self._filters = []
+        self._order_by = []
+        self._only = None
+        self._offset = 0
+        self._limit = None
+        self._prefetch = 0
+        self._result_cache = None
+
+    def _clone(self):
+        clone = QuerySet(self.model_class, self.database_id)
+        clone._filters = list(self._filters)
+        clone._order_by = list(self._order_by)
+        clone._only = self._only
+        clone._offset = self._offset
+        clone._limit = self._limit
+        clone._prefetch = self._prefetch
+        return clone
+
+    # ------------------------------------------------------------
+    # chaining
+    # ------------------------------------------------------------
+
+    def using(self, database_id):
+        clone = self._clone()
+        clone.database_id = database_id
+        return clone
+
+    def all(self):
+        return self._clone()
+
+    def filter(self, *args, _operator="and", **kwargs):
+        return self._add_filter(self._build_filter(args, _operator, kwargs))
+
+    def exclude(self, *args, **kwargs):
+        filter_ = self._build_filter(args, "and", kwargs)
+        return self._add_filter(negate(filter_) if filter_ else None)
+
+    def order_by(self, *fields):
+        clone = self._clone()
+        # 既存の並び順は置き換える (Django と同じ)
+        clone._order_by = list(fields)
+        self._model_filter()._build_sorts(clone._order_by)
+        return clone
+
+    def only(self, *fields):
+        invalid_fields = [f for f in fields if f not in self.model_class._meta.by_attr]
+        if invalid_fields:
+            raise ValueError(f"Invalid only fields: {', '.join(invalid_fields)}")
+        clone = self._clone()
+        clone._only = list(fields)
+        return clone
+
+    def prefetch(self, depth):
+        clone = self._clone()
+        clone._prefetch = depth
+        return clone
+
+    def _add_filter(self, filter_):
+        if self._offset or self._limit is not None:
+            raise ValueError("Cannot filter a query once a slice has been taken")
+        clone = self._clone()
+        if filter_ is not None:
+            clone._filters.append(filter_)
+        return clone
+
+    def _build_filter(self, args, operator, kwargs):
+        fields = combine(
+            operator,
+            [
+                build_field_filter(self.model_class, field_name, conditions)
+                for field_name, conditions in kwargs.items()
+            ],
+        )
+        return combine("and", [q.resolve(self.model_class) for q in args] + [fields])
+
+    # ------------------------------------------------------------
+    # slicing
+    # ------------------------------------------------------------
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            if key.step not in (None, 1):
+                raise ValueError("Slice steps are not supported")
+            start, stop = key.start or 0, key.stop
+            if start < 0 or (stop is not None and stop < 0):
+                raise ValueError("Negative indexing is not supported")
+            if self._result_cache is not None:
+                return self._result_cache[key]
+            clone = self._clone()
+            clone._offset = self._offset + start
+            if stop is not None:
+                length = max(stop - start, 0)
+                if self._limit is not None:
+                    length = min(length, max(self._limit - start, 0))
+                clone._limit = length
+            elif self._limit is not None:
+                clone._limit = max(self._limit - start, 0)
+            return clone
+        if not isinstance(key, int):
+            raise TypeError(f"QuerySet indices must be integers or slices, not {key}")
+        if key < 0:
+            raise ValueError("Negative indexing is not supported")
+        if self._result_cache is not None:
+            return self._result_cache[key]
+        result = list(self[key : key + 1])
+        if not result:
+            raise IndexError("QuerySet index out of range")
+        return result[0]
+
+    # ------------------------------------------------------------
+    # execution
+    # ------------------------------------------------------------
+
+    def __iter__(self):
+        if self._result_cache is not None:
+            return iter(self._result_cache)
+        return self._iter_and_cache()
+
+    def _iter_and_cache(self):
+        results = []
+        for instance in self.iterator():
+            results.append(instance)
+            yield instance
+        self._result_cache = results
+
+    def iterator(self):
+        """Stream instances without keeping them on the queryset."""
+        model_filter = self._model_filter()
+        for page in self._pages(self._filter_properties()):
+            yield model_filter._create_instance_from_page(page)
+
+    def __len__(self):
+        return len(self._fetch_all())
+
+    def __bool__(self):
+        if self._result_cache is not None:
+            return bool(self._result_cache)
+        return self.exists()
+
+    def _fetch_all(self):
+        if self._result_cache is None:
+            self._result_cache = list(self.iterator())
+        return self._result_cache
+
+    def first(self):
+        if self._result_cache is not None:
+            return self._result_cache[0] if self._result_cache else None
+        return next(iter(self[:1].iterator()), None)
+
+    def exists(self):
+        if self._result_cache is not None:
+            return bool(self._result_cache)
+        return next(self[:1]._pages([TITLE_PROPERTY_ID]), None) is not None
+
+    def count(self):
+        """Number of matching pages; downloads only their title property."""
+        if self._result_cache is not None:
+            return len(self._result_cache)
+        return sum(1 for _ in self._pages([TITLE_PROPERTY_ID]))
+
+    def _pages(self, filter_properties=None):
+        if self._limit == 0:
+            return iter(())
+        from notion_api.services.v1.databases import DataBaseService
+
+        database_id = self._database_id()
+        limit = None if self._limit is None else self._offset + self._limit
+        body = self.query_body()
+        pages = self._model_filter()._iter_query(
+            DataBaseService(),
+            database_id,
+            {"filter": body["filter"]} if "filter" in body else {},
+            body.get("sorts"),
+            prefetch=self._prefetch,
+            limit=limit,
+            filter_properties=filter_properties,
+        )
+        # Notion にはオフセット指定がないので先頭を読み飛ばす
+        return islice(pages, self._offset, None)
+
+    def _filter_properties(self):
+        if self._only is None:
+            return None
+        from notion_api.services.v1.databases import DataBaseService
+
+        schema = DataBaseService().get_notion_databases(self._database_id())
+        return self._model_filter()._filter_property_ids(schema, self._only)
+
+    def query_body(self):
+        """The query body (without pagination).
+
+        A filter nested deeper than Notion allows is sent as several requests
+        (see ``query_bodies``).
+        """
+        body = {}
+        filter_ = simplify(combine("and", self._filters))
+        if filter_ is not None:
+            body["filter"] = filter_
+        sorts = self._model_filter()._build_sorts(self._order_by)
+        if sorts:
+            body["sorts"] = sorts
+        return body
+
+    def query_bodies(self):
+        """The bodies actually sent; more than one when the filter had to be split."""
+        body = self.query_body()
+        if "filter" not in body:
+            return [body]
+        return [dict(body, filter=filter_) for filter_ in split_filter(body["filter"])]
+
+    def _database_id(self):
+        database_id = self.database_id or self.model_class.database_id
+        if not database_id:
+            raise ValueError(
+                f"No database for {self.model_class.__name__}; "
+                "call using(database_id) or set database_id on the model"
+            )
+        return database_id
+
+    def _model_filter(self):
+        from .orm_models import ModelFilter
+
+        return ModelFilter(self.model_class)
+
+    def __repr__(self):
+        if self._result_cache is not None:
+            return f"<QuerySet {self._result_cache!r}>"
+        return f"<QuerySet {self.model_class.__name__} {self.query_body()!r}>"
+
+
+class QuerySetDescriptor:
+    """``Model.objects``: a fresh ``QuerySet`` for the model class."""
+
+    def __get__(self, instance, owner):
+        if instance is not None:
+            raise AttributeError("objects is only accessible via the model class")
+        return QuerySet(owner)
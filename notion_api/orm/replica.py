@@ -0,0 +1,330 @@
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+
+from notion_api.config.settings import REPLICA_RECONCILE_INTERVAL
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS pages (
+    id TEXT PRIMARY KEY,
+    last_edited_time TEXT NOT NULL,
+    properties TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS replica_state (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+@dataclass
+class SyncResult:
+    upserted: int = 0
+    removed: int = 0
+    full: bool = False
+
+
+class LocalReplica:
+    """On-disk SQLite copy of one Notion database's pages.
+
+    ``sync()`` pulls pages edited on or after the stored watermark. Archived pages
+    are not returned by the query endpoint, so every ``reconcile_interval`` seconds
+    (or with ``sync(full=True)``) the whole database is fetched and local pages that
+    no longer exist are removed.
+    """
+
+    def __init__(
+        self, database_id, path, reconcile_interval=REPLICA_RECONCILE_INTERVAL
+    ):
+        if not database_id:
+            raise ValueError("Database ID is required")
+        self.database_id = database_id
+        self.path = path
+        self.reconcile_interval = reconcile_interval
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+
+    def close(self):
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM pages").fetchone()[0]
+
+    @property
+    def watermark(self):
+        return self._get_state("watermark")
+
+    @property
+    def reconciled_at(self):
+        value = self._get_state("reconciled_at")
+        return float(value) if value is not None else None
+
+    def sync(self, full=None):
+        from notion_api.services.v1.databases import DataBaseService
+
+        if full is None:
+            reconciled_at = self.reconciled_at
+            full = (
+                reconciled_at is None
+                or time.time() - reconciled_at >= self.reconcile_interval
+            )
+        watermark = self.watermark
+        if full or watermark is None:
+            body = None
+        else:
+            # last_edited_time は分単位に丸められるので境界のページは再取得される
+            body = {
+                "filter": {
+                    "timestamp": "last_edited_time",
+                    "last_edited_time": {"on_or_after": watermark},
+                }
+            }
+
+        d = DataBaseService()
+        result = SyncResult(full=body is None)
+        seen = set()
+        rows = []
+        for page in d.iter_query_results(self.database_id, body):
+            seen.add(page["id"])
+            rows.append(
+                (
+                    page["id"],
+                    page["last_edited_time"],
+                    json.dumps(page["properties"]),
+                )
+            )
+
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO pages (id, last_edited_time, properties) "
+                "VALUES (?, ?, ?)",
+                rows,
+            )
+            result.upserted = len(rows)
+            if result.full:
+                stale = [
+                    (page_id,)
+                    for (page_id,) in self._conn.execute("SELECT id FROM pages")
+                    if page_id not in seen
+                ]
+                self._conn.executemany("DELETE FROM pages WHERE id = ?", stale)
+                result.removed = len(stale)
+                self._set_state("reconciled_at", str(time.time()))
+            latest = max((row[1] for row in rows), default=None)
+            if latest is not None and (watermark is None or latest > watermark):
+                self._set_state("watermark", latest)
+        return result
+
+    def upsert(self, page):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO pages (id, last_edited_time, properties) "
+                "VALUES (?, ?, ?)",
+                (page["id"], page["last_edited_time"], json.dumps(page["properties"])),
+            )
+
+    def remove(self, page_id):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM pages WHERE id = ?", (page_id,))
+
+    def query(self, filter_params=None):
+        """Yield stored pages matching a ``{"filter": ...}`` body, like the query endpoint."""
+        where, params = compile_filter((filter_params or {}).get("filter"))
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT id, last_edited_time, properties FROM pages WHERE {where}",
+                params,
+            ).fetchall()
+        for page_id, last_edited_time, properties in rows:
+            yield {
+                "id": page_id,
+                "last_edited_time": last_edited_time,
+                "properties": json.loads(properties),
+            }
+
+    def _get_state(self, key):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM replica_state WHERE key = ?", (key,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def _set_state(self, key, value):
+        self._conn.execute(
+            "INSERT OR REPLACE INTO replica_state (key, value) VALUES (?, ?)",
+            (key, value),
+        )
+
+
+# ----------------------------------------------------------------
+# filter JSON -> SQL
+# ----------------------------------------------------------------
+
+
+def compile_filter(filter_):
+    """Translate a Notion filter object into a SQL condition over the ``pages`` table."""
+    if filter_ is None:
+        return "1", []
+    for operator, empty in (("and", "1"), ("or", "0")):
+        if operator in filter_:
+            parts = [compile_filter(f) for f in filter_[operator]]
+            if not parts:
+                return empty, []
+            sql = f" {operator.upper()} ".join(f"({part[0]})" for part in parts)
+            return sql, [param for part in parts for param in part[1]]
+    if "timestamp" in filter_:
+        timestamp = filter_["timestamp"]
+        if timestamp != "last_edited_time":
+            raise ValueError(f"Unsupported timestamp filter: {timestamp}")
+        return _compile_date(("last_edited_time", []), filter_[timestamp])
+
+    prop = filter_.get("property")
+    if not prop or '"' in prop:
+        raise ValueError(f"Unsupported property name: {prop!r}")
+    for filter_type, (key, compile_condition) in _COMPILERS.items():
+        if filter_type in filter_:
+            # JSON パスはパラメータで渡すのでプロパティ名を SQL に埋め込まない
+            column = ("json_extract(properties, ?)", [f'$."{prop}".{key}'])
+            return compile_condition(column, filter_[filter_type])
+    raise ValueError(f"Unsupported filter: {filter_}")
+
+
+def _single_condition(condition):
+    if len(condition) != 1:
+        raise ValueError(f"Exactly one condition is required, got {condition}")
+    return next(iter(condition.items()))
+
+
+def _compile_number(column, condition):
+    name, value = _single_condition(condition)
+    return _compare(column, name, value, _NUMBER_OPERATORS)
+
+
+def _compile_text(column, condition):
+    name, value = _single_condition(condition)
+    path = column[1][0].rsplit(".", 1)[0]
+    # rich_text / title の plain_text を連結した値で比較する
+    plain_text = (
+        "ifnull((SELECT group_concat(json_extract(value, '$.plain_text'), '') "
+        "FROM json_each(properties, ?)), '')"
+    )
+    column = (
+        f"nullif({plain_text} || {plain_text}, '')",
+        [f"{path}.rich_text", f"{path}.title"],
+    )
+    pattern = _LIKE_PATTERNS.get(name)
+    if pattern is None:
+        return _compare(column, name, value, _TEXT_OPERATORS)
+    # LIKE は ASCII の大文字小文字を区別しない
+    sql, params = f"{column[0]} LIKE ? ESCAPE '\\'", [
+        *column[1],
+        pattern.format(_escape_like(value)),
+    ]
+    if name == "does_not_contain":
+        return f"NOT ifnull({sql}, 0)", params
+    return sql, params
+
+
+def _compile_select(column, condition):
+    name, value = _single_condition(condition)
+    return _compare(column, name, value, _SELECT_OPERATORS)
+
+
+def _compile_multi_select(column, condition):
+    name, value = _single_condition(condition)
+    options = "json_each(properties, ?)"
+    path = column[1]
+    if name in ("contains", "does_not_contain"):
+        sql = (
+            f"EXISTS (SELECT 1 FROM {options} "
+            "WHERE json_extract(value, '$.name') = ?)"
+        )
+        if name == "does_not_contain":
+            sql = f"NOT {sql}"
+        return sql, [*path, value]
+    count = f"(SELECT COUNT(*) FROM {options})"
+    if name == "is_empty":
+        return f"{count} = 0", path
+    if name == "is_not_empty":
+        return f"{count} > 0", path
+    raise ValueError(f"Unsupported multi_select condition: {name}")
+
+
+def _compile_date(column, condition):
+    name, value = _single_condition(condition)
+    if isinstance(value, str) and len(value) == 10:
+        # 日付のみの条件は日付部分だけを比較する
+        column = (f"substr({column[0]}, 1, 10)", column[1])
+    return _compare(column, name, value, _DATE_OPERATORS)
+
+
+def _compile_checkbox(column, condition):
+    name, value = _single_condition(condition)
+    if name not in ("equals", "does_not_equal"):
+        raise ValueError(f"Unsupported checkbox condition: {name}")
+    operator = "=" if name == "equals" else "!="
+    return f"{column[0]} {operator} ?", [*column[1], int(bool(value))]
+
+
+def _compare(column, name, value, operators):
+    sql, params = column
+    if name == "is_empty":
+        return f"{sql} IS NULL", params
+    if name == "is_not_empty":
+        return f"{sql} IS NOT NULL", params
+    if name == "does_not_equal":
+        # 空のセルも「等しくない」に含める
+        return f"({sql} IS NULL OR {sql} != ?)", [*params, *params, value]
+    operator = operators.get(name)
+    if operator is None:
+        raise ValueError(f"Unsupported condition: {name}")
+    return f"{sql} {operator} ?", [*params, value]
+
+
+def _escape_like(value):
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+_NUMBER_OPERATORS = {
+    "equals": "=",
+    "greater_than": ">",
+    "less_than": "<",
+    "greater_than_or_equal_to": ">=",
+    "less_than_or_equal_to": "<=",
+}
+_TEXT_OPERATORS = {"equals": "="}
+_SELECT_OPERATORS = {"equals": "="}
+_DATE_OPERATORS = {
+    "equals": "=",
+    "before": "<",
+    "after": ">",
+    "on_or_before": "<=",
+    "on_or_after": ">=",
+}
+_LIKE_PATTERNS = {
+    "contains": "%{}%",
+    "does_not_contain": "%{}%",
+    "starts_with": "{}%",
+    "ends_with": "%{}",
+}
+
+# filter_type -> (プロパティ内のキー, コンパイラ)
+_COMPILERS = {
+    "number": ("number", _compile_number),
+    "rich_text": ("rich_text", _compile_text),
+    "title": ("title", _compile_text),
+    "select": ("select.name", _compile_select),
+    "multi_select": ("multi_select", _compile_multi_select),
+    "date": ("date.start", _compile_date),
+    "checkbox": ("checkbox", _compile_checkbox),
+}
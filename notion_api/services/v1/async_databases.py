@@ -0,0 +1,117 @@
+from notion_api.utils.exceptions import APIClientNotFountError
+from .v1_base_service import AsyncBaseService, schema_cache_key
+from .databases import (
+    build_database_payload,
+    build_update_payload,
+    query_endpoint,
+    validate_filter_params,
+    validate_record_data,
+)
+from notion_api.domains.databases_domain import (
+    NewDatabase,
+    DatabaseTitle,
+    FilteredDatabaseRecord,
+)
+from notion_api.utils.database_record_ops import DatabaseRecord
+from notion_api.utils.pagination import aiter_query_pages
+
+
+class AsyncDataBaseService(AsyncBaseService):
+    async def get_notion_databases(self, database_id, use_cache=True):
+        cache = self.schema_cache
+        if not cache.enabled:
+            return NewDatabase(await self.client.get(f"v1/databases/{database_id}"))
+
+        key = schema_cache_key(database_id)
+        db = cache.get(key) if use_cache else None
+        if db is None:
+            db = cache.put(
+                key, await self.client.get(f"v1/databases/{database_id}"), NewDatabase
+            )
+        return db
+
+    async def create_notion_database(
+        self, title: DatabaseTitle, parent_id: str, properties: dict
+    ):
+        data = build_database_payload(title, parent_id, properties)
+        return await self.client.post("v1/databases", data)
+
+    async def iter_query_results(
+        self,
+        database_id: str,
+        body: dict = None,
+        page_size: int = None,
+        limit: int = None,
+        filter_properties: list = None,
+    ):
+        async for page in aiter_query_pages(
+            self.client.post,
+            query_endpoint(database_id, filter_properties),
+            body,
+            page_size,
+            limit=limit,
+        ):
+            for result in page["results"]:
+                yield result
+
+    async def iter_database_records(self, database_id: str, page_size: int = None):
+        async for p in self.iter_query_results(database_id, page_size=page_size):
+            yield p["properties"]
+
+    async def iter_filtered_records(
+        self, database_id: str, filter_params: dict, page_size: int = None
+    ):
+        validate_filter_params(filter_params)
+        async for p in self.iter_query_results(database_id, filter_params, page_size):
+            yield FilteredDatabaseRecord.from_dict(p)
+
+    async def get_database_records(self, database_id: str, page_size: int = None):
+        return [p async for p in self.iter_database_records(database_id, page_size)]
+
+    async def filter_database_records(
+        self, database_id: str, filter_params: dict, page_size: int = None
+    ):
+        return [
+            p
+            async for p in self.iter_filtered_records(
+                database_id, filter_params, page_size
+            )
+        ]
+
+    async def insert_record(self, database_id: str, record_data: dict):
+        validate_record_data(database_id, record_data)
+
+        response = await self.client.post("v1/pages", record_data)
+
+        if isinstance(response, dict) and response.get("code") == 200:
+            return response["body"]
+        else:
+            raise APIClientNotFountError(f"Failed to insert record: {response}")
+
+    async def update_record(self, page_id: str, record: DatabaseRecord):
+        if not page_id:
+            raise ValueError("Page ID is required")
+
+        data = build_update_payload(record)
+
+        response = await self.client.patch(f"v1/pages/{page_id}", data)
+
+        if response["code"] == 200:
+            return response["body"]
+        else:
+            raise APIClientNotFountError(f"Failed to update record: {response}")
+
+    async def delete_record(self, page_id: str):
+        if not page_id:
+            raise ValueError("Page ID is required")
+
+        data = {"archived": True}
+
+        response = await self.client.patch(f"v1/pages/{page_id}", data)
+
+        if response["code"] == 200:
+            return response["body"]
+        else:
+            raise APIClientNotFountError(
+                f"Failed to delete (archive) record: {response}"
+            )
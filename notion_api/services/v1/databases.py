@@ -1,11 +1,11 @@
 import sys
 import os
+from urllib.parse import urlencode
 
 module_path = os.path.join(os.path.dirname(__file__), "..", "..")
 sys.path.append(module_path)
-from notion_api.utils.client import BaseAPIClient
 from notion_api.utils.exceptions import APIClientNotFountError
-from .v1_base_service import BaseService
+from .v1_base_service import BaseService, schema_cache_key
 from notion_api.domains.databases_domain import (
     NewDatabase,
     CreateDatabaseParams,
@@ -16,63 +16,300 @@ from notion_api.domains.databases_domain import (
     DatabaseTitle,
 )
 from notion_api.utils.database_record_ops import DatabaseRecord
+from notion_api.utils.pagination import iter_query_pages
+from notion_api.utils.filter_evaluator import sort_pages
+from notion_api.utils.filter_tree import combine, simplify, split_filter
+from notion_api.utils.partition import (
+    DEFAULT_PARTITIONS,
+    PARTITION_TYPES,
+    TIMESTAMP_PARTITIONS,
+    partition_filters,
+    scan_partitions,
+)
 from notion_api.domains.databases_domain import FilteredDatabaseRecord
 
 
+def build_database_payload(title: DatabaseTitle, parent_id: str, properties: dict):
+    if title is None:
+        raise ValueError("Title is required")
+
+    if parent_id is None:
+        raise ValueError("Parent ID is required")
+    if properties is None:
+        raise ValueError("Properties is required")
+
+    if not isinstance(title, DatabaseTitle):
+        raise ValueError(
+            f"Title must be an instance of DatabaseTitle, got {type(title)} instead"
+        )
+
+    return {
+        "title": [{"type": "text", "text": title.to_dict()}],
+        "parent": {"type": "page_id", "page_id": parent_id},
+        "properties": properties,
+    }
+
+
+def validate_filter_params(filter_params: dict):
+    if not isinstance(filter_params, dict):
+        raise ValueError(
+            f"Filter params must be a dictionary, got {type(filter_params)} instead"
+        )
+
+
+def validate_record_data(database_id: str, record_data: dict):
+    if not database_id:
+        raise ValueError("Database ID is required")
+    if not record_data:
+        raise ValueError("Record data is required")
+
+    if "parent" not in record_data or "properties" not in record_data:
+        raise ValueError("Invalid record data structure")
+
+
+def query_endpoint(database_id: str, filter_properties=None):
+    endpoint = f"v1/databases/{database_id}/query"
+    if filter_properties:
+        # filter_properties はボディではなくクエリ文字列で渡す
+        query = urlencode([("filter_properties", p) for p in filter_properties])
+        endpoint = f"{endpoint}?{query}"
+    return endpoint
+
+
+def with_sort_properties(schema, sorts, filter_properties):
+    """``filter_properties`` plus the ids ``sorts`` needs, and the names it added.
+
+    Pages merged from several requests are sorted locally, so the sort
+    properties are downloaded even when ``filter_properties`` leaves them out;
+    drop the added names with ``drop_properties`` after sorting.
+    """
+    if not filter_properties or not sorts:
+        return filter_properties, []
+    ids = list(filter_properties)
+    added = []
+    for sort in sorts:
+        prop = schema.properties.get(sort.get("property"))
+        if prop is not None and prop.id not in ids:
+            ids.append(prop.id)
+            added.append(sort["property"])
+    return ids, added
+
+
+def drop_properties(pages, names):
+    if not names:
+        return pages
+    return [
+        dict(
+            page,
+            properties={
+                name: prop
+                for name, prop in page["properties"].items()
+                if name not in names
+            },
+        )
+        for page in pages
+    ]
+
+
+def build_update_payload(record: DatabaseRecord):
+    data = record.to_dict()
+    data.pop("parent", None)  # Remove parent property for updates
+    return data
+
+
 class DataBaseService(BaseService):
-    def get_notion_databases(self, database_id):
-        db = NewDatabase(self.client.get(f"v1/databases/{database_id}"))
+    def get_notion_databases(self, database_id, use_cache=True):
+        cache = self.schema_cache
+        if not cache.enabled:
+            return NewDatabase(self.client.get(f"v1/databases/{database_id}"))
+
+        key = schema_cache_key(database_id)
+        db = cache.get(key) if use_cache else None
+        if db is None:
+            db = cache.put(
+                key, self.client.get(f"v1/databases/{database_id}"), NewDatabase
+            )
         return db
 
     def create_notion_database(
         self, title: DatabaseTitle, parent_id: str, properties: dict
     ):
-        if title is None:
-            raise ValueError("Title is required")
+        data = build_database_payload(title, parent_id, properties)
+        return self.client.post("v1/databases", data)
 
-        if parent_id is None:
-            raise ValueError("Parent ID is required")
-        if properties is None:
+    def update_notion_database(self, database_id: str, properties: dict):
+        if not database_id:
+            raise ValueError("Database ID is required")
+        if not properties:
             raise ValueError("Properties is required")
 
-        if not isinstance(title, DatabaseTitle):
-            raise ValueError(
-                f"Title must be an instance of DatabaseTitle, got {type(title)} instead"
-            )
+        response = self.client.patch(
+            f"v1/databases/{database_id}", {"properties": properties}
+        )
+        self.invalidate_schema(database_id)
 
-        data = {
-            "title": [{"type": "text", "text": title.to_dict()}],
-            "parent": {"type": "page_id", "page_id": parent_id},
-            "properties": properties,
-        }
-        return self.client.post("v1/databases", data)
+        if response["code"] == 200:
+            return response["body"]
+        else:
+            raise APIClientNotFountError(f"Failed to update database: {response}")
+
+    def iter_query_results(
+        self,
+        database_id: str,
+        body: dict = None,
+        page_size: int = None,
+        prefetch: int = 0,
+        limit: int = None,
+        filter_properties: list = None,
+    ):
+        """Yield result pages; ``filter_properties`` is a list of property ids."""
+        for page in iter_query_pages(
+            self.client.post,
+            query_endpoint(database_id, filter_properties),
+            body,
+            page_size,
+            prefetch=prefetch,
+            limit=limit,
+        ):
+            yield from page["results"]
+
+    def query_partitioned(
+        self,
+        database_id: str,
+        body: dict = None,
+        partition_by: str = "created_time",
+        partitions: int = DEFAULT_PARTITIONS,
+        concurrency: int = None,
+        limit: int = None,
+        filter_properties: list = None,
+    ):
+        """Run a query as ``partitions`` disjoint range scans in parallel.
 
-    def get_database_records(self, database_id: str):
-        return [
-            p["properties"]
-            for p in self.client.post(f"v1/databases/{database_id}/query")["body"][
-                "results"
-            ]
-        ]
-
-    def filter_database_records(self, database_id: str, filter_params: dict):
-        if not isinstance(filter_params, dict):
-            raise ValueError(
-                f"Filter params must be a dictionary, got {type(filter_params)} instead"
+        ``partition_by`` is ``"created_time"`` or the name of a number or date
+        property. Its range is read with two single-row queries and cut into
+        contiguous slices; each slice follows its own cursor chain on a worker
+        thread, sharing the client's rate limiter. Returns the merged pages,
+        sorted by ``body["sorts"]`` when given.
+        """
+        body = dict(body or {})
+        base_filter = body.pop("filter", None)
+        target, kind, value_of = self._partition_key(database_id, partition_by)
+        added = []
+        if filter_properties and body.get("sorts"):
+            # 区画の結果はローカルで並べ替えるので並べ替えに使うプロパティも取得する
+            filter_properties, added = with_sort_properties(
+                self.get_notion_databases(database_id),
+                body["sorts"],
+                filter_properties,
             )
-        results = self.client.post(f"v1/databases/{database_id}/query", filter_params)[
-            "body"
-        ]["results"]
-        return [FilteredDatabaseRecord.from_dict(p) for p in results]
+        lower, upper = (
+            self._partition_edge(
+                database_id, base_filter, target, kind, value_of, direction
+            )
+            for direction in ("ascending", "descending")
+        )
 
-    def insert_record(self, database_id: str, record_data: dict):
-        if not database_id:
-            raise ValueError("Database ID is required")
-        if not record_data:
-            raise ValueError("Record data is required")
+        def fetch(partition_filter):
+            pages = {}
+            filter_ = simplify(combine("and", [base_filter, partition_filter]))
+            for f in split_filter(filter_) if filter_ else [None]:
+                query = dict(body, filter=f) if f else body
+                for page in self.iter_query_results(
+                    database_id,
+                    query,
+                    limit=limit,
+                    filter_properties=filter_properties,
+                ):
+                    pages.setdefault(page["id"], page)
+            return list(pages.values())
+
+        filters = partition_filters(target, kind, lower, upper, partitions)
+        merged = {}
+        for pages in scan_partitions(fetch, filters, concurrency):
+            for page in pages:
+                merged.setdefault(page["id"], page)
+        results = list(merged.values())
+        if body.get("sorts"):
+            results = sort_pages(body["sorts"], results)
+        if limit is not None:
+            results = results[:limit]
+        return drop_properties(results, added)
+
+    def _partition_key(self, database_id, partition_by):
+        if partition_by in TIMESTAMP_PARTITIONS:
+            return partition_by, "timestamp", lambda page: page.get(partition_by)
+        prop = self.get_notion_databases(database_id).properties.get(partition_by)
+        if prop is None:
+            raise ValueError(f"Unknown partition property: {partition_by}")
+        if prop.type not in PARTITION_TYPES:
+            raise ValueError(f"Cannot partition on a {prop.type} property")
+
+        def value_of(page):
+            value = (page["properties"].get(partition_by) or {}).get(prop.type)
+            if prop.type == "date":
+                return (value or {}).get("start")
+            return value
 
-        if "parent" not in record_data or "properties" not in record_data:
-            raise ValueError("Invalid record data structure")
+        return partition_by, prop.type, value_of
+
+    def _partition_edge(
+        self, database_id, base_filter, target, kind, value_of, direction
+    ):
+        """Smallest or largest ``target`` value among the matching pages."""
+        if kind == "timestamp":
+            sort, present = {"timestamp": target, "direction": direction}, None
+        else:
+            sort = {"property": target, "direction": direction}
+            present = {"property": target, kind: {"is_not_empty": True}}
+        filter_ = simplify(combine("and", [base_filter, present]))
+        filters = split_filter(filter_) if filter_ else [None]
+        # 境界は偏りにしか影響しないので、分割が必要なら元のフィルタは省く
+        filter_ = filters[0] if len(filters) == 1 else present
+        query = {"sorts": [sort]}
+        if filter_:
+            query["filter"] = filter_
+        page = next(iter(self.iter_query_results(database_id, query, limit=1)), None)
+        return None if page is None else value_of(page)
+
+    def iter_database_records(
+        self, database_id: str, page_size: int = None, prefetch: int = 0
+    ):
+        for p in self.iter_query_results(
+            database_id, page_size=page_size, prefetch=prefetch
+        ):
+            yield p["properties"]
+
+    def iter_filtered_records(
+        self,
+        database_id: str,
+        filter_params: dict,
+        page_size: int = None,
+        prefetch: int = 0,
+    ):
+        validate_filter_params(filter_params)
+        for p in self.iter_query_results(
+            database_id, filter_params, page_size, prefetch
+        ):
+            yield FilteredDatabaseRecord.from_dict(p)
+
+    def get_database_records(
+        self, database_id: str, page_size: int = None, prefetch: int = 0
+    ):
+        return list(self.iter_database_records(database_id, page_size, prefetch))
+
+    def filter_database_records(
+        self,
+        database_id: str,
+        filter_params: dict,
+        page_size: int = None,
+        prefetch: int = 0,
+    ):
+        return list(
+            self.iter_filtered_records(database_id, filter_params, page_size, prefetch)
+        )
+
+    def insert_record(self, database_id: str, record_data: dict):
+        validate_record_data(database_id, record_data)
 
         response = self.client.post("v1/pages", record_data)
 
@@ -85,8 +322,7 @@ class DataBaseService(BaseService):
         if not page_id:
             raise ValueError("Page ID is required")
 
-        data = record.to_dict()
-        data.pop("parent", None)  # Remove parent property for updates
+        data = build_update_payload(record)
 
         response = self.client.patch(f"v1/pages/{page_id}", data)
 
@@ -1,5 +1,25 @@
 from notion_api.utils.client import BaseAPIClient
+from notion_api.utils.async_client import AsyncBaseAPIClient
+from notion_api.utils.cache import SchemaCache
 
 
 class BaseService:
     client = BaseAPIClient()
+    schema_cache = SchemaCache()
+
+    def invalidate_schema(self, database_id=None):
+        self.schema_cache.invalidate(schema_cache_key(database_id))
+
+
+class AsyncBaseService:
+    client = AsyncBaseAPIClient()
+    # 同期・非同期サービスで同じスキーマキャッシュを共有する
+    schema_cache = BaseService.schema_cache
+
+    def invalidate_schema(self, database_id=None):
+        self.schema_cache.invalidate(schema_cache_key(database_id))
+
+
+def schema_cache_key(database_id):
+    # ハイフンの有無に関係なく同じデータベースとして扱う
+    return database_id.replace("-", "") if database_id else database_id
@@ -0,0 +1 @@
+from .fake_server import FakeNotionServer, FakeNotionError
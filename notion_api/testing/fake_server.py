@@ -0,0 +1,562 @@
+import json
+import re
+import threading
+import time
+import uuid
+from collections import deque
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+
+from notion_api.utils.filter_evaluator import filter_pages, sort_pages
+from notion_api.utils.filter_tree import MAX_COMPOUND_DEPTH, depth
+from notion_api.utils.pagination import MAX_PAGE_SIZE
+
+_ANNOTATIONS = {
+    "bold": False,
+    "italic": False,
+    "strikethrough": False,
+    "underline": False,
+    "code": False,
+    "color": "default",
+}
+_USER = {"object": "user", "id": "00000000-0000-0000-0000-000000000000"}
+
+_ROUTES = [
+    ("POST", re.compile(r"^v1/databases$"), "create_database"),
+    ("GET", re.compile(r"^v1/databases/([^/]+)$"), "get_database"),
+    ("PATCH", re.compile(r"^v1/databases/([^/]+)$"), "update_database"),
+    ("POST", re.compile(r"^v1/databases/([^/]+)/query$"), "query_database"),
+    ("POST", re.compile(r"^v1/pages$"), "create_page"),
+    ("GET", re.compile(r"^v1/pages/([^/]+)$"), "get_page"),
+    ("PATCH", re.compile(r"^v1/pages/([^/]+)$"), "update_page"),
+]
+
+
+class FakeNotionError(Exception):
+    def __init__(self, status, code, message):
+        super().__init__(message)
+        self.status = status
+        self.code = code
+        self.message = message
+
+    def body(self):
+        return {
+            "object": "error",
+            "status": self.status,
+            "code": self.code,
+            "message": self.message,
+        }
+
+
+def _now():
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
+
+
+def _key(object_id):
+    return object_id.replace("-", "")
+
+
+def _rich_text(items):
+    result = []
+    for item in items or []:
+        text = item.get("text") or {}
+        content = text.get("content", item.get("plain_text", ""))
+        result.append(
+            {
+                "type": "text",
+                "text": {"content": content, "link": text.get("link")},
+                "annotations": dict(_ANNOTATIONS),
+                "plain_text": content,
+                "href": None,
+            }
+        )
+    return result
+
+
+def _empty_value(type_):
+    return {"title": [], "rich_text": [], "multi_select": [], "checkbox": False}.get(
+        type_
+    )
+
+
+class FakeNotionServer:
+    """In-process HTTP server implementing the subset of the Notion API used here.
+
+    Supports ``v1/databases`` (create/get/update), ``v1/databases/{id}/query``
+    with filters and cursor pagination, and ``v1/pages`` (create/get/update,
+    including archiving). ``latency`` delays every response, ``rate_limit_every``
+    answers every Nth request with 429, and ``fail_next`` queues error responses.
+    ``max_page_size`` caps the number of results in one query response.
+
+    ::
+
+        with FakeNotionServer() as server:
+            BaseService.client = server.client()
+    """
+
+    def __init__(
+        self,
+        latency=0.0,
+        rate_limit_every=0,
+        retry_after=0,
+        max_page_size=100,
+        default_page_size=100,
+        host="127.0.0.1",
+        port=0,
+    ):
+        self.latency = latency
+        self.rate_limit_every = rate_limit_every
+        self.retry_after = retry_after
+        self.max_page_size = max_page_size
+        self.default_page_size = default_page_size
+        self.host = host
+        self.port = port
+        self.databases = {}
+        self.pages = {}
+        self.requests = []
+        self._failures = deque()
+        self._lock = threading.RLock()
+        self._httpd = None
+        self._thread = None
+
+    # ------------------------------------------------------------
+    # lifecycle
+    # ------------------------------------------------------------
+
+    @property
+    def url(self):
+        if self._httpd is None:
+            raise RuntimeError("Server is not running")
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def start(self):
+        fake = self
+
+        class Handler(_Handler):
+            server_fake = fake
+
+        self._httpd = ThreadingHTTPServer((self.host, self.port), Handler)
+        self._httpd.daemon_threads = True
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, name="fake-notion", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._thread.join()
+            self._httpd = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def client(self, **kwargs):
+        """A ``BaseAPIClient`` pointed at this server (no rate limiting by default)."""
+        from notion_api.utils.client import BaseAPIClient
+
+        kwargs.setdefault("rate_limiter", None)
+        return BaseAPIClient(api_key="fake", base_url=self.url, **kwargs)
+
+    def async_client(self, **kwargs):
+        from notion_api.utils.async_client import AsyncBaseAPIClient
+
+        kwargs.setdefault("rate_limiter", None)
+        return AsyncBaseAPIClient(api_key="fake", base_url=self.url, **kwargs)
+
+    def fail_next(self, status=429, count=1, code=None):
+        """Answer the next ``count`` requests with ``status``."""
+        with self._lock:
+            self._failures.extend([(status, code)] * count)
+
+    # ------------------------------------------------------------
+    # seeding
+    # ------------------------------------------------------------
+
+    def add_database(self, properties, title="Untitled", parent_id=None, id=None):
+        """Create a database directly and return its id."""
+        return self._create_database(
+            {
+                "title": [{"type": "text", "text": {"content": title}}],
+                "parent": {
+                    "type": "page_id",
+                    "page_id": parent_id or str(uuid.uuid4()),
+                },
+                "properties": properties,
+            },
+            database_id=id,
+        )["id"]
+
+    def add_page(self, database_id, properties, created_time=None):
+        page = self._create_page(
+            {"parent": {"database_id": database_id}, "properties": properties}
+        )
+        if created_time is not None:
+            self.pages[_key(page["id"])]["created_time"] = created_time
+            page["created_time"] = created_time
+        return page
+
+    # ------------------------------------------------------------
+    # request dispatch
+    # ------------------------------------------------------------
+
+    def handle(self, method, path, body):
+        """Return ``(status, body, headers)`` for one request."""
+        path, _, query_string = path.partition("?")
+        path = path.strip("/")
+        params = parse_qs(query_string)
+        with self._lock:
+            self.requests.append((method, path))
+            count = len(self.requests)
+            failure = self._failures.popleft() if self._failures else None
+        if self.latency:
+            time.sleep(self.latency)
+        if failure is None and self.rate_limit_every:
+            if count % self.rate_limit_every == 0:
+                failure = (429, None)
+        if failure is not None:
+            status, code = failure
+            return self._failure(status, code)
+
+        for route_method, pattern, name in _ROUTES:
+            match = pattern.match(path)
+            if match and route_method == method:
+                try:
+                    with self._lock:
+                        result = getattr(self, f"_{name}")(body or {}, *match.groups())
+                except FakeNotionError as e:
+                    return e.status, e.body(), {}
+                if "filter_properties" in params and name == "query_database":
+                    result = _only_properties(result, params["filter_properties"])
+                return 200, result, {}
+        error = FakeNotionError(
+            400, "invalid_request_url", f"Invalid request URL: {method} {path}"
+        )
+        return error.status, error.body(), {}
+
+    def _failure(self, status, code):
+        if status == 429:
+            error = FakeNotionError(429, code or "rate_limited", "Rate limited")
+            return status, error.body(), {"Retry-After": str(self.retry_after)}
+        error = FakeNotionError(status, code or "internal_server_error", "Injected")
+        return status, error.body(), {}
+
+    # ------------------------------------------------------------
+    # databases
+    # ------------------------------------------------------------
+
+    def _get_database_object(self, database_id):
+        database = self.databases.get(_key(database_id))
+        if database is None:
+            raise FakeNotionError(
+                404, "object_not_found", f"Could not find database {database_id}"
+            )
+        return database
+
+    def _create_database(self, body, database_id=None):
+        if "parent" not in body or "properties" not in body:
+            raise FakeNotionError(400, "validation_error", "parent and properties")
+        now = _now()
+        database_id = database_id or str(uuid.uuid4())
+        database = {
+            "object": "database",
+            "id": database_id,
+            "cover": None,
+            "icon": None,
+            "created_time": now,
+            "created_by": dict(_USER),
+            "last_edited_by": dict(_USER),
+            "last_edited_time": now,
+            "title": _rich_text(body.get("title")),
+            "description": [],
+            "is_inline": False,
+            "properties": {},
+            "parent": body["parent"],
+            "url": f"https://www.notion.so/{_key(database_id)}",
+            "public_url": None,
+            "archived": False,
+            "in_trash": False,
+            "request_id": str(uuid.uuid4()),
+        }
+        for name, config in body["properties"].items():
+            self._set_property(database, name, config)
+        if not any(p["type"] == "title" for p in database["properties"].values()):
+            raise FakeNotionError(400, "validation_error", "Title property is missing")
+        self.databases[_key(database_id)] = database
+        return database
+
+    def _get_database(self, body, database_id):
+        return self._get_database_object(database_id)
+
+    def _update_database(self, body, database_id):
+        database = self._get_database_object(database_id)
+        for name, config in (body.get("properties") or {}).items():
+            if name not in database["properties"] and config is not None:
+                if "name" in config and len(config) == 1:
+                    raise FakeNotionError(
+                        400, "validation_error", f"{name} is not a property"
+                    )
+            if config is None:
+                database["properties"].pop(name, None)
+                continue
+            config = dict(config)
+            new_name = config.pop("name", None)
+            if new_name and new_name != name:
+                prop = database["properties"].pop(name)
+                prop["name"] = new_name
+                database["properties"][new_name] = prop
+                self._rename_in_pages(database["id"], name, new_name)
+                name = new_name
+            if config:
+                self._set_property(database, name, config)
+        database["last_edited_time"] = _now()
+        return database
+
+    def _set_property(self, database, name, config):
+        type_, type_config = next(iter(config.items()))
+        prop = database["properties"].get(name)
+        if prop is None:
+            # Notion のタイトルプロパティの ID は常に "title"
+            prop_id = "title" if type_ == "title" else uuid.uuid4().hex[:4]
+            prop = {"id": prop_id, "name": name}
+            database["properties"][name] = prop
+        elif prop["type"] != type_:
+            prop.pop(prop["type"], None)
+        prop["type"] = type_
+        if type_ in ("select", "multi_select"):
+            existing = {
+                o["name"]: o for o in (prop.get(type_) or {}).get("options", [])
+            }
+            options = []
+            for option in (type_config or {}).get("options", []):
+                current = existing.get(option["name"])
+                options.append(
+                    current
+                    or {
+                        "id": uuid.uuid4().hex[:8],
+                        "name": option["name"],
+                        "color": option.get("color", "default"),
+                        "description": None,
+                    }
+                )
+            type_config = {"options": options}
+        prop[type_] = type_config or {}
+
+    def _rename_in_pages(self, database_id, old_name, new_name):
+        for page in self.pages.values():
+            if _key(page["parent"]["database_id"]) == _key(database_id):
+                if old_name in page["properties"]:
+                    page["properties"][new_name] = page["properties"].pop(old_name)
+
+    def _query_database(self, body, database_id):
+        database = self._get_database_object(database_id)
+        page_size = body.get("page_size", self.default_page_size)
+        if not 1 <= page_size <= MAX_PAGE_SIZE:
+            raise FakeNotionError(
+                400, "validation_error", f"page_size must be 1..{MAX_PAGE_SIZE}"
+            )
+        page_size = min(page_size, self.max_page_size)
+        if depth(body.get("filter")) > MAX_COMPOUND_DEPTH:
+            raise FakeNotionError(
+                400, "validation_error", "Filters can only be nested two levels deep"
+            )
+        pages = [
+            self._page_view(page, database)
+            for page in self.pages.values()
+            if _key(page["parent"]["database_id"]) == _key(database["id"])
+            and not page["archived"]
+        ]
+        try:
+            pages = sort_pages(body.get("sorts"), filter_pages(body, pages))
+        except (KeyError, ValueError, TypeError) as e:
+            raise FakeNotionError(400, "validation_error", f"Invalid filter: {e}")
+
+        start = 0
+        cursor = body.get("start_cursor")
+        if cursor:
+            ids = [page["id"] for page in pages]
+            if cursor not in ids:
+                raise FakeNotionError(400, "validation_error", "Invalid start_cursor")
+            start = ids.index(cursor)
+        results = pages[start : start + page_size]
+        has_more = start + page_size < len(pages)
+        return {
+            "object": "list",
+            "results": results,
+            "next_cursor": pages[start + page_size]["id"] if has_more else None,
+            "has_more": has_more,
+            "type": "page_or_database",
+            "page_or_database": {},
+            "request_id": str(uuid.uuid4()),
+        }
+
+    # ------------------------------------------------------------
+    # pages
+    # ------------------------------------------------------------
+
+    def _get_page_object(self, page_id):
+        page = self.pages.get(_key(page_id))
+        if page is None:
+            raise FakeNotionError(
+                404, "object_not_found", f"Could not find page {page_id}"
+            )
+        return page
+
+    def _create_page(self, body):
+        parent = body.get("parent") or {}
+        database = self._get_database_object(parent.get("database_id", ""))
+        now = _now()
+        page = {
+            "object": "page",
+            "id": str(uuid.uuid4()),
+            "created_time": now,
+            "last_edited_time": now,
+            "created_by": dict(_USER),
+            "last_edited_by": dict(_USER),
+            "cover": None,
+            "icon": None,
+            "parent": {"type": "database_id", "database_id": database["id"]},
+            "archived": False,
+            "in_trash": False,
+            "properties": {},
+            "url": "",
+            "public_url": None,
+        }
+        self._write_properties(page, database, body.get("properties") or {})
+        self.pages[_key(page["id"])] = page
+        return self._page_view(page, database)
+
+    def _get_page(self, body, page_id):
+        page = self._get_page_object(page_id)
+        return self._page_view(page, self._page_database(page))
+
+    def _update_page(self, body, page_id):
+        page = self._get_page_object(page_id)
+        database = self._page_database(page)
+        if "archived" in body or "in_trash" in body:
+            page["archived"] = page["in_trash"] = bool(
+                body.get("archived", body.get("in_trash"))
+            )
+        self._write_properties(page, database, body.get("properties") or {})
+        page["last_edited_time"] = _now()
+        return self._page_view(page, database)
+
+    def _page_database(self, page):
+        return self.databases[_key(page["parent"]["database_id"])]
+
+    def _write_properties(self, page, database, properties):
+        schema = database["properties"]
+        for name, value in properties.items():
+            prop = schema.get(name)
+            if prop is None:
+                raise FakeNotionError(
+                    400, "validation_error", f"{name} is not a property that exists."
+                )
+            type_ = prop["type"]
+            if type_ not in value:
+                raise FakeNotionError(
+                    400,
+                    "validation_error",
+                    f"{name} is expected to be {type_}, got {list(value)}",
+                )
+            page["properties"][name] = self._normalize(prop, value[type_])
+
+    def _normalize(self, prop, value):
+        type_ = prop["type"]
+        if type_ in ("title", "rich_text"):
+            return _rich_text(value)
+        if type_ == "select":
+            return self._option(prop, value["name"]) if value else None
+        if type_ == "multi_select":
+            return [self._option(prop, option["name"]) for option in value or []]
+        if type_ == "date":
+            if not value:
+                return None
+            return {"start": value["start"], "end": value.get("end"), "time_zone": None}
+        if type_ == "checkbox":
+            return bool(value)
+        return value
+
+    def _option(self, prop, name):
+        # Notion と同じく未知のオプションは書き込み時にスキーマへ追加する
+        options = prop[prop["type"]].setdefault("options", [])
+        for option in options:
+            if option["name"] == name:
+                return {k: option[k] for k in ("id", "name", "color")}
+        option = {
+            "id": uuid.uuid4().hex[:8],
+            "name": name,
+            "color": "default",
+            "description": None,
+        }
+        options.append(option)
+        return {k: option[k] for k in ("id", "name", "color")}
+
+    def _page_view(self, page, database):
+        """The page as the API returns it: every schema property, with id and type."""
+        properties = {}
+        for name, prop in database["properties"].items():
+            type_ = prop["type"]
+            value = page["properties"].get(name, _empty_value(type_))
+            properties[name] = {"id": prop["id"], "type": type_, type_: value}
+        return {**page, "properties": properties}
+
+
+def _only_properties(result, filter_properties):
+    wanted = set(filter_properties)
+    return dict(
+        result,
+        results=[
+            dict(
+                page,
+                properties={
+                    name: prop
+                    for name, prop in page["properties"].items()
+                    if prop["id"] in wanted or name in wanted
+                },
+            )
+            for page in result["results"]
+        ],
+    )
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_fake = None
+
+    def _dispatch(self, method):
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        try:
+            body = json.loads(raw) if raw else None
+        except ValueError:
+            status, payload, headers = 400, {"code": "invalid_json"}, {}
+        else:
+            status, payload, headers = self.server_fake.handle(method, self.path, body)
+        data = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def do_PATCH(self):
+        self._dispatch("PATCH")
+
+    def log_message(self, format, *args):
+        pass
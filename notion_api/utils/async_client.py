@@ -0,0 +1,205 @@
+import asyncio
+
+from notion_api.config.settings import (
+    API_BASE_URL,
+    API_KEY,
+    CONNECT_TIMEOUT,
+    READ_TIMEOUT,
+)
+from notion_api.utils.exceptions import APIResponseError
+from notion_api.utils.instrumentation import get_instrumentation
+from notion_api.utils.rate_limit import get_rate_limiter
+from notion_api.utils.retry import RetryPolicy, error_from_response, is_idempotent
+
+try:
+    import httpx
+except ImportError:  # httpx は非同期クライアントを使う場合のみ必要
+    httpx = None
+
+_UNSET = object()
+
+
+class AsyncBaseAPIClient:
+    """asyncio client for the Notion API backed by one pooled ``httpx.AsyncClient``.
+
+    The underlying connection pool is created lazily on first use and is bound to
+    the running event loop. When the client is used from another loop, the old
+    pool is closed and a new one is created.
+    """
+
+    def __init__(
+        self,
+        api_key=None,
+        max_connections=100,
+        max_keepalive=20,
+        rate_limiter=_UNSET,
+        retry_policy=None,
+        instrumentation=_UNSET,
+        base_url=API_BASE_URL,
+    ):
+        self.base_url = base_url
+        self.headers = {
+            "Content-Type": "application/json",
+            "Notion-Version": "2022-06-28",
+        }
+        if api_key:
+            self.headers.update({"Authorization": f"Bearer {api_key}"})
+        else:
+            self.headers.update({"Authorization": f"Bearer {API_KEY}"})
+        self.max_connections = max_connections
+        self.max_keepalive = max_keepalive
+        # 未指定の場合はプロセス共通のレートリミッターを使う
+        self._rate_limiter = rate_limiter
+        self.retry_policy = retry_policy or RetryPolicy()
+        self._instrumentation = instrumentation
+        self._session = None
+        self._loop = None
+
+    @property
+    def rate_limiter(self):
+        if self._rate_limiter is _UNSET:
+            return get_rate_limiter()
+        return self._rate_limiter
+
+    @property
+    def instrumentation(self):
+        if self._instrumentation is _UNSET:
+            return get_instrumentation()
+        return self._instrumentation
+
+    async def _get_session(self):
+        if httpx is None:
+            raise ImportError(
+                "AsyncBaseAPIClient requires httpx. Install it with `pip install httpx`."
+            )
+        loop = asyncio.get_running_loop()
+        if self._session is not None and self._loop is not loop:
+            # 別のループで作ったクライアントは閉じてから作り直す
+            stale, stale_loop = self._session, self._loop
+            self._session = self._loop = None
+            await _close_session(stale, stale_loop)
+        if self._session is None or self._session.is_closed:
+            self._session = httpx.AsyncClient(
+                headers=self.headers,
+                timeout=httpx.Timeout(READ_TIMEOUT, connect=CONNECT_TIMEOUT),
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_keepalive,
+                ),
+            )
+            self._loop = loop
+        return self._session
+
+    async def get(self, endpoint, params=None, **kwargs):
+        return await self._send("GET", endpoint, params=params, **kwargs)
+
+    async def post(self, endpoint, data=None, **kwargs):
+        return await self._send("POST", endpoint, json=data, **kwargs)
+
+    async def patch(self, endpoint, data=None, **kwargs):
+        return await self._send("PATCH", endpoint, json=data, **kwargs)
+
+    async def _send(self, method, endpoint, **kwargs):
+        instrumentation = self.instrumentation
+        if instrumentation is None:
+            return await self._send_with_retries(method, endpoint, None, **kwargs)
+        event = instrumentation.start(method, endpoint)
+        try:
+            result = await self._send_with_retries(method, endpoint, event, **kwargs)
+        except BaseException as e:
+            instrumentation.finish(event, error=e)
+            raise
+        instrumentation.finish(event)
+        return result
+
+    async def _send_with_retries(self, method, endpoint, event, **kwargs):
+        url = f"{self.base_url.rstrip('/')}/{endpoint}"
+        idempotent = is_idempotent(method, endpoint)
+        attempt = 0
+        while True:
+            rate_limiter = self.rate_limiter
+            if rate_limiter is not None:
+                await rate_limiter.acquire_async()
+            session = await self._get_session()
+            try:
+                response = await session.request(method, url, **kwargs)
+            except httpx.TransportError as e:
+                if event is not None:
+                    event.retries = attempt
+                if not self.retry_policy.should_retry(attempt):
+                    raise
+                # 送信後のタイムアウトや切断では、書き込みが処理済みかもしれない
+                if not idempotent and not _not_sent(e):
+                    raise
+                delay = self.retry_policy.compute_delay(attempt)
+            else:
+                if event is not None:
+                    event.retries = attempt
+                    event.record_response(
+                        response.status_code,
+                        _request_size(response),
+                        len(response.content),
+                    )
+                try:
+                    return self._handle_response(response, attempts=attempt + 1)
+                except APIResponseError as e:
+                    if not self.retry_policy.should_retry(
+                        attempt, e.status_code, idempotent
+                    ):
+                        raise
+                    delay = self.retry_policy.compute_delay(attempt, e.retry_after)
+                    if e.retry_after is not None and rate_limiter is not None:
+                        rate_limiter.pause(e.retry_after)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def aclose(self):
+        if self._session is not None:
+            session, loop = self._session, self._loop
+            self._session = self._loop = None
+            await _close_session(session, loop)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    def _handle_response(self, response, attempts=1):
+        if response.status_code == 200:
+            return {"code": 200, "body": response.json()}
+        else:
+            try:
+                body = response.json()
+            except ValueError:
+                body = response.text
+            raise error_from_response(
+                response.status_code, body, response.headers, attempts=attempts
+            )
+
+
+async def _close_session(session, loop):
+    if loop is not asyncio.get_running_loop() and loop.is_running():
+        # 他のスレッドで動いているループの接続はそのループで閉じる
+        future = asyncio.run_coroutine_threadsafe(session.aclose(), loop)
+        await asyncio.wrap_future(future)
+        return
+    try:
+        await session.aclose()
+    except RuntimeError:
+        # 元のループが閉じていると正常に閉じられない。参照を手放せばソケットは GC で閉じる
+        pass
+
+
+def _not_sent(error):
+    """Whether ``error`` happened before the request reached the server."""
+    return isinstance(
+        error, (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+    )
+
+
+def _request_size(response):
+    try:
+        return len(response.request.content)
+    except (AttributeError, RuntimeError):
+        return 0
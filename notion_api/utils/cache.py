@@ -0,0 +1,262 @@
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+from notion_api.config.settings import (
+    SCHEMA_CACHE_TTL,
+    SCHEMA_CACHE_MAX_ENTRIES,
+    QUERY_CACHE_MAX_BYTES,
+)
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    revalidations: int = 0
+    evictions: int = 0
+    refinements: int = 0
+
+
+@dataclass
+class _Entry:
+    value: Any
+    version: Optional[str]
+    stored_at: float
+
+
+class SchemaCache:
+    """Thread-safe TTL + LRU cache for parsed database objects, keyed by database id.
+
+    When an entry has expired the caller refetches the raw database object; if its
+    body is unchanged the already-parsed value is kept and only its timestamp is
+    refreshed (counted as a revalidation instead of a miss). The body is compared
+    by hash rather than by ``last_edited_time``, which only has minute precision.
+    """
+
+    def __init__(
+        self,
+        ttl=SCHEMA_CACHE_TTL,
+        max_entries=SCHEMA_CACHE_MAX_ENTRIES,
+        clock=time.monotonic,
+    ):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.stats = CacheStats()
+        self._clock = clock
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._listeners = []
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self):
+        return self.ttl > 0 and self.max_entries > 0
+
+    def get(self, key):
+        """Return the cached value if it is still fresh, otherwise ``None``."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or self._clock() - entry.stored_at >= self.ttl:
+                return None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return entry.value
+
+    def put(self, key, raw: Dict[str, Any], parse: Callable[[Dict[str, Any]], Any]):
+        """Store a freshly fetched ``{"code", "body"}`` response and return its parsed value."""
+        version = _body_digest(raw["body"])
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and entry.version == version:
+            value = entry.value
+            revalidated = True
+        else:
+            value = parse(raw)
+            revalidated = False
+
+        with self._lock:
+            if revalidated:
+                self.stats.revalidations += 1
+            else:
+                self.stats.misses += 1
+            self._entries[key] = _Entry(value, version, self._clock())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+        return value
+
+    def invalidate(self, key=None):
+        """Drop one entry, or every entry when ``key`` is ``None``."""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+            listeners = list(self._listeners)
+        for listener in listeners:
+            listener(key)
+
+    def add_invalidation_listener(self, listener: Callable[[Optional[str]], None]):
+        """Call ``listener(key)`` whenever an entry (or everything, ``None``) is invalidated."""
+        with self._lock:
+            self._listeners.append(listener)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+
+def _body_digest(body):
+    canonical = json.dumps(body, sort_keys=True)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def canonical_filter(value, parent_key=None):
+    """Normalise a filter tree so that equivalent filters compare equal.
+
+    Dict keys are sorted by ``json.dumps`` later; the operands of ``and``/``or``
+    are sorted here because their order does not change the result.
+    """
+    if isinstance(value, dict):
+        return {k: canonical_filter(v, k) for k, v in value.items()}
+    if isinstance(value, list):
+        items = [canonical_filter(v) for v in value]
+        if parent_key in ("and", "or"):
+            items.sort(key=lambda item: json.dumps(item, sort_keys=True))
+        return items
+    return value
+
+
+def filter_conjuncts(filter_params):
+    """The top-level ``and`` operands of a query body as canonical JSON strings."""
+    filter_ = canonical_filter((filter_params or {}).get("filter"))
+    if filter_ is None:
+        return frozenset()
+    parts = filter_["and"] if list(filter_) == ["and"] else [filter_]
+    return frozenset(json.dumps(part, sort_keys=True) for part in parts)
+
+
+def filter_cache_key(database_id, filter_params):
+    canonical = json.dumps(canonical_filter(filter_params), sort_keys=True)
+    digest = hashlib.sha256(canonical.encode()).hexdigest()
+    return f"{database_id.replace('-', '')}:{digest}"
+
+
+@dataclass
+class _QueryEntry:
+    value: Any
+    database_id: str
+    size: int
+    stored_at: float
+    conjuncts: Optional[frozenset] = None
+
+
+class QueryCache:
+    """Thread-safe LRU cache of query results bounded by total size in bytes.
+
+    The TTL is supplied by the caller on every ``get`` so that each model can use
+    its own. ``invalidate_database`` drops every result of a database and makes
+    results fetched concurrently with the invalidation unstorable.
+    """
+
+    def __init__(self, max_bytes=QUERY_CACHE_MAX_BYTES, clock=time.monotonic):
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+        self.size = 0
+        self._clock = clock
+        self._entries: "OrderedDict[str, _QueryEntry]" = OrderedDict()
+        self._generations: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def generation(self, database_id):
+        with self._lock:
+            return self._generations.get(database_id.replace("-", ""), 0)
+
+    def get(self, key, ttl):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._clock() - entry.stored_at < ttl:
+                self._entries.move_to_end(key)
+                self.stats.hits += 1
+                return entry.value
+            if entry is not None:
+                self._remove(key)
+            self.stats.misses += 1
+            return None
+
+    def find_superset(self, database_id, filter_params, ttl):
+        """Return fresh cached results of a query whose filter is implied by ``filter_params``.
+
+        A cached query qualifies when its ``and`` operands are a subset of the new
+        query's, so the new results can be computed by filtering the cached ones.
+        """
+        database_id = database_id.replace("-", "")
+        conjuncts = filter_conjuncts(filter_params)
+        now = self._clock()
+        with self._lock:
+            for key, entry in reversed(self._entries.items()):
+                if (
+                    entry.database_id == database_id
+                    and entry.conjuncts is not None
+                    and entry.conjuncts <= conjuncts
+                    and now - entry.stored_at < ttl
+                ):
+                    self._entries.move_to_end(key)
+                    self.stats.refinements += 1
+                    return entry.value
+        return None
+
+    def put(self, key, database_id, value, generation=None, filter_params=None):
+        """Store ``value`` (a JSON-serialisable list of pages) unless invalidated since ``generation``.
+
+        Pass ``filter_params`` to make the entry usable by ``find_superset``.
+        """
+        database_id = database_id.replace("-", "")
+        size = len(json.dumps(value))
+        with self._lock:
+            if generation is not None and generation != self._generations.get(
+                database_id, 0
+            ):
+                return False
+            if size > self.max_bytes:
+                return False
+            if key in self._entries:
+                self._remove(key)
+            conjuncts = (
+                filter_conjuncts(filter_params) if filter_params is not None else None
+            )
+            self._entries[key] = _QueryEntry(
+                value, database_id, size, self._clock(), conjuncts
+            )
+            self.size += size
+            while self.size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.stats.evictions += 1
+            return True
+
+    def invalidate_database(self, database_id):
+        database_id = database_id.replace("-", "")
+        with self._lock:
+            self._generations[database_id] = self._generations.get(database_id, 0) + 1
+            for key in [
+                k for k, e in self._entries.items() if e.database_id == database_id
+            ]:
+                self._remove(key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def _remove(self, key):
+        self.size -= self._entries.pop(key).size
+
+    def __len__(self):
+        return len(self._entries)
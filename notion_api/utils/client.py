@@ -1,11 +1,60 @@
+import threading
+import time
+import weakref
+
 import requests
-from config.settings import API_BASE_URL, TIMEOUT, API_KEY
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import NewConnectionError
+from notion_api.config.settings import (
+    API_BASE_URL,
+    API_KEY,
+    CONNECT_TIMEOUT,
+    READ_TIMEOUT,
+    POOL_CONNECTIONS,
+    POOL_MAXSIZE,
+    SESSION_MODE,
+)
+from notion_api.utils.exceptions import APIResponseError
+from notion_api.utils.instrumentation import get_instrumentation
+from notion_api.utils.rate_limit import get_rate_limiter
+from notion_api.utils.retry import RetryPolicy, error_from_response, is_idempotent
+
+_UNSET = object()
+
+
+SESSION_MODES = ("shared", "per_thread")
 
 
 class BaseAPIClient(requests.Session):
-    def __init__(self, api_key=None):
+    """Synchronous Notion API client.
+
+    In ``"shared"`` session mode every thread sends through this session's
+    connection pool (``pool_maxsize`` connections per host). In ``"per_thread"``
+    mode each thread gets its own session with the same headers and pool
+    settings, so threads never wait on each other's connections; a thread's
+    session is closed once the thread has exited and been collected.
+    ``keep_alive=False`` closes the connection after every request.
+    """
+
+    def __init__(
+        self,
+        api_key=None,
+        rate_limiter=_UNSET,
+        retry_policy=None,
+        instrumentation=_UNSET,
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        pool_block=False,
+        connect_timeout=CONNECT_TIMEOUT,
+        read_timeout=READ_TIMEOUT,
+        keep_alive=True,
+        session_mode=SESSION_MODE,
+        base_url=API_BASE_URL,
+    ):
+        if session_mode not in SESSION_MODES:
+            raise ValueError(f"Session mode must be one of {SESSION_MODES}")
         super().__init__()
-        self.base_url = API_BASE_URL
+        self.base_url = base_url
         self.headers.update(
             {"Content-Type": "application/json", "Notion-Version": "2022-06-28"}
         )
@@ -13,24 +62,155 @@ class BaseAPIClient(requests.Session):
             self.headers.update({"Authorization": f"Bearer {api_key}"})
         else:
             self.headers.update({"Authorization": f"Bearer {API_KEY}"})
+        # 未指定の場合はプロセス共通のレートリミッターを使う
+        self._rate_limiter = rate_limiter
+        self.retry_policy = retry_policy or RetryPolicy()
+        self._instrumentation = instrumentation
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.timeout = (connect_timeout, read_timeout)
+        self.session_mode = session_mode
+        if not keep_alive:
+            self.headers["Connection"] = "close"
+        self._mount_adapters(self)
+        self._local = threading.local()
+        # スレッド -> そのスレッドのセッション。スレッドが破棄されると項目も消える
+        self._thread_sessions = weakref.WeakKeyDictionary()
+        self._thread_sessions_lock = threading.Lock()
+
+    @property
+    def rate_limiter(self):
+        if self._rate_limiter is _UNSET:
+            return get_rate_limiter()
+        return self._rate_limiter
+
+    @property
+    def instrumentation(self):
+        if self._instrumentation is _UNSET:
+            return get_instrumentation()
+        return self._instrumentation
+
+    def _mount_adapters(self, session):
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+    def _session(self):
+        if self.session_mode == "shared":
+            return self
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.headers = self.headers
+            self._mount_adapters(session)
+            self._local.session = session
+            thread = threading.current_thread()
+            with self._thread_sessions_lock:
+                self._thread_sessions[thread] = session
+            # run_bulk などのワーカースレッドが終了したら接続を閉じる
+            weakref.finalize(thread, session.close)
+        return session
+
+    def close(self):
+        with self._thread_sessions_lock:
+            sessions = list(self._thread_sessions.values())
+            self._thread_sessions.clear()
+        for session in sessions:
+            session.close()
+        self._local = threading.local()
+        super().close()
 
     def get(self, endpoint, params=None, **kwargs):
-        url = f"{self.base_url}/{endpoint}"
-        response = super().get(url, params=params, **kwargs)
-        return self._handle_response(response)
+        return self._send("GET", endpoint, params=params, **kwargs)
 
     def post(self, endpoint, data=None, **kwargs):
-        url = f"{self.base_url}/{endpoint}"
-        response = super().post(url, json=data, **kwargs)
-        return self._handle_response(response)
+        return self._send("POST", endpoint, json=data, **kwargs)
 
     def patch(self, endpoint, data=None, **kwargs):
-        url = f"{self.base_url}/{endpoint}"
-        response = super().patch(url, json=data, **kwargs)
-        return self._handle_response(response)
+        return self._send("PATCH", endpoint, json=data, **kwargs)
+
+    def _send(self, method, endpoint, **kwargs):
+        instrumentation = self.instrumentation
+        if instrumentation is None:
+            return self._send_with_retries(method, endpoint, None, **kwargs)
+        event = instrumentation.start(method, endpoint)
+        try:
+            result = self._send_with_retries(method, endpoint, event, **kwargs)
+        except BaseException as e:
+            instrumentation.finish(event, error=e)
+            raise
+        instrumentation.finish(event)
+        return result
+
+    def _send_with_retries(self, method, endpoint, event, **kwargs):
+        url = f"{self.base_url.rstrip('/')}/{endpoint}"
+        kwargs.setdefault("timeout", self.timeout)
+        session = self._session()
+        idempotent = is_idempotent(method, endpoint)
+        attempt = 0
+        while True:
+            rate_limiter = self.rate_limiter
+            if rate_limiter is not None:
+                rate_limiter.acquire()
+            try:
+                response = session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if event is not None:
+                    event.retries = attempt
+                if not self.retry_policy.should_retry(attempt):
+                    raise
+                # 送信後のタイムアウトや切断では、書き込みが処理済みかもしれない
+                if not idempotent and not _not_sent(e):
+                    raise
+                delay = self.retry_policy.compute_delay(attempt)
+            else:
+                if event is not None:
+                    event.retries = attempt
+                    event.record_response(
+                        response.status_code,
+                        _request_size(response),
+                        len(response.content),
+                    )
+                try:
+                    return self._handle_response(response, attempts=attempt + 1)
+                except APIResponseError as e:
+                    if not self.retry_policy.should_retry(
+                        attempt, e.status_code, idempotent
+                    ):
+                        raise
+                    delay = self.retry_policy.compute_delay(attempt, e.retry_after)
+                    if e.retry_after is not None and rate_limiter is not None:
+                        rate_limiter.pause(e.retry_after)
+            time.sleep(delay)
+            attempt += 1
 
-    def _handle_response(self, response):
+    def _handle_response(self, response, attempts=1):
         if response.status_code == 200:
             return {"code": 200, "body": response.json()}
         else:
-            raise Exception(response.json())
+            try:
+                body = response.json()
+            except ValueError:
+                body = response.text
+            raise error_from_response(
+                response.status_code, body, response.headers, attempts=attempts
+            )
+
+
+def _not_sent(error):
+    """Whether ``error`` happened before the request reached the server."""
+    if isinstance(error, requests.ConnectTimeout):
+        return True
+    reason = getattr(error.args[0], "reason", None) if error.args else None
+    return isinstance(reason, NewConnectionError)
+
+
+def _request_size(response):
+    request = getattr(response, "request", None)
+    body = getattr(request, "body", None)
+    return len(body) if body else 0
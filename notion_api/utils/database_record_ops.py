@@ -91,18 +91,8 @@ class DatabaseRecord:
     def add_property(self, name, value, field):
         if name == "Name":
             self.properties[name] = {"title": [{"text": {"content": value}}]}
-        elif isinstance(field, CharField):
-            self.properties[name] = {"rich_text": [{"text": {"content": value}}]}
-        elif isinstance(field, IntegerField):
-            self.properties[name] = {"number": value}
-        elif isinstance(field, SelectField):
-            self.properties[name] = {"select": {"name": value}}
-        elif isinstance(field, MultiSelectField):
-            self.properties[name] = {"multi_select": [{"name": item} for item in value]}
-        elif isinstance(field, DateField):
-            self.properties[name] = {"date": {"start": value}}
-        elif isinstance(field, BoolField):
-            self.properties[name] = {"checkbox": value}
+        elif isinstance(field, BaseField):
+            self.properties[name] = field.serialize(value)
         else:
             raise ValueError(f"Unsupported field type: {type(field)}")
 
@@ -108,7 +108,8 @@ class MultiSelectFilterBuilder(BaseFilterBuilder):
         return self
 
     def build(self):
-        return {"property": self.property_name, self.filter_type: self.condition}
+        # クラス名から作る filter_type は "multiselect" になるが API は "multi_select"
+        return {"property": self.property_name, "multi_select": self.condition}
 
 
 class DateFilterBuilder(BaseFilterBuilder):
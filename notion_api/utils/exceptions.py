@@ -4,6 +4,47 @@ class APIRequestError(Exception):
     pass
 
 
+class APIResponseError(APIRequestError):
+    """Notion API がエラーステータスを返した場合の例外"""
+
+    def __init__(self, status_code, body=None, retry_after=None, attempts=1):
+        self.status_code = status_code
+        self.body = body
+        self.retry_after = retry_after
+        self.attempts = attempts
+        super().__init__(body)
+
+    @property
+    def code(self):
+        if isinstance(self.body, dict):
+            return self.body.get("code")
+        return None
+
+    @property
+    def message(self):
+        if isinstance(self.body, dict):
+            return self.body.get("message", str(self.body))
+        return str(self.body)
+
+    def __str__(self):
+        return (
+            f"{self.status_code} {self.code or ''}: {self.message} "
+            f"(attempts={self.attempts})"
+        )
+
+
+class RateLimitedError(APIResponseError):
+    """429 Too Many Requests がリトライ上限を超えて返された場合の例外"""
+
+    pass
+
+
+class ServerError(APIResponseError):
+    """5xx がリトライ上限を超えて返された場合の例外"""
+
+    pass
+
+
 class APIClientNotFountError(Exception):
     def __init__(self, message):
         super().__init__(message)
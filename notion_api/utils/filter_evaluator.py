@@ -0,0 +1,230 @@
+from typing import Any, Callable, Dict
+
+# 評価規則は LocalReplica の SQL 変換と揃えている:
+# - 空のセルは比較条件に一致せず、does_not_equal / does_not_contain には一致する
+# - テキストの contains / starts_with / ends_with は大文字小文字を区別しない
+# - 日付のみ (YYYY-MM-DD) の条件は日付部分だけを比較する
+
+
+def compile_filter(filter_) -> Callable[[Dict[str, Any]], bool]:
+    """Compile a Notion filter object into a predicate over query result pages."""
+    if filter_ is None:
+        return _always
+    for operator, combine in (("and", all), ("or", any)):
+        if operator in filter_:
+            predicates = [compile_filter(f) for f in filter_[operator]]
+            return lambda page: combine(p(page) for p in predicates)
+    if "timestamp" in filter_:
+        timestamp = filter_["timestamp"]
+        if timestamp not in ("last_edited_time", "created_time"):
+            raise ValueError(f"Unsupported timestamp filter: {timestamp}")
+        test = _compile_date(filter_[timestamp])
+        return lambda page: test(page.get(timestamp))
+
+    prop = filter_.get("property")
+    if not prop:
+        raise ValueError(f"Property is required: {filter_}")
+    for filter_type, (extract, compile_condition) in _EVALUATORS.items():
+        if filter_type in filter_:
+            test = compile_condition(filter_[filter_type])
+
+            def predicate(page, extract=extract, test=test):
+                value = page["properties"].get(prop)
+                return test(None if value is None else extract(value))
+
+            return predicate
+    raise ValueError(f"Unsupported filter: {filter_}")
+
+
+def matches(filter_params, page):
+    """Whether ``page`` is returned by a query with ``filter_params`` (``{"filter": ...}``)."""
+    return compile_filter((filter_params or {}).get("filter"))(page)
+
+
+def filter_pages(filter_params, pages):
+    predicate = compile_filter((filter_params or {}).get("filter"))
+    return [page for page in pages if predicate(page)]
+
+
+def sort_pages(sorts, pages):
+    """Order ``pages`` like a query with ``sorts`` would; empty values sort last.
+
+    Selects are ordered by option name (Notion uses the schema's option order).
+    """
+    pages = list(pages)
+    for sort in reversed(sorts or []):
+        key = _sort_key(sort)
+        keyed = [(key(page), page) for page in pages]
+        present = [item for item in keyed if item[0] is not None]
+        present.sort(
+            key=lambda item: item[0],
+            reverse=sort.get("direction", "ascending") == "descending",
+        )
+        pages = [page for _, page in present]
+        pages += [page for value, page in keyed if value is None]
+    return pages
+
+
+def _sort_key(sort):
+    if "timestamp" in sort:
+        timestamp = sort["timestamp"]
+        return lambda page: page.get(timestamp)
+    prop = sort.get("property")
+    if not prop:
+        raise ValueError(f"Property or timestamp is required: {sort}")
+
+    def key(page):
+        value = page["properties"].get(prop)
+        if value is None:
+            return None
+        type_ = value.get("type") or next(t for t in _EVALUATORS if t in value)
+        extract = _EVALUATORS[type_][0]
+        result = extract(value)
+        if isinstance(result, list):
+            return tuple(result) or None
+        return result
+
+    return key
+
+
+def _always(page):
+    return True
+
+
+def _single_condition(condition):
+    if len(condition) != 1:
+        raise ValueError(f"Exactly one condition is required, got {condition}")
+    return next(iter(condition.items()))
+
+
+# ----------------------------------------------------------------
+# property value extraction
+# ----------------------------------------------------------------
+
+
+def _text(prop):
+    parts = prop.get("rich_text") or prop.get("title") or []
+    return "".join(part["plain_text"] for part in parts) or None
+
+
+def _number(prop):
+    return prop["number"]
+
+
+def _select(prop):
+    select = prop["select"]
+    return select["name"] if select else None
+
+
+def _multi_select(prop):
+    return [option["name"] for option in prop["multi_select"]]
+
+
+def _date(prop):
+    date = prop["date"]
+    return date["start"] if date else None
+
+
+def _checkbox(prop):
+    return bool(prop["checkbox"])
+
+
+# ----------------------------------------------------------------
+# conditions
+# ----------------------------------------------------------------
+
+
+def _compare(name, value, operators):
+    if name == "is_empty":
+        return lambda v: v is None
+    if name == "is_not_empty":
+        return lambda v: v is not None
+    if name == "does_not_equal":
+        return lambda v: v is None or v != value
+    if name not in operators:
+        raise ValueError(f"Unsupported condition: {name}")
+    compare = operators[name]
+    return lambda v: v is not None and compare(v, value)
+
+
+def _compile_number(condition):
+    return _compare(*_single_condition(condition), _NUMBER_OPERATORS)
+
+
+def _compile_text(condition):
+    name, value = _single_condition(condition)
+    if name in _TEXT_MATCHERS:
+        needle = value.casefold()
+        match = _TEXT_MATCHERS[name]
+        if name == "does_not_contain":
+            return lambda v: v is None or needle not in v.casefold()
+        return lambda v: v is not None and match(v.casefold(), needle)
+    return _compare(name, value, _EQUALS)
+
+
+def _compile_select(condition):
+    return _compare(*_single_condition(condition), _EQUALS)
+
+
+def _compile_multi_select(condition):
+    name, value = _single_condition(condition)
+    if name == "contains":
+        return lambda v: v is not None and value in v
+    if name == "does_not_contain":
+        return lambda v: v is None or value not in v
+    if name == "is_empty":
+        return lambda v: not v
+    if name == "is_not_empty":
+        return lambda v: bool(v)
+    raise ValueError(f"Unsupported multi_select condition: {name}")
+
+
+def _compile_date(condition):
+    name, value = _single_condition(condition)
+    test = _compare(name, value, _DATE_OPERATORS)
+    if isinstance(value, str) and len(value) == 10:
+        return lambda v: test(v[:10] if v else None)
+    return test
+
+
+def _compile_checkbox(condition):
+    name, value = _single_condition(condition)
+    if name == "equals":
+        return lambda v: bool(v) == value
+    if name == "does_not_equal":
+        return lambda v: bool(v) != value
+    raise ValueError(f"Unsupported checkbox condition: {name}")
+
+
+_EQUALS = {"equals": lambda a, b: a == b}
+_NUMBER_OPERATORS = {
+    "equals": lambda a, b: a == b,
+    "greater_than": lambda a, b: a > b,
+    "less_than": lambda a, b: a < b,
+    "greater_than_or_equal_to": lambda a, b: a >= b,
+    "less_than_or_equal_to": lambda a, b: a <= b,
+}
+_DATE_OPERATORS = {
+    "equals": lambda a, b: a == b,
+    "before": lambda a, b: a < b,
+    "after": lambda a, b: a > b,
+    "on_or_before": lambda a, b: a <= b,
+    "on_or_after": lambda a, b: a >= b,
+}
+_TEXT_MATCHERS = {
+    "contains": lambda a, b: b in a,
+    "does_not_contain": None,
+    "starts_with": lambda a, b: a.startswith(b),
+    "ends_with": lambda a, b: a.endswith(b),
+}
+
+# filter_type -> (プロパティ値の取り出し, 条件のコンパイラ)
+_EVALUATORS = {
+    "number": (_number, _compile_number),
+    "rich_text": (_text, _compile_text),
+    "title": (_text, _compile_text),
+    "select": (_select, _compile_select),
+    "multi_select": (_multi_select, _compile_multi_select),
+    "date": (_date, _compile_date),
+    "checkbox": (_checkbox, _compile_checkbox),
+}
@@ -0,0 +1,278 @@
+import json
+from typing import Any, Dict, List, Optional
+
+# Notion のフィルタには NOT がないので、否定は条件の置き換えと De Morgan で表す。
+# 範囲条件の否定には空のセルも含める (filter_evaluator と同じ規則)。
+_COMPLEMENTS = {
+    "equals": "does_not_equal",
+    "does_not_equal": "equals",
+    "contains": "does_not_contain",
+    "does_not_contain": "contains",
+    "is_empty": "is_not_empty",
+    "is_not_empty": "is_empty",
+}
+_RANGE_COMPLEMENTS = {
+    "number": {
+        "greater_than": "less_than_or_equal_to",
+        "less_than": "greater_than_or_equal_to",
+        "greater_than_or_equal_to": "less_than",
+        "less_than_or_equal_to": "greater_than",
+    },
+    "date": {
+        "after": "on_or_before",
+        "before": "on_or_after",
+        "on_or_after": "before",
+        "on_or_before": "after",
+    },
+}
+COMPOUND_OPERATORS = ("and", "or")
+
+
+def combine(operator: str, filters: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Join ``filters`` with ``operator``, flattening nested compounds of the same kind.
+
+    Empty compounds are dropped; returns ``None`` when nothing is left.
+    """
+    if operator not in COMPOUND_OPERATORS:
+        raise ValueError(f"Operator must be one of {COMPOUND_OPERATORS}")
+    operands = []
+    for filter_ in filters:
+        if filter_ is None:
+            continue
+        if operator in filter_:
+            operands.extend(filter_[operator])
+        elif any(op in filter_ and not filter_[op] for op in COMPOUND_OPERATORS):
+            continue
+        else:
+            operands.append(filter_)
+    if not operands:
+        return None
+    if len(operands) == 1:
+        return operands[0]
+    return {operator: operands}
+
+
+def negate(filter_: Dict[str, Any]) -> Dict[str, Any]:
+    """A Notion filter object matching exactly the pages ``filter_`` does not."""
+    for operator, other in (("and", "or"), ("or", "and")):
+        if operator in filter_:
+            if not filter_[operator]:
+                raise ValueError("Cannot negate an empty compound filter")
+            return combine(other, [negate(f) for f in filter_[operator]])
+
+    target = {k: v for k, v in filter_.items() if k in ("property", "timestamp")}
+    filter_type = filter_.get("timestamp") or next(
+        (key for key in filter_ if key != "property"), None
+    )
+    if filter_type is None or filter_type not in filter_:
+        raise ValueError(f"Unsupported filter: {filter_}")
+    (name, value), *rest = filter_[filter_type].items()
+    if rest:
+        raise ValueError(f"Exactly one condition is required: {filter_}")
+    condition_type = "date" if "timestamp" in filter_ else filter_type
+
+    def leaf(condition, value):
+        return dict(target, **{filter_type: {condition: value}})
+
+    # タイムスタンプは空にならない
+    empty = [] if "timestamp" in filter_ else [leaf("is_empty", True)]
+    if condition_type == "date" and name == "equals":
+        return {"or": [leaf("before", value), leaf("after", value)] + empty}
+    if name in _COMPLEMENTS:
+        return leaf(_COMPLEMENTS[name], value)
+    complement = _RANGE_COMPLEMENTS.get(condition_type, {}).get(name)
+    if complement is None:
+        raise ValueError(f"Cannot negate {condition_type} condition {name}")
+    return combine("or", [leaf(complement, value)] + empty)
+
+
+# ----------------------------------------------------------------
+# simplification and nesting limits
+# ----------------------------------------------------------------
+
+# Notion は複合フィルタを最上位の下に 2 段までしかネストできない
+MAX_COMPOUND_DEPTH = 3
+# 1 回の検索を分割してよい最大リクエスト数
+MAX_SPLIT_QUERIES = 8
+# 1 リクエストに含める条件数の上限。分配で膨らんだフィルタはこれを超えると分割する
+MAX_FILTER_CONDITIONS = 100
+
+# (下限か上限か, 境界を含むか)
+_BOUNDS = {
+    "greater_than": ("lower", False),
+    "greater_than_or_equal_to": ("lower", True),
+    "less_than": ("upper", False),
+    "less_than_or_equal_to": ("upper", True),
+    "after": ("lower", False),
+    "on_or_after": ("lower", True),
+    "before": ("upper", False),
+    "on_or_before": ("upper", True),
+}
+
+
+def depth(filter_) -> int:
+    """Compound nesting depth: 0 for a property filter, 1 for a flat and/or, ..."""
+    if filter_ is None:
+        return 0
+    for operator in COMPOUND_OPERATORS:
+        if operator in filter_:
+            return 1 + max((depth(f) for f in filter_[operator]), default=0)
+    return 0
+
+
+def simplify(filter_):
+    """Flatten nested compounds of the same kind, drop duplicates and merge ranges.
+
+    ``a > 1 and a > 3`` becomes ``a > 3``; ``a > 1 or a > 3`` becomes ``a > 1``.
+    """
+    if filter_ is None:
+        return None
+    for operator in COMPOUND_OPERATORS:
+        if operator in filter_:
+            operands = [simplify(f) for f in filter_[operator]]
+            combined = combine(operator, operands)
+            if combined is None or operator not in combined:
+                return combined
+            operands = _merge_ranges(operator, _dedupe(combined[operator]))
+            return operands[0] if len(operands) == 1 else {operator: operands}
+    return filter_
+
+
+def split_filter(filter_, max_queries=MAX_SPLIT_QUERIES):
+    """Rewrite ``filter_`` into filters that Notion accepts.
+
+    The union of the returned filters' results equals the results of
+    ``filter_``. Subtrees nested deeper than Notion allows are rewritten into an
+    ``or`` of ``and`` terms, which usually still fits in one request; only when
+    that grows beyond ``MAX_FILTER_CONDITIONS`` conditions is the ``or`` split
+    into several requests. Raises ``ValueError`` if more than ``max_queries``
+    requests would be needed.
+    """
+    tree = _reduce_depth(simplify(filter_), MAX_COMPOUND_DEPTH)
+    if _conditions(tree) <= MAX_FILTER_CONDITIONS:
+        return [tree]
+
+    # or で結んだ and 項に展開し、項ごとに複数のリクエストへ詰める
+    tree = _disjunctive(tree)
+    if "or" not in tree:
+        raise ValueError(f"Filter has more than {MAX_FILTER_CONDITIONS} conditions")
+
+    filters, chunk, size = [], [], 0
+    for operand in tree["or"]:
+        conditions = _conditions(operand)
+        if conditions > MAX_FILTER_CONDITIONS:
+            raise ValueError(f"Filter has more than {MAX_FILTER_CONDITIONS} conditions")
+        if chunk and size + conditions > MAX_FILTER_CONDITIONS:
+            filters.append(combine("or", chunk))
+            chunk, size = [], 0
+        chunk.append(operand)
+        size += conditions
+    filters.append(combine("or", chunk))
+    if len(filters) > max_queries:
+        raise ValueError(
+            f"Filter needs {len(filters)} queries, more than {max_queries}: {filter_}"
+        )
+    return filters
+
+
+def _reduce_depth(filter_, limit):
+    if depth(filter_) <= limit:
+        return filter_
+    if limit <= 2:
+        return _disjunctive(filter_)
+    operator = "and" if "and" in filter_ else "or"
+    operands = [_reduce_depth(f, limit - 1) for f in filter_[operator]]
+    return simplify(combine(operator, operands))
+
+
+def _disjunctive(filter_):
+    """``filter_`` as an ``or`` of ``and`` terms (depth 2 at most)."""
+    if "or" in filter_:
+        return simplify(combine("or", [_disjunctive(f) for f in filter_["or"]]))
+    if "and" not in filter_:
+        return filter_
+    terms = [[]]
+    for operand in filter_["and"]:
+        operand = _disjunctive(operand)
+        alternatives = operand["or"] if "or" in operand else [operand]
+        terms = [term + [alternative] for term in terms for alternative in alternatives]
+        if len(terms) > MAX_FILTER_CONDITIONS * MAX_SPLIT_QUERIES:
+            raise ValueError("Filter is too large to rewrite within Notion's limits")
+    return simplify(combine("or", [combine("and", term) for term in terms]))
+
+
+def _conditions(filter_):
+    if filter_ is None:
+        return 0
+    for operator in COMPOUND_OPERATORS:
+        if operator in filter_:
+            return sum(_conditions(f) for f in filter_[operator])
+    return 1
+
+
+def _dedupe(filters):
+    seen = set()
+    result = []
+    for filter_ in filters:
+        key = json.dumps(filter_, sort_keys=True, ensure_ascii=False)
+        if key not in seen:
+            seen.add(key)
+            result.append(filter_)
+    return result
+
+
+def _range_key(filter_):
+    """``(target, filter_type, bound, inclusive, value)`` for range leaves, else ``None``."""
+    if any(operator in filter_ for operator in COMPOUND_OPERATORS):
+        return None
+    filter_type = filter_.get("timestamp") or next(
+        (key for key in filter_ if key != "property"), None
+    )
+    condition = filter_.get(filter_type)
+    if not isinstance(condition, dict) or len(condition) != 1:
+        return None
+    name, value = next(iter(condition.items()))
+    if name not in _BOUNDS or value is None:
+        return None
+    target = filter_.get("property") or filter_.get("timestamp")
+    bound, inclusive = _BOUNDS[name]
+    # 日付と日時は文字列として比較できないので、同じ形式どうしだけ併合する
+    kind = len(value) if isinstance(value, str) else "number"
+    return (target, filter_type, bound, kind), name, inclusive, value
+
+
+def _merge_ranges(operator, operands):
+    best = {}
+    for filter_ in operands:
+        key = _range_key(filter_)
+        if key is None:
+            continue
+        group, name, inclusive, value = key
+        current = best.get(group)
+        if current is None or _tighter(operator, group[2], key, current[1]):
+            best[group] = (filter_, key)
+    merged = []
+    emitted = set()
+    for filter_ in operands:
+        key = _range_key(filter_)
+        if key is None:
+            merged.append(filter_)
+        elif key[0] not in emitted:
+            emitted.add(key[0])
+            merged.append(best[key[0]][0])
+    return merged
+
+
+def _tighter(operator, bound, candidate, current):
+    """Whether ``candidate`` should replace ``current`` in an ``operator`` compound."""
+    _, _, inclusive, value = candidate
+    _, _, current_inclusive, current_value = current
+    if value == current_value:
+        # and は境界を含まない方、or は含む方が勝つ
+        return (not inclusive if operator == "and" else inclusive) and (
+            inclusive != current_inclusive
+        )
+    larger = value > current_value
+    if bound == "lower":
+        return larger if operator == "and" else not larger
+    return not larger if operator == "and" else larger
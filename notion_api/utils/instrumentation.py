@@ -0,0 +1,280 @@
+import logging
+import math
+import re
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# ページ・データベース ID (UUID、ハイフンの有無は問わない)
+_ID_SEGMENT = re.compile(
+    r"^[0-9a-fA-F]{8}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{12}$"
+)
+
+
+def endpoint_path(endpoint):
+    """The endpoint without its query string; ids are kept."""
+    return endpoint.split("?", 1)[0].strip("/")
+
+
+def endpoint_template(endpoint):
+    """``v1/databases/<id>/query`` -> ``v1/databases/{id}/query``."""
+    return "/".join(
+        "{id}" if _ID_SEGMENT.match(segment) else segment
+        for segment in endpoint_path(endpoint).split("/")
+    )
+
+
+@dataclass
+class RequestEvent:
+    method: str
+    endpoint: str
+    template: str
+    started_at: float
+    status_code: Optional[int] = None
+    bytes_out: int = 0
+    bytes_in: int = 0
+    retries: int = 0
+    elapsed: float = 0.0
+    error: Optional[BaseException] = None
+    # 試行ごとのステータスコード (リトライされた 429 なども含む)
+    attempt_status_codes: List[int] = field(default_factory=list)
+
+    def record_response(self, status_code, bytes_out, bytes_in):
+        self.status_code = status_code
+        self.attempt_status_codes.append(status_code)
+        self.bytes_out += bytes_out
+        self.bytes_in += bytes_in
+
+    @property
+    def key(self):
+        return f"{self.method} {self.template}"
+
+    @property
+    def id_key(self):
+        """Like ``key`` but with the ids, e.g. ``POST v1/databases/<id>/query``."""
+        return f"{self.method} {endpoint_path(self.endpoint)}"
+
+
+class LatencyHistogram:
+    """Log-bucketed latency histogram; percentiles are accurate to ``growth`` (5%)."""
+
+    def __init__(self, lowest=1e-4, growth=1.05):
+        self.lowest = lowest
+        self._log_growth = math.log(growth)
+        self.growth = growth
+        self.buckets = Counter()
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds):
+        index = 0
+        if seconds > self.lowest:
+            index = int(math.log(seconds / self.lowest) / self._log_growth) + 1
+        self.buckets[index] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def percentile(self, p):
+        if not self.count:
+            return None
+        rank = max(1, math.ceil(self.count * p / 100))
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                # バケットの上限を返す (最大値は超えない)
+                return min(self.lowest * self.growth**index, self.max)
+        return self.max
+
+
+@dataclass
+class EndpointStats:
+    count: int
+    errors: int
+    retries: int
+    throttled: int
+    bytes_out: int
+    bytes_in: int
+    mean: float
+    p50: float
+    p95: float
+    p99: float
+    max: float
+    status_codes: Dict[int, int] = field(default_factory=dict)
+
+
+class _Endpoint:
+    def __init__(self):
+        self.histogram = LatencyHistogram()
+        self.status_codes = Counter()
+        self.errors = 0
+        self.retries = 0
+        self.bytes_out = 0
+        self.bytes_in = 0
+
+    def record(self, event, error):
+        self.histogram.record(event.elapsed)
+        self.status_codes.update(event.attempt_status_codes)
+        if error is not None:
+            self.errors += 1
+        self.retries += event.retries
+        self.bytes_out += event.bytes_out
+        self.bytes_in += event.bytes_in
+
+    def stats(self):
+        histogram = self.histogram
+        return EndpointStats(
+            count=histogram.count,
+            errors=self.errors,
+            retries=self.retries,
+            throttled=self.status_codes.get(429, 0),
+            bytes_out=self.bytes_out,
+            bytes_in=self.bytes_in,
+            mean=histogram.total / histogram.count if histogram.count else 0.0,
+            p50=histogram.percentile(50),
+            p95=histogram.percentile(95),
+            p99=histogram.percentile(99),
+            max=histogram.max,
+            status_codes=dict(self.status_codes),
+        )
+
+
+class Exporter(ABC):
+    """Receives ``{"METHOD template": EndpointStats}`` from ``Instrumentation.export``.
+
+    With ``Instrumentation.max_ids`` set, the dict also holds the per-id keys
+    (``"POST v1/databases/<id>/query"``) next to their ``{id}`` template.
+    """
+
+    @abstractmethod
+    def export(self, stats: Dict[str, EndpointStats]):
+        pass
+
+
+class LoggingExporter(Exporter):
+    def __init__(self, log=logger, level=logging.INFO):
+        self.log = log
+        self.level = level
+
+    def export(self, stats):
+        for key, s in sorted(stats.items()):
+            self.log.log(
+                self.level,
+                "%s count=%d errors=%d retries=%d throttled=%d "
+                "p50=%.3fs p95=%.3fs p99=%.3fs max=%.3fs",
+                key,
+                s.count,
+                s.errors,
+                s.retries,
+                s.throttled,
+                s.p50,
+                s.p95,
+                s.p99,
+                s.max,
+            )
+
+
+class Instrumentation:
+    """Per-endpoint latency histograms plus pre/post request hooks.
+
+    Stats are kept per endpoint template, so every database shares one
+    histogram. ``max_ids`` > 0 also keeps one per endpoint with its ids (for
+    example per database), for at most ``max_ids`` endpoints; the least recently
+    used one is dropped first.
+
+    Pre hooks are called with the ``RequestEvent`` before the first attempt, post
+    hooks after the last one (including retries and the final error, if any).
+    Hook exceptions are logged and never affect the request.
+    """
+
+    def __init__(self, max_ids=0):
+        self.pre_hooks: List[Callable[[RequestEvent], None]] = []
+        self.post_hooks: List[Callable[[RequestEvent], None]] = []
+        self.exporters: List[Exporter] = []
+        self.max_ids = max_ids
+        self._endpoints: Dict[str, _Endpoint] = {}
+        self._by_id: "OrderedDict[str, _Endpoint]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add_pre_hook(self, hook):
+        self.pre_hooks.append(hook)
+
+    def add_post_hook(self, hook):
+        self.post_hooks.append(hook)
+
+    def add_exporter(self, exporter):
+        self.exporters.append(exporter)
+
+    def start(self, method, endpoint):
+        event = RequestEvent(
+            method, endpoint, endpoint_template(endpoint), time.perf_counter()
+        )
+        self._run_hooks(self.pre_hooks, event)
+        return event
+
+    def finish(self, event, error=None):
+        event.elapsed = time.perf_counter() - event.started_at
+        event.error = error
+        with self._lock:
+            endpoint = self._endpoints.get(event.key)
+            if endpoint is None:
+                endpoint = self._endpoints[event.key] = _Endpoint()
+            endpoint.record(event, error)
+            if self.max_ids > 0 and event.id_key != event.key:
+                self._record_id(event, error)
+        self._run_hooks(self.post_hooks, event)
+
+    def _record_id(self, event, error):
+        endpoint = self._by_id.get(event.id_key)
+        if endpoint is None:
+            endpoint = self._by_id[event.id_key] = _Endpoint()
+        self._by_id.move_to_end(event.id_key)
+        endpoint.record(event, error)
+        while len(self._by_id) > self.max_ids:
+            self._by_id.popitem(last=False)
+
+    def stats(self, by_id=False):
+        """Stats per endpoint template, or per endpoint with ids if ``by_id``."""
+        with self._lock:
+            endpoints = self._by_id if by_id else self._endpoints
+            return {key: e.stats() for key, e in endpoints.items()}
+
+    def export(self):
+        stats = self.stats()
+        stats.update(self.stats(by_id=True))
+        for exporter in self.exporters:
+            exporter.export(stats)
+        return stats
+
+    def reset(self):
+        with self._lock:
+            self._endpoints.clear()
+            self._by_id.clear()
+
+    @staticmethod
+    def _run_hooks(hooks, event):
+        for hook in hooks:
+            try:
+                hook(event)
+            except Exception:
+                logger.exception("Instrumentation hook %r failed", hook)
+
+
+_default_instrumentation = Instrumentation()
+
+
+def get_instrumentation():
+    return _default_instrumentation
+
+
+def set_instrumentation(instrumentation):
+    """Replace the process-wide instrumentation shared by every client (``None`` disables it)."""
+    global _default_instrumentation
+    _default_instrumentation = instrumentation
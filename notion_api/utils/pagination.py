@@ -0,0 +1,167 @@
+import queue
+import threading
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    Optional,
+)
+
+# Notion の query API が 1 リクエストで返せる最大件数
+MAX_PAGE_SIZE = 100
+
+
+def build_query_body(
+    body: Optional[Dict[str, Any]] = None,
+    page_size: Optional[int] = None,
+    start_cursor: Optional[str] = None,
+) -> Dict[str, Any]:
+    if body is not None and not isinstance(body, dict):
+        raise ValueError(f"Query body must be a dictionary, got {type(body)} instead")
+    if page_size is not None and not 1 <= page_size <= MAX_PAGE_SIZE:
+        raise ValueError(f"Page size must be between 1 and {MAX_PAGE_SIZE}")
+
+    query = dict(body or {})
+    if page_size is not None:
+        query["page_size"] = page_size
+    if start_cursor is not None:
+        query["start_cursor"] = start_cursor
+    return query
+
+
+def iter_query_pages(
+    post: Callable[[str, Dict[str, Any]], Dict[str, Any]],
+    endpoint: str,
+    body: Optional[Dict[str, Any]] = None,
+    page_size: Optional[int] = None,
+    start_cursor: Optional[str] = None,
+    prefetch: int = 0,
+    limit: Optional[int] = None,
+) -> Iterator[Dict[str, Any]]:
+    """Follow ``has_more``/``next_cursor`` and yield each response body.
+
+    With ``prefetch`` > 0 the requests run on a background thread that keeps up
+    to ``prefetch`` pages buffered ahead of the consumer. With ``limit`` no more
+    than ``limit`` results are requested or yielded in total.
+    """
+    query = build_query_body(body, page_size, start_cursor)
+    if prefetch < 0:
+        raise ValueError("Prefetch depth must be 0 or greater")
+    _validate_limit(limit)
+    pages = _follow_cursor(post, endpoint, query, limit)
+    if prefetch:
+        return read_ahead(pages, prefetch)
+    return pages
+
+
+def _validate_limit(limit):
+    if limit is not None and limit < 1:
+        raise ValueError("Limit must be 1 or greater")
+
+
+def _limit_query(query, remaining):
+    if remaining is None:
+        return query
+    # 残り件数より多くは要求しない
+    page_size = min(query.get("page_size", MAX_PAGE_SIZE), remaining)
+    return dict(query, page_size=page_size)
+
+
+def _limit_page(page, remaining):
+    """Trim ``page`` to ``remaining`` results; returns ``(page, remaining, done)``."""
+    if remaining is None:
+        return page, None, False
+    results = page["results"]
+    if len(results) >= remaining:
+        page = dict(page, results=results[:remaining], has_more=False)
+        return page, 0, True
+    return page, remaining - len(results), False
+
+
+def _follow_cursor(post, endpoint, query, limit=None):
+    remaining = limit
+    while True:
+        page = post(endpoint, _limit_query(query, remaining))["body"]
+        page, remaining, done = _limit_page(page, remaining)
+        yield page
+        next_cursor = page.get("next_cursor")
+        if done or not page.get("has_more") or not next_cursor:
+            return
+        query = dict(query, start_cursor=next_cursor)
+
+
+_ITEM, _ERROR, _DONE = range(3)
+
+
+def read_ahead(iterable: Iterable[Any], depth: int = 1) -> Iterator[Any]:
+    """Consume ``iterable`` on a background thread, buffering up to ``depth`` items.
+
+    Exceptions raised by the producer are re-raised in the consumer. Closing the
+    returned generator early stops the background thread.
+    """
+    if depth < 1:
+        raise ValueError("Read-ahead depth must be 1 or greater")
+
+    buffer = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+
+    def put(entry):
+        while not stop.is_set():
+            try:
+                buffer.put(entry, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce():
+        try:
+            for item in iterable:
+                if not put((_ITEM, item)):
+                    return
+        except BaseException as e:
+            put((_ERROR, e))
+        else:
+            put((_DONE, None))
+
+    def consume():
+        worker = threading.Thread(target=produce, name="notion-read-ahead", daemon=True)
+        worker.start()
+        try:
+            while True:
+                kind, value = buffer.get()
+                if kind == _DONE:
+                    return
+                if kind == _ERROR:
+                    raise value
+                yield value
+        finally:
+            stop.set()
+
+    return consume()
+
+
+async def aiter_query_pages(
+    post: Callable[[str, Dict[str, Any]], Awaitable[Dict[str, Any]]],
+    endpoint: str,
+    body: Optional[Dict[str, Any]] = None,
+    page_size: Optional[int] = None,
+    start_cursor: Optional[str] = None,
+    limit: Optional[int] = None,
+) -> AsyncIterator[Dict[str, Any]]:
+    """Async counterpart of :func:`iter_query_pages`."""
+    query = build_query_body(body, page_size, start_cursor)
+    _validate_limit(limit)
+    remaining = limit
+    while True:
+        page = (await post(endpoint, _limit_query(query, remaining)))["body"]
+        page, remaining, done = _limit_page(page, remaining)
+        yield page
+        next_cursor = page.get("next_cursor")
+        if done or not page.get("has_more") or not next_cursor:
+            return
+        query = dict(query, start_cursor=next_cursor)
@@ -0,0 +1,104 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+from notion_api.utils.filter_tree import combine
+
+# 走査中に値が変わらないタイムスタンプだけ分割キーに使える
+TIMESTAMP_PARTITIONS = ("created_time",)
+PARTITION_TYPES = ("number", "date")
+DEFAULT_PARTITIONS = 4
+
+_BOUNDS = {
+    "number": ("greater_than_or_equal_to", "less_than"),
+    "date": ("on_or_after", "before"),
+    "timestamp": ("on_or_after", "before"),
+}
+
+
+def partition_filters(target, kind, lower, upper, partitions):
+    """Disjoint filters on ``target`` that together match every page.
+
+    ``kind`` is ``"number"``, ``"date"`` or ``"timestamp"``. ``lower``/``upper``
+    only decide where the ``partitions - 1`` boundaries go: the first and last
+    ranges are open-ended and property partitions get an extra ``is_empty``
+    filter, so pages outside the observed range are still matched exactly once.
+    """
+    if partitions < 1:
+        raise ValueError("Partitions must be 1 or greater")
+    if kind not in _BOUNDS:
+        raise ValueError(f"Cannot partition on {kind}")
+    if lower is None or upper is None:
+        boundaries = []
+    elif kind == "number":
+        boundaries = _number_boundaries(lower, upper, partitions)
+    else:
+        boundaries = _date_boundaries(lower, upper, partitions, kind == "date")
+    if not boundaries:
+        return [None]
+
+    def leaf(condition, value):
+        if kind == "timestamp":
+            return {"timestamp": target, target: {condition: value}}
+        return {"property": target, kind: {condition: value}}
+
+    lower_condition, upper_condition = _BOUNDS[kind]
+    edges = [None] + boundaries + [None]
+    filters = []
+    for start, end in zip(edges, edges[1:]):
+        conditions = []
+        if start is not None:
+            conditions.append(leaf(lower_condition, start))
+        if end is not None:
+            conditions.append(leaf(upper_condition, end))
+        filters.append(combine("and", conditions))
+    if kind != "timestamp":
+        # 範囲条件は空のセルに一致しないので別の区画で拾う
+        filters.append(leaf("is_empty", True))
+    return filters
+
+
+def scan_partitions(fetch, filters, concurrency=None):
+    """Run ``fetch(filter_)`` for every partition concurrently; results in order."""
+    filters = list(filters)
+    if len(filters) == 1:
+        return [fetch(filters[0])]
+    workers = min(concurrency or len(filters), len(filters))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(fetch, filters))
+
+
+def _number_boundaries(lower, upper, partitions):
+    if upper <= lower:
+        return []
+    step = (upper - lower) / partitions
+    boundaries = [lower + step * i for i in range(1, partitions)]
+    if isinstance(lower, int) and isinstance(upper, int):
+        boundaries = [int(round(b)) for b in boundaries]
+    return sorted({b for b in boundaries if lower < b <= upper})
+
+
+def _date_boundaries(lower, upper, partitions, date_only):
+    start, end = _parse_date(lower), _parse_date(upper)
+    if end <= start:
+        return []
+    step = (end - start) / partitions
+    boundaries = [start + step * i for i in range(1, partitions)]
+    if date_only:
+        # 日付のみの値と比較するため日単位に丸める
+        values = {b.date().isoformat() for b in boundaries}
+        return sorted(v for v in values if v > start.date().isoformat())
+    return sorted({_format_timestamp(b) for b in boundaries})
+
+
+def _parse_date(value):
+    if len(value) == 10:
+        value += "T00:00:00"
+    parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def _format_timestamp(value):
+    value = value.astimezone(timezone.utc)
+    return value.strftime("%Y-%m-%dT%H:%M:%S.") + f"{value.microsecond // 1000:03d}Z"
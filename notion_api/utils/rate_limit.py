@@ -0,0 +1,68 @@
+import asyncio
+import threading
+import time
+
+from notion_api.config.settings import RATE_LIMIT_PER_SECOND, RATE_LIMIT_BURST
+
+
+class TokenBucket:
+    """Thread-safe token bucket.
+
+    ``reserve`` takes a token immediately and returns how long the caller has to
+    wait before using it, so the same bucket can be shared by threads and by
+    asyncio tasks without holding the lock while sleeping.
+    """
+
+    def __init__(self, rate, capacity=None, clock=time.monotonic):
+        if rate <= 0:
+            raise ValueError("Rate must be greater than 0")
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else max(rate, 1))
+        self._clock = clock
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self):
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            return max(wait, self._paused_until - now)
+
+    def acquire(self):
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self):
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def pause(self, seconds):
+        """Hold back every caller for ``seconds`` (e.g. after a 429 with Retry-After)."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, self._clock() + seconds)
+
+
+_default_rate_limiter = (
+    TokenBucket(RATE_LIMIT_PER_SECOND, RATE_LIMIT_BURST)
+    if RATE_LIMIT_PER_SECOND > 0
+    else None
+)
+
+
+def get_rate_limiter():
+    return _default_rate_limiter
+
+
+def set_rate_limiter(rate_limiter):
+    """Replace the process-wide limiter shared by every client (``None`` disables it)."""
+    global _default_rate_limiter
+    _default_rate_limiter = rate_limiter
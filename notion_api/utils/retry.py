@@ -0,0 +1,88 @@
+import random
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+
+from notion_api.config.settings import (
+    MAX_RETRIES,
+    RETRY_BACKOFF_BASE,
+    RETRY_BACKOFF_MAX,
+)
+from notion_api.utils.exceptions import (
+    APIResponseError,
+    RateLimitedError,
+    ServerError,
+)
+
+RETRYABLE_STATUS_CODES = frozenset({409, 429, 500, 502, 503, 504})
+# ページ作成や更新は処理済みかもしれないので、処理前に断られたと分かる場合だけ再送する
+WRITE_RETRYABLE_STATUS_CODES = frozenset({429})
+# 結果が変わらない POST (検索・クエリ)
+IDEMPOTENT_POST_SUFFIXES = ("/query", "v1/search")
+
+
+def is_idempotent(method, endpoint):
+    """Whether sending the request twice has the same effect as sending it once."""
+    if method == "GET":
+        return True
+    path = endpoint.partition("?")[0].rstrip("/")
+    return method == "POST" and path.endswith(IDEMPOTENT_POST_SUFFIXES)
+
+
+class RetryPolicy:
+    def __init__(
+        self,
+        max_retries=MAX_RETRIES,
+        backoff_base=RETRY_BACKOFF_BASE,
+        backoff_max=RETRY_BACKOFF_MAX,
+        retry_statuses=RETRYABLE_STATUS_CODES,
+    ):
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retry_statuses = frozenset(retry_statuses)
+
+    def should_retry(self, attempt, status_code=None, idempotent=True):
+        """``status_code`` is ``None`` for a request that got no response.
+
+        Writes (``idempotent=False``) are only retried on 429; the caller
+        decides whether a failed write was ever sent.
+        """
+        if attempt >= self.max_retries:
+            return False
+        if status_code is None:
+            return True
+        if not idempotent and status_code not in WRITE_RETRYABLE_STATUS_CODES:
+            return False
+        return status_code in self.retry_statuses
+
+    def compute_delay(self, attempt, retry_after=None):
+        if retry_after is not None:
+            # Retry-After を優先し、同時に再開するクライアントを少しずらす
+            return retry_after + random.uniform(0, self.backoff_base)
+        # exponential backoff with full jitter
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2**attempt))
+
+
+def parse_retry_after(value):
+    if value is None:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+def error_from_response(status_code, body, headers, attempts=1):
+    retry_after = parse_retry_after(headers.get("Retry-After"))
+    if status_code == 429:
+        error_class = RateLimitedError
+    elif status_code >= 500:
+        error_class = ServerError
+    else:
+        error_class = APIResponseError
+    return error_class(status_code, body, retry_after=retry_after, attempts=attempts)
@@ -9,7 +9,7 @@ setup(
     long_description=open("README.md").read(),
     long_description_content_type="text/markdown",
     url="https://github.com/yuki5155/notion-api",
-    packages=find_packages(),
+    packages=find_packages(exclude=["benchmarks", "benchmarks.*"]),
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",
@@ -20,4 +20,8 @@ setup(
         # リストに依存パッケージを追加
         # 例: 'requests>=2.22.0',
     ],
+    extras_require={
+        "async": ["httpx>=0.24"],
+        "frames": ["numpy>=1.20"],
+    },
 )
@@ -0,0 +1,43 @@
+import os
+import sys
+
+module_path = os.path.join(os.path.dirname(__file__), "..")
+sys.path.append(module_path)
+
+import pytest
+
+from notion_api.orm import models
+from notion_api.services.v1.v1_base_service import AsyncBaseService, BaseService
+from notion_api.testing import FakeNotionServer
+from notion_api.utils.retry import RetryPolicy
+
+PARENT_ID = "00f4b5a7-0000-4000-8000-000000000000"
+
+
+class Stock(models.Model):
+    ticker = models.CharField("Ticker", is_required=True)
+    price = models.IntegerField("Price")
+    kind = models.SelectField(
+        "Kind", [models.SelectField.option("a"), models.SelectField.option("b")]
+    )
+
+    @classmethod
+    def table_name(cls):
+        return "stocks"
+
+
+@pytest.fixture
+def server(monkeypatch):
+    """A ``FakeNotionServer`` that ``BaseService`` and ``AsyncBaseService`` talk to.
+
+    Retries are kept but do not back off, so injected failures cost no time.
+    """
+    with FakeNotionServer() as server:
+        policy = RetryPolicy(backoff_base=0, backoff_max=0)
+        client = server.client(retry_policy=policy)
+        monkeypatch.setattr(BaseService, "client", client)
+        monkeypatch.setattr(
+            AsyncBaseService, "client", server.async_client(retry_policy=policy)
+        )
+        yield server
+        client.close()
@@ -0,0 +1,97 @@
+import os
+import sys
+
+module_path = os.path.join(os.path.dirname(__file__), "..", "..")
+sys.path.append(module_path)
+
+import pytest
+
+from conftest import PARENT_ID, Stock
+from notion_api.services.v1.v1_base_service import BaseService
+from notion_api.utils.exceptions import APIResponseError
+
+
+@pytest.fixture
+def database_id(server):
+    return Stock.migrate(parent_id=PARENT_ID)["database_id"]
+
+
+def test_bulk_create_reports_failures_per_item(server, database_id):
+    stocks = [Stock(ticker=f"T{i}", price=i) for i in range(3)]
+    server.fail_next(400)
+
+    # 並列数 1 なら失敗するのは先頭の項目
+    results = Stock.bulk_create(database_id, stocks, concurrency=1)
+
+    assert [r.ok for r in results] == [False, True, True]
+    assert isinstance(results[0].error, APIResponseError)
+    assert stocks[0].get_page_id() is None
+    assert [s.get_page_id() for s in stocks[1:]] == [r.page_id for r in results[1:]]
+    assert len(server.pages) == 2
+
+
+def test_bulk_create_validates_values_assigned_after_init(server, database_id):
+    stocks = [Stock(ticker=f"T{i}", price=i) for i in range(3)]
+    stocks[0].price = "oops"
+    stocks[2].kind = "z"
+    requests_before = len(server.requests)
+
+    with pytest.raises(ValueError) as e:
+        Stock.bulk_create(database_id, stocks)
+
+    assert "0: Price must be an integer" in str(e.value)
+    assert "2: Kind must be one of" in str(e.value)
+    assert "1:" not in str(e.value)
+    assert len(server.requests) == requests_before
+
+
+def test_bulk_update_sends_only_the_listed_fields(server, database_id, monkeypatch):
+    stocks = [Stock(ticker=f"T{i}", price=i, kind="a") for i in range(3)]
+    Stock.bulk_create(database_id, stocks)
+    bodies = []
+    patch = BaseService.client.patch
+
+    def recording_patch(endpoint, data=None, **kwargs):
+        bodies.append(data)
+        return patch(endpoint, data, **kwargs)
+
+    monkeypatch.setattr(BaseService.client, "patch", recording_patch)
+    for stock in stocks:
+        stock.price += 10
+        stock.kind = "b"
+
+    results = Stock.bulk_update(database_id, stocks, fields=["price"])
+
+    assert all(r.ok for r in results)
+    assert [set(b["properties"]) for b in bodies] == [{"Price"}] * 3
+    saved = Stock.filter(database_id, order_by="price")
+    assert [(s.price, s.kind) for s in saved] == [(10, "a"), (11, "a"), (12, "a")]
+
+    stocks[0].price = "oops"
+    with pytest.raises(ValueError):
+        Stock.bulk_update(database_id, stocks, fields=["price"])
+    assert len(bodies) == 3
+
+
+def test_bulk_update_and_delete_report_failures_per_page(server, database_id):
+    stocks = [Stock(ticker=f"T{i}", price=i) for i in range(3)]
+    Stock.bulk_create(database_id, stocks)
+    missing_id = "11111111-2222-4333-8444-555555555555"
+    stocks[1].page_id = missing_id
+    for stock in stocks:
+        stock.price = 99
+
+    results = Stock.bulk_update(database_id, stocks)
+
+    assert [r.ok for r in results] == [True, False, True]
+    assert results[1].error.status_code == 404
+    # 失敗したページは変更が残ったままになる
+    assert stocks[1].get_dirty_fields() == ["price"]
+    assert stocks[0].get_dirty_fields() == []
+
+    results = Stock.bulk_delete(database_id, [s.get_page_id() for s in stocks])
+
+    assert [r.ok for r in results] == [True, False, True]
+    assert results[1].error.status_code == 404
+    # 実在しない ID を渡した T1 だけが更新も削除もされずに残る
+    assert [(s.ticker, s.price) for s in Stock.filter(database_id)] == [("T1", 1)]
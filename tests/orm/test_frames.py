@@ -0,0 +1,88 @@
+import os
+import sys
+
+module_path = os.path.join(os.path.dirname(__file__), "..", "..")
+sys.path.append(module_path)
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from notion_api.orm import models
+from notion_api.orm.frames import ModelFrame
+
+
+class FrameModel(models.Model):
+    username = models.CharField("Username")
+    number = models.IntegerField("Number")
+    selects = models.SelectField(
+        "Selects", [models.SelectField.option("a"), models.SelectField.option("b")]
+    )
+    multi_selects = models.MultiSelectField(
+        "MultiSelects",
+        [models.MultiSelectField.option("x"), models.MultiSelectField.option("y")],
+    )
+    date_field = models.DateField("DateField")
+    bool_field = models.BoolField("BoolField")
+
+    @classmethod
+    def table_name(cls):
+        return "frame_table"
+
+
+PAGES = [
+    {
+        "id": "p1",
+        "properties": {
+            "Username": {"rich_text": [{"plain_text": "user1"}]},
+            "Number": {"number": 10},
+            "Selects": {"select": {"name": "b"}},
+            "MultiSelects": {"multi_select": [{"name": "x"}, {"name": "y"}]},
+            "DateField": {"date": {"start": "2021-01-01"}},
+            "BoolField": {"checkbox": True},
+        },
+    },
+    {
+        "id": "p2",
+        "properties": {
+            "Username": {"rich_text": []},
+            "Number": {"number": None},
+            "Selects": {"select": {"name": "new"}},
+            "MultiSelects": {"multi_select": []},
+            "DateField": {"date": None},
+            "BoolField": {"checkbox": False},
+        },
+    },
+]
+
+
+def test_frame_decodes_pages_into_columns():
+    frame = ModelFrame.from_pages(FrameModel, PAGES)
+
+    assert len(frame) == 2
+    assert frame.page_ids == ["p1", "p2"]
+    assert list(frame["username"]) == ["user1", None]
+    assert frame["number"].dtype == np.float64
+    assert frame["number"][0] == 10 and np.isnan(frame["number"][1])
+    assert frame["bool_field"].tolist() == [True, False]
+    assert frame["date_field"][0] == np.datetime64("2021-01-01")
+    assert np.isnat(frame["date_field"][1])
+
+
+def test_frame_dictionary_encodes_select_fields():
+    frame = ModelFrame.from_pages(FrameModel, PAGES)
+
+    selects = frame["selects"]
+    assert selects.codes.tolist() == [1, 2]
+    assert selects.categories == ["a", "b", "new"]
+    assert selects.to_list() == ["b", "new"]
+
+    multi_selects = frame["multi_selects"]
+    assert multi_selects.offsets.tolist() == [0, 2, 2]
+    assert multi_selects.to_list() == [["x", "y"], []]
+
+
+def test_frame_keeps_integer_dtype_without_empty_cells():
+    frame = ModelFrame.from_pages(FrameModel, PAGES[:1])
+
+    assert frame["number"].dtype == np.int64
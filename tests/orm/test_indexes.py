@@ -0,0 +1,127 @@
+import os
+import random
+import sys
+
+module_path = os.path.join(os.path.dirname(__file__), "..", "..")
+sys.path.append(module_path)
+
+from notion_api.orm import models, IndexedTable
+from notion_api.services.v1.v1_base_service import BaseService
+from notion_api.utils.filter_evaluator import filter_pages
+
+
+class IndexedModel(models.Model):
+    number = models.IntegerField("Number")
+    selects = models.SelectField(
+        "Selects", [models.SelectField.option("a"), models.SelectField.option("b")]
+    )
+    tags = models.MultiSelectField(
+        "Tags",
+        [models.MultiSelectField.option("x"), models.MultiSelectField.option("y")],
+    )
+    date_field = models.DateField("DateField")
+    done = models.BoolField("Done")
+
+    @classmethod
+    def table_name(cls):
+        return "indexed_table"
+
+
+def make_page(page_id, rng):
+    return {
+        "id": page_id,
+        "properties": {
+            "Number": {"number": rng.choice([None, 1, 5, 10, 50])},
+            "Selects": {"select": rng.choice([None, {"name": "a"}, {"name": "b"}])},
+            "Tags": {
+                "multi_select": [
+                    {"name": t} for t in rng.sample("xy", rng.randint(0, 2))
+                ]
+            },
+            "DateField": {
+                "date": rng.choice(
+                    [None, {"start": "2024-01-01"}, {"start": "2024-03-01T12:00:00Z"}]
+                )
+            },
+            "Done": {"checkbox": rng.random() < 0.5},
+        },
+    }
+
+
+FILTERS = [
+    {"property": "Number", "number": {"greater_than": 5}},
+    {"property": "Number", "number": {"less_than_or_equal_to": 5}},
+    {"property": "Number", "number": {"does_not_equal": 10}},
+    {"property": "Selects", "select": {"equals": "a"}},
+    {"property": "Selects", "select": {"is_empty": True}},
+    {"property": "Tags", "multi_select": {"contains": "y"}},
+    {"property": "Tags", "multi_select": {"is_empty": True}},
+    {"property": "Tags", "multi_select": {"is_not_empty": True}},
+    {"property": "DateField", "date": {"on_or_after": "2024-03-01"}},
+    {"property": "DateField", "date": {"before": "2024-03-01T00:00:00Z"}},
+    {"property": "Done", "checkbox": {"equals": False}},
+    {
+        "and": [
+            {"property": "Number", "number": {"greater_than_or_equal_to": 5}},
+            {
+                "or": [
+                    {"property": "Selects", "select": {"equals": "b"}},
+                    {"property": "Done", "checkbox": {"equals": True}},
+                ]
+            },
+        ]
+    },
+]
+
+
+def ids(pages):
+    return sorted(page["id"] for page in pages)
+
+
+def test_indexed_query_matches_full_scan():
+    rng = random.Random(0)
+    pages = [make_page(f"p{i}", rng) for i in range(200)]
+    table = IndexedTable(IndexedModel, "db", pages)
+    for page in pages[:50]:
+        table.upsert(make_page(page["id"], rng))
+    for page in pages[50:70]:
+        table.remove(page["id"])
+    current = list(table.pages.values())
+
+    for filter_ in FILTERS:
+        expected = ids(filter_pages({"filter": filter_}, current))
+        assert ids(table.query({"filter": filter_})) == expected, filter_
+
+
+class FakeClient:
+    def post(self, endpoint, data=None):
+        page = {"id": "new", "parent": data["parent"], "archived": False}
+        return {"code": 200, "body": {**page, "properties": data["properties"]}}
+
+    def patch(self, endpoint, data=None):
+        page_id = endpoint.rsplit("/", 1)[1]
+        if data.get("archived"):
+            body = {"id": page_id, "archived": True, "parent": {"database_id": "db"}}
+        else:
+            body = {"id": page_id, "archived": False, "properties": data["properties"]}
+        return {"code": 200, "body": body}
+
+
+def test_orm_writes_are_applied_to_tables():
+    table = IndexedTable(IndexedModel, "db")
+    original = BaseService.client
+    BaseService.client = FakeClient()
+    try:
+        instance = IndexedModel(number=3, selects="a")
+        instance.save("db")
+        query = {"filter": {"property": "Selects", "select": {"equals": "a"}}}
+        assert ids(table.query(query)) == ["new"]
+
+        instance.selects = "b"
+        instance.update("db")
+        assert table.query(query) == []
+
+        instance.delete()
+        assert len(table) == 0
+    finally:
+        BaseService.client = original
@@ -4,6 +4,7 @@ import sys
 module_path = os.path.join(os.path.dirname(__file__), "..", "..")
 sys.path.append(module_path)
 
+from conftest import PARENT_ID
 from notion_api.orm import models
 from notion_api.services.v1.databases import DataBaseService
 from notion_api.domains.databases_domain import DatabaseTitle
@@ -40,13 +41,13 @@ class TestModel(models.Model):
         return "create_table"
 
 
-def test_db_migrate():
-    TestModel.migrate(parent_id="a214e6c2d6e044d39cb5b98dc438c5dc")
+def test_db_migrate(server):
+    TestModel.migrate(parent_id=PARENT_ID)
     assert True
 
 
-def test_db_migrate_and_create():
-    model = TestModel.migrate(parent_id="a214e6c2d6e044d39cb5b98dc438c5dc")
+def test_db_migrate_and_create(server):
+    model = TestModel.migrate(parent_id=PARENT_ID)
     database_id = model["database_id"]
 
     create_record = TestModel(
@@ -62,9 +63,9 @@ def test_db_migrate_and_create():
     assert True
 
 
-def test_model_filter():
+def test_model_filter(server):
     # First, migrate the TestModel to create the database
-    migration_result = TestModel.migrate(parent_id="a214e6c2d6e044d39cb5b98dc438c5dc")
+    migration_result = TestModel.migrate(parent_id=PARENT_ID)
     database_id = migration_result["database_id"]
 
     # Create some test records
@@ -114,9 +115,9 @@ def test_model_filter():
         assert record.selects == "c"
 
 
-def test_model_filter_or():
+def test_model_filter_or(server):
     # First, migrate the TestModel to create the database
-    migration_result = TestModel.migrate(parent_id="a214e6c2d6e044d39cb5b98dc438c5dc")
+    migration_result = TestModel.migrate(parent_id=PARENT_ID)
     database_id = migration_result["database_id"]
 
     # Create some test records
@@ -173,9 +174,9 @@ def test_model_filter_or():
     ), "OR condition is not working as expected"
 
 
-def test_model_update():
+def test_model_update(server):
     # First, migrate the TestModel to create the database
-    migration_result = TestModel.migrate(parent_id="a214e6c2d6e044d39cb5b98dc438c5dc")
+    migration_result = TestModel.migrate(parent_id=PARENT_ID)
     database_id = migration_result["database_id"]
 
     # Create a test record with a unique username
@@ -228,9 +229,9 @@ def test_model_update():
     assert fetched_record.bool_field == False
 
 
-def test_model_delete():
+def test_model_delete(server):
     # First, migrate the TestModel to create the database
-    migration_result = TestModel.migrate(parent_id="a214e6c2d6e044d39cb5b98dc438c5dc")
+    migration_result = TestModel.migrate(parent_id=PARENT_ID)
     database_id = migration_result["database_id"]
 
     # Create a test record with a unique username
@@ -266,9 +267,9 @@ def test_model_delete():
     ), "Expected to find no records after deletion"
 
 
-def test_model_delete_by_id():
+def test_model_delete_by_id(server):
     # First, migrate the TestModel to create the database
-    migration_result = TestModel.migrate(parent_id="a214e6c2d6e044d39cb5b98dc438c5dc")
+    migration_result = TestModel.migrate(parent_id=PARENT_ID)
     database_id = migration_result["database_id"]
 
     # Create a test record with a unique username
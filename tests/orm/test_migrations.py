@@ -0,0 +1,164 @@
+import os
+import sys
+from types import SimpleNamespace
+
+module_path = os.path.join(os.path.dirname(__file__), "..", "..")
+sys.path.append(module_path)
+
+import pytest
+
+from conftest import PARENT_ID
+from notion_api.domains.databases_domain import Property
+from notion_api.orm import models, migrate_models
+from notion_api.orm.migrations import apply_migration, plan_migration
+from notion_api.services.v1.v1_base_service import BaseService
+
+
+class MigrationModel(models.Model):
+    username = models.CharField("Username")
+    number = models.IntegerField("Number")
+    selects = models.SelectField(
+        "Selects", [models.SelectField.option("a"), models.SelectField.option("b")]
+    )
+
+    @classmethod
+    def table_name(cls):
+        return "migration_table"
+
+
+def make_database(properties):
+    return SimpleNamespace(
+        id="db",
+        properties={
+            name: Property(id=name, type=type_, **{type_: config})
+            for name, (type_, config) in properties.items()
+        },
+    )
+
+
+def test_unchanged_schema_has_empty_plan():
+    database = make_database(
+        {
+            "Name": ("title", {}),
+            "Username": ("rich_text", {}),
+            "Number": ("number", {}),
+            "Selects": ("select", {"options": [{"name": "a"}, {"name": "b"}]}),
+            "Extra": ("checkbox", {}),
+        }
+    )
+
+    plan = plan_migration(MigrationModel, database)
+
+    assert not plan.has_changes and not plan.conflicts
+    assert "no changes" in plan.format()
+
+
+def test_plan_adds_renames_and_extends_options():
+    database = make_database(
+        {
+            "Title": ("title", {}),
+            "User": ("rich_text", {}),
+            "Selects": ("select", {"options": [{"name": "a"}]}),
+        }
+    )
+
+    plan = plan_migration(MigrationModel, database, renames={"User": "Username"})
+
+    assert plan.properties["Title"] == {"name": "Name"}
+    assert plan.properties["User"] == {"name": "Username"}
+    assert plan.properties["Number"] == {"number": {}}
+    options = plan.properties["Selects"]["select"]["options"]
+    assert [option["name"] for option in options] == ["a", "b"]
+    assert not plan.conflicts
+
+
+def test_type_change_is_a_conflict():
+    database = make_database({"Name": ("title", {}), "Number": ("rich_text", {})})
+
+    plan = plan_migration(MigrationModel, database)
+
+    assert plan.conflicts
+    with pytest.raises(ValueError):
+        apply_migration(plan)
+
+
+RAW_DATABASE = {
+    "object": "database",
+    "id": "db",
+    "cover": None,
+    "icon": None,
+    "created_time": "t",
+    "created_by": {"object": "user", "id": "u"},
+    "last_edited_by": {"object": "user", "id": "u"},
+    "last_edited_time": "t",
+    "title": [],
+    "description": [],
+    "is_inline": False,
+    "properties": {
+        "Name": {"id": "title", "type": "title", "title": {}},
+        "Username": {"id": "u", "type": "rich_text", "rich_text": {}},
+        "Number": {"id": "n", "type": "number", "number": {}},
+        "Selects": {
+            "id": "s",
+            "type": "select",
+            "select": {"options": [{"name": "a"}, {"name": "b"}]},
+        },
+    },
+    "parent": {},
+    "url": "",
+    "public_url": None,
+    "archived": False,
+    "in_trash": False,
+    "request_id": "r",
+}
+
+
+class FakeClient:
+    def __init__(self, raw):
+        self.raw = raw
+        self.calls = []
+
+    def get(self, endpoint):
+        self.calls.append(("GET", endpoint))
+        return {"code": 200, "body": self.raw}
+
+    def patch(self, endpoint, data=None):
+        self.calls.append(("PATCH", endpoint))
+        return {"code": 200, "body": self.raw}
+
+
+def test_unchanged_models_cost_one_request_each():
+    client = FakeClient(RAW_DATABASE)
+    original = BaseService.client
+    BaseService.client = client
+    try:
+        results = migrate_models([(MigrationModel, "db")])
+        assert not results[0].plan.has_changes
+        assert results[0].response is None
+        assert client.calls == [("GET", "v1/databases/db")]
+
+        raw = dict(RAW_DATABASE, properties=dict(RAW_DATABASE["properties"]))
+        del raw["properties"]["Number"]
+        client.raw = raw
+        result = MigrationModel.migrate(database_id="db")
+        assert result["plan"].properties == {"Number": {"number": {}}}
+        assert client.calls[-1] == ("PATCH", "v1/databases/db")
+    finally:
+        BaseService.client = original
+
+
+def test_migrate_models_patches_every_changed_database(server):
+    database_ids = [
+        server.add_database({"Name": {"title": {}}, "Username": {"rich_text": {}}})
+        for _ in range(6)
+    ]
+    database_ids.append(MigrationModel.migrate(parent_id=PARENT_ID)["database_id"])
+
+    results = migrate_models([(MigrationModel, i) for i in database_ids])
+
+    assert [r.database_id for r in results] == database_ids
+    assert all(r.plan.has_changes for r in results[:6])
+    assert all(r.response["id"] == r.database_id for r in results[:6])
+    assert not results[6].plan.has_changes and results[6].response is None
+    properties = server.databases[database_ids[0].replace("-", "")]["properties"]
+    assert {"Number", "Selects"} <= set(properties)
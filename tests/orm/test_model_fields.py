@@ -0,0 +1,148 @@
+import os
+import sys
+
+module_path = os.path.join(os.path.dirname(__file__), "..", "..")
+sys.path.append(module_path)
+
+import pytest
+
+from notion_api.orm import models
+from notion_api.orm.orm_models import ModelFilter
+from notion_api.domains.databases_domain import FilteredDatabaseRecord
+
+
+class FieldModel(models.Model):
+    username = models.CharField("Username", max_length=1000, is_required=True)
+    number = models.IntegerField("Number", is_required=True)
+    selects = models.SelectField(
+        "Selects",
+        [models.SelectField.option("a"), models.SelectField.option("b")],
+    )
+    multi_selects = models.MultiSelectField(
+        "MultiSelects",
+        [models.MultiSelectField.option("x"), models.MultiSelectField.option("y")],
+    )
+    date_field = models.DateField("DateField")
+    bool_field = models.BoolField("BoolField")
+
+    @classmethod
+    def table_name(cls):
+        return "field_table"
+
+
+class TitledModel(FieldModel):
+    title = models.CharField("Name")
+
+
+def make_record(page_id="page-1"):
+    return FilteredDatabaseRecord.from_dict(
+        {
+            "id": page_id,
+            "created_time": "2024-01-01T00:00:00.000Z",
+            "last_edited_time": "2024-01-01T00:00:00.000Z",
+            "properties": {
+                "Name": {"title": [{"plain_text": "hello"}]},
+                "Username": {"rich_text": [{"plain_text": "user1"}]},
+                "Number": {"number": 10},
+                "Selects": {"select": {"name": "a"}},
+                "MultiSelects": {"multi_select": [{"name": "x"}]},
+                "DateField": {"date": {"start": "2021-01-01"}},
+                "BoolField": {"checkbox": True},
+            },
+        }
+    )
+
+
+def test_field_table_is_built_once_per_class():
+    meta = FieldModel._meta
+
+    assert meta.attrs == (
+        "username",
+        "number",
+        "selects",
+        "multi_selects",
+        "date_field",
+        "bool_field",
+    )
+    assert meta.required == ("username", "number")
+    assert meta.record_to_attr["DateField"] == "date_field"
+    assert meta.title_attr is None
+    assert TitledModel._meta.title_attr == "title"
+    assert "username" in TitledModel._meta.by_attr
+
+
+def test_unset_fields_default_to_none():
+    instance = FieldModel(username="user1", number=1)
+
+    assert instance.date_field is None
+    assert instance.is_valid()
+
+
+def test_hydrated_instance_only_sends_dirty_fields():
+    instance = ModelFilter(TitledModel)._create_instance_from_record(make_record())
+
+    assert instance.title == "hello"
+    assert instance.get_dirty_fields() == []
+
+    instance.number = 11
+    instance.multi_selects.append("y")
+    page_id, record = instance._build_update_record("db")
+
+    assert page_id == "page-1"
+    assert record.properties == {
+        "Number": {"number": 11},
+        "MultiSelects": {"multi_select": [{"name": "x"}, {"name": "y"}]},
+    }
+
+
+def test_trusted_and_validated_hydration_build_equal_instances():
+    record = make_record()
+    trusted = ModelFilter(TitledModel)._create_instance_from_record(record)
+    validated = ModelFilter(TitledModel, trusted=False)._create_instance_from_record(
+        record
+    )
+
+    values = [getattr(trusted, name) for name in TitledModel._meta.attrs]
+    assert values == [getattr(validated, name) for name in TitledModel._meta.attrs]
+    assert values == ["user1", 10, "a", ["x"], "2021-01-01", True, "hello"]
+    assert trusted.get_page_id() == validated.get_page_id() == "page-1"
+    assert trusted._snapshot == validated._snapshot
+
+
+def test_new_instance_sends_every_field():
+    instance = TitledModel(username="user1", number=1, title="hello")
+
+    _, record = instance._build_update_record("db", page_id="page-1")
+
+    assert record.properties["Name"] == {"title": [{"text": {"content": "hello"}}]}
+    assert record.properties["Selects"] == {"select": None}
+    assert len(record.properties) == len(TitledModel._meta.fields)
+
+
+def test_invalid_update_fields_are_rejected():
+    instance = FieldModel(username="user1", number=1)
+
+    with pytest.raises(AttributeError):
+        instance._build_update_record("db", page_id="page-1", fields=["missing"])
+
+
+class CompactModel(models.Model, compact=True):
+    username = models.CharField("Username", max_length=1000, is_required=True)
+    number = models.IntegerField("Number", is_required=True)
+
+    @classmethod
+    def table_name(cls):
+        return "compact_table"
+
+
+def test_compact_model_has_no_instance_dict():
+    instance = ModelFilter(CompactModel)._create_instance_from_record(make_record())
+
+    assert not hasattr(instance, "__dict__")
+    assert (instance.username, instance.number) == ("user1", 10)
+    assert instance.get_page_id() == "page-1"
+
+    instance.number = 12
+    assert instance.get_dirty_fields() == ["number"]
+    with pytest.raises(AttributeError):
+        instance.unknown = 1
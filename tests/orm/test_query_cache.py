@@ -0,0 +1,100 @@
+import os
+import sys
+
+module_path = os.path.join(os.path.dirname(__file__), "..", "..")
+sys.path.append(module_path)
+
+from notion_api.orm import models
+from notion_api.orm.orm_models import ModelFilter
+from notion_api.services.v1.v1_base_service import BaseService
+from notion_api.utils.cache import QueryCache, filter_cache_key
+
+
+class CachedModel(models.Model):
+    cache_ttl = 60
+    number = models.IntegerField("Number")
+
+    @classmethod
+    def table_name(cls):
+        return "cached_table"
+
+
+class FakeClient:
+    def __init__(self):
+        self.queries = 0
+
+    def post(self, endpoint, data=None):
+        if endpoint.endswith("/query"):
+            self.queries += 1
+            page = {"id": "p1", "properties": {"Number": {"number": 1}}}
+            return {
+                "code": 200,
+                "body": {"results": [page], "has_more": False, "next_cursor": None},
+            }
+        return {"code": 200, "body": {"id": "p2", "parent": {"database_id": "db"}}}
+
+
+def test_and_or_operand_order_does_not_change_key():
+    a = {"property": "A", "number": {"equals": 1}}
+    b = {"property": "B", "number": {"equals": 2}}
+
+    assert filter_cache_key("d-b", {"and": [a, b]}) == filter_cache_key(
+        "db", {"and": [b, a]}
+    )
+    assert filter_cache_key("db", {"and": [a, b]}) != filter_cache_key(
+        "db", {"or": [a, b]}
+    )
+
+
+def test_cache_evicts_least_recently_used_by_size():
+    cache = QueryCache(max_bytes=60)
+    cache.put("k1", "db", ["x" * 20])
+    cache.put("k2", "db", ["y" * 20])
+    cache.get("k1", ttl=10)
+    cache.put("k3", "db", ["z" * 20])
+
+    assert cache.get("k2", ttl=10) is None
+    assert cache.get("k1", ttl=10) is not None
+    assert cache.size <= 60
+
+
+def test_put_is_dropped_after_concurrent_invalidation():
+    cache = QueryCache()
+    generation = cache.generation("db")
+    cache.invalidate_database("db")
+
+    assert not cache.put("k", "db", [], generation)
+
+
+def test_filter_is_served_from_cache_until_save():
+    client = FakeClient()
+    original = BaseService.client
+    BaseService.client = client
+    ModelFilter.query_cache.clear()
+    try:
+        first = CachedModel.filter("db", number={"equals": 1})
+        second = CachedModel.filter("db", number={"equals": 1})
+        assert client.queries == 1
+        assert first[0] is not second[0]
+        assert second[0].number == 1
+
+        CachedModel(number=2).save("db")
+        CachedModel.filter("db", number={"equals": 1})
+        assert client.queries == 2
+    finally:
+        BaseService.client = original
+
+
+def test_refinement_is_answered_from_cached_superset():
+    client = FakeClient()
+    original = BaseService.client
+    BaseService.client = client
+    ModelFilter.query_cache.clear()
+    try:
+        CachedModel.filter("db")
+        refined = CachedModel.filter("db", number={"greater_than": 5})
+        assert client.queries == 1
+        assert refined == []
+        assert ModelFilter.query_cache.stats.refinements == 1
+    finally:
+        BaseService.client = original
@@ -0,0 +1,224 @@
+import os
+import sys
+
+module_path = os.path.join(os.path.dirname(__file__), "..", "..")
+sys.path.append(module_path)
+
+import pytest
+
+from notion_api.orm import LocalReplica, Q, models
+from notion_api.services.v1.v1_base_service import BaseService
+
+
+class Item(models.Model):
+    username = models.CharField("Username")
+    number = models.IntegerField("Number")
+    date_field = models.DateField("DateField")
+
+    @classmethod
+    def table_name(cls):
+        return "items"
+
+
+@pytest.fixture
+def database_id(server):
+    server.max_page_size = 3
+    database_id = server.add_database(
+        {
+            "Name": {"title": {}},
+            "Username": {"rich_text": {}},
+            "Number": {"number": {}},
+            "DateField": {"date": {}},
+        }
+    )
+    for i, number in enumerate([5, 1, 9, 3, 9, 7, 2]):
+        server.add_page(
+            database_id,
+            {
+                "Username": {"rich_text": [{"text": {"content": f"u{i}"}}]},
+                "Number": {"number": number},
+                "DateField": {"date": {"start": f"2024-01-0{i + 1}"}},
+            },
+        )
+    return database_id
+
+
+def test_order_by_sorts_on_the_server(database_id):
+    items = Item.filter(database_id, order_by=["-number", "-date_field"], limit=4)
+
+    assert [(i.number, i.username) for i in items] == [
+        (9, "u4"),
+        (9, "u2"),
+        (7, "u5"),
+        (5, "u0"),
+    ]
+
+
+def test_limit_stops_paginating(database_id, monkeypatch):
+    bodies = []
+    post = BaseService.client.post
+
+    def recording_post(endpoint, data=None, **kwargs):
+        bodies.append(data)
+        return post(endpoint, data, **kwargs)
+
+    monkeypatch.setattr(BaseService.client, "post", recording_post)
+    items = Item.filter(database_id, order_by="number", limit=4)
+
+    assert [i.number for i in items] == [1, 2, 3, 5]
+    assert [b["page_size"] for b in bodies] == [4, 1]
+    assert bodies[0]["sorts"] == [{"property": "Number", "direction": "ascending"}]
+
+
+def test_only_requests_selected_properties(database_id):
+    items = Item.filter(database_id, order_by=["number"], only=["number"])
+
+    assert [i.number for i in items] == [1, 2, 3, 5, 7, 9, 9]
+    assert all(i.username is None and i.date_field is None for i in items)
+
+
+def test_split_queries_sort_on_properties_left_out_by_only(database_id):
+    # 一致するページが分割した両方のクエリに分かれるように並べる
+    many = Q(number={"equals": 5})
+    for i in [1, 3, 2, *range(100, 200), 9, 7]:
+        many = many | Q(number={"equals": i})
+    order_by = ["-number", "-date_field"]
+    queryset = Item.objects.using(database_id).filter(many).order_by(*order_by)
+
+    assert len(queryset.query_bodies()) == 2
+    items = queryset.only("username")[:3]
+    assert [i.username for i in items] == ["u4", "u2", "u5"]
+    items = Item.filter(
+        database_id, _q=many, order_by=order_by, limit=3, only=["username"]
+    )
+    assert [i.username for i in items] == ["u4", "u2", "u5"]
+    # 並べ替えのために取得したプロパティは結果に残さない
+    assert all(i.number is None and i.date_field is None for i in items)
+
+
+def test_replica_sorts_and_limits_locally(database_id):
+    with LocalReplica(database_id, ":memory:") as replica:
+        replica.sync()
+        items = Item.filter(
+            database_id, _replica=replica, order_by=["-number"], limit=2
+        )
+    assert [i.number for i in items] == [9, 9]
+
+
+def test_replica_applies_only(database_id):
+    with LocalReplica(database_id, ":memory:") as replica:
+        replica.sync()
+        items = Item.filter(
+            database_id, _replica=replica, order_by=["number"], only=["number"]
+        )
+        with pytest.raises(ValueError):
+            Item.filter(database_id, _replica=replica, only=["missing"])
+    assert [i.number for i in items] == [1, 2, 3, 5, 7, 9, 9]
+    assert all(i.username is None and i.date_field is None for i in items)
+
+
+@pytest.mark.parametrize("options", [{"_prefetch": True}, {"_partition_by": "number"}])
+def test_replica_rejects_scan_options(database_id, options):
+    with LocalReplica(database_id, ":memory:") as replica:
+        replica.sync()
+        with pytest.raises(ValueError):
+            Item.filter(database_id, _replica=replica, **options)
+
+
+def test_cached_filter_applies_only(database_id):
+    class CachedItem(Item):
+        cache_ttl = 60
+
+    full = CachedItem.filter(database_id, order_by=["number"])
+    items = CachedItem.filter(database_id, order_by=["number"], only=["username"])
+
+    assert [i.username for i in items] == [i.username for i in full]
+    assert all(i.number is None and i.date_field is None for i in items)
+    # 射影はキャッシュ済みのページを書き換えない
+    assert [i.number for i in CachedItem.filter(database_id)] != [None] * 7
+
+
+def test_invalid_order_by_field_is_rejected(database_id):
+    with pytest.raises(ValueError):
+        Item.filter(database_id, order_by=["missing"])
+
+
+@pytest.mark.parametrize("partition_by", ["number", "date_field", "created_time"])
+def test_partitioned_scan_matches_a_single_scan(database_id, partition_by):
+    Item(username="empty").save(database_id)
+    expected = Item.filter(database_id, order_by=["-number", "username"])
+
+    items = Item.filter(
+        database_id,
+        order_by=["-number", "username"],
+        _partition_by=partition_by,
+        _partitions=3,
+    )
+
+    assert [i.username for i in items] == [i.username for i in expected]
+    assert len(items) == 8
+
+
+def test_partitioned_scan_runs_one_query_per_partition(database_id, monkeypatch):
+    bodies = []
+    post = BaseService.client.post
+
+    def recording_post(endpoint, data=None, **kwargs):
+        bodies.append(data)
+        return post(endpoint, data, **kwargs)
+
+    monkeypatch.setattr(BaseService.client, "post", recording_post)
+    items = Item.filter(
+        database_id,
+        number={"greater_than": 1},
+        _partition_by="number",
+        _partitions=2,
+    )
+
+    assert sorted(i.number for i in items) == [2, 3, 5, 7, 9, 9]
+    # 範囲を求める 2 件 + 2 つの範囲と空のセル
+    assert [b["page_size"] for b in bodies[:2]] == [1, 1]
+    partition_filters = [b["filter"] for b in bodies[2:] if "start_cursor" not in b]
+    assert len(partition_filters) == 3
+    # 元の条件は各範囲の条件と併合される (範囲は 2..9 の中点 6 で分かれる)
+    assert {
+        "and": [
+            {"property": "Number", "number": {"greater_than": 1}},
+            {"property": "Number", "number": {"less_than": 6}},
+        ]
+    } in partition_filters
+    assert {
+        "property": "Number",
+        "number": {"greater_than_or_equal_to": 6},
+    } in partition_filters
+
+
+def test_partitioned_scan_sorts_on_properties_left_out_by_only(database_id):
+    items = Item.filter(
+        database_id,
+        order_by=["-number", "-date_field"],
+        limit=3,
+        only=["username"],
+        _partition_by="date_field",
+        _partitions=3,
+    )
+
+    assert [i.username for i in items] == ["u4", "u2", "u5"]
+    assert all(i.number is None and i.date_field is None for i in items)
+
+
+def test_partition_field_must_be_a_range_field(database_id):
+    with pytest.raises(ValueError):
+        Item.filter(database_id, _partition_by="username")
+
+
+def test_partition_accepts_date_field_subclasses(database_id):
+    class DayField(models.DateField):
+        pass
+
+    class DayItem(Item):
+        day = DayField("DateField")
+
+    items = DayItem.filter(database_id, _partition_by="day", _partitions=3)
+
+    assert sorted(i.number for i in items) == [1, 2, 3, 5, 7, 9, 9]
@@ -0,0 +1,168 @@
+import os
+import sys
+
+module_path = os.path.join(os.path.dirname(__file__), "..", "..")
+sys.path.append(module_path)
+
+import pytest
+
+from notion_api.orm import Q, models
+
+
+class Item(models.Model):
+    username = models.CharField("Username")
+    number = models.IntegerField("Number")
+    selects = models.SelectField(
+        "Selects", [models.SelectField.option("a"), models.SelectField.option("b")]
+    )
+
+    @classmethod
+    def table_name(cls):
+        return "items"
+
+
+@pytest.fixture
+def items(server):
+    server.max_page_size = 2
+    database_id = server.add_database(
+        {
+            "Name": {"title": {}},
+            "Username": {"rich_text": {}},
+            "Number": {"number": {}},
+            "Selects": {"select": {"options": [{"name": "a"}, {"name": "b"}]}},
+        }
+    )
+    for i in range(9):
+        server.add_page(
+            database_id,
+            {
+                "Username": {"rich_text": [{"text": {"content": f"u{i}"}}]},
+                "Number": {"number": i},
+                "Selects": {"select": {"name": "ab"[i % 2]}},
+            },
+        )
+    server.requests.clear()
+    return Item.objects.using(database_id)
+
+
+def queries(server):
+    return [r for r in server.requests if r[1].endswith("/query")]
+
+
+def test_queryset_is_lazy_and_chainable(server, items):
+    queryset = (
+        items.filter(number={"greater_than": 2})
+        .exclude(selects={"equals": "b"})
+        .order_by("-number")
+    )
+    assert queries(server) == []
+
+    assert [i.number for i in queryset] == [8, 6, 4]
+    assert queryset.query_body()["sorts"] == [
+        {"property": "Number", "direction": "descending"}
+    ]
+    # 2 回目は結果を再利用する
+    list(queryset)
+    assert len(queries(server)) == 2
+
+
+def test_slices_and_first_stop_early(server, items):
+    assert [i.number for i in items.order_by("number")[2:5]] == [2, 3, 4]
+    server.requests.clear()
+
+    assert items.order_by("-number").first().number == 8
+    assert len(queries(server)) == 1
+    assert items.order_by("number")[3].number == 3
+    assert items.filter(number={"greater_than": 100}).first() is None
+
+
+def test_exists_and_count(server, items):
+    assert items.filter(selects={"equals": "a"}).exists()
+    assert not items.filter(number={"less_than": 0}).exists()
+    assert items.exclude(number={"less_than": 3}).count() == 6
+    assert items[1:4].count() == 3
+
+
+def test_iteration_streams_pages(server, items):
+    for item in items.order_by("number"):
+        break
+    assert len(queries(server)) == 1
+
+
+def test_invalid_filters_are_rejected(items):
+    with pytest.raises(ValueError):
+        items.filter(missing={"equals": 1})
+    with pytest.raises(ValueError):
+        items.filter(number={"near": 1})
+    with pytest.raises(ValueError):
+        items[:2].filter(number={"equals": 1})
+
+
+def test_objects_needs_a_database():
+    with pytest.raises(ValueError):
+        Item.objects.first()
+    with pytest.raises(AttributeError):
+        Item().objects
+
+
+def test_q_objects_compile_to_nested_filters(server, items):
+    queryset = items.filter(
+        Q(number={"greater_than": 6})
+        | (Q(selects={"equals": "b"}) & ~Q(number={"equals": 1}))
+    ).order_by("number")
+
+    assert [i.number for i in queryset] == [3, 5, 7, 8]
+    assert queryset.query_body()["filter"] == {
+        "or": [
+            {"property": "Number", "number": {"greater_than": 6}},
+            {
+                "and": [
+                    {"property": "Selects", "select": {"equals": "b"}},
+                    {"property": "Number", "number": {"does_not_equal": 1}},
+                ]
+            },
+        ]
+    }
+
+
+def test_too_deep_filters_are_rewritten(server, items):
+    deep = Q(selects={"equals": "a"}) & (
+        Q(number={"equals": 0})
+        | (
+            Q(username={"contains": "u"})
+            & (Q(number={"greater_than": 6}) | Q(number={"equals": 2}))
+        )
+    )
+    queryset = items.filter(deep).order_by("-number")
+
+    # 深すぎる木は and 項の or に書き換えて 1 回で送る
+    assert len(queryset.query_bodies()) == 1
+    assert [i.number for i in queryset] == [8, 2, 0]
+    assert [i.number for i in queryset[:2]] == [8, 2]
+
+
+def test_model_filter_accepts_q_and_groups_conditions_per_field(server, items):
+    database_id = items.database_id
+    result = Item.filter(
+        database_id,
+        _operator="or",
+        number={"greater_than": 1, "less_than": 4},
+        selects={"equals": "b"},
+    )
+    assert sorted(i.number for i in result) == [1, 2, 3, 5, 7]
+
+    result = Item.filter(database_id, _q=~Q(number={"less_than": 7}), order_by="number")
+    assert [i.number for i in result] == [7, 8]
+
+
+def test_oversized_filters_are_sent_as_several_queries(server, items):
+    many = Q(number={"equals": -1})
+    for i in range(60):
+        many = many | Q(username={"equals": f"u{i}"})
+    queryset = items.filter(
+        Q(selects={"equals": "a"})
+        & (Q(number={"equals": 0}) | (Q(number={"less_than": 5}) & many))
+    ).order_by("number")
+
+    assert len(queryset.query_bodies()) == 2
+    assert [i.number for i in queryset] == [0, 2, 4]
@@ -0,0 +1,115 @@
+import os
+import sys
+
+module_path = os.path.join(os.path.dirname(__file__), "..", "..")
+sys.path.append(module_path)
+
+from notion_api.orm import models, LocalReplica
+from notion_api.services.v1.v1_base_service import BaseService
+
+
+class ReplicaModel(models.Model):
+    username = models.CharField("Username")
+    number = models.IntegerField("Number")
+    tags = models.MultiSelectField(
+        "Tags",
+        [models.MultiSelectField.option("x"), models.MultiSelectField.option("y")],
+    )
+    done = models.BoolField("Done")
+
+    @classmethod
+    def table_name(cls):
+        return "replica_table"
+
+
+def make_page(page_id, number, edited, username="user", tags=(), done=False):
+    return {
+        "id": page_id,
+        "last_edited_time": edited,
+        "properties": {
+            "Username": {"rich_text": [{"plain_text": username}]},
+            "Number": {"number": number},
+            "Tags": {"multi_select": [{"name": tag} for tag in tags]},
+            "Done": {"checkbox": done},
+        },
+    }
+
+
+class FakeClient:
+    def __init__(self, pages):
+        self.pages = pages
+        self.bodies = []
+
+    def post(self, endpoint, data=None):
+        self.bodies.append(data)
+        results = self.pages
+        condition = (data.get("filter") or {}).get("last_edited_time")
+        if condition:
+            results = [
+                p for p in results if p["last_edited_time"] >= condition["on_or_after"]
+            ]
+        return {
+            "code": 200,
+            "body": {"results": results, "has_more": False, "next_cursor": None},
+        }
+
+
+def test_sync_is_incremental_and_reconciles_archived_pages(tmp_path):
+    client = FakeClient(
+        [
+            make_page("p1", 1, "2024-01-01T00:00:00.000Z"),
+            make_page("p2", 2, "2024-01-02T00:00:00.000Z"),
+        ]
+    )
+    original = BaseService.client
+    BaseService.client = client
+    try:
+        replica = LocalReplica("db", str(tmp_path / "replica.db"))
+        assert replica.sync().full
+        assert len(replica) == 2
+
+        client.pages = [
+            client.pages[0],
+            make_page("p2", 20, "2024-01-03T00:00:00.000Z"),
+        ]
+        result = replica.sync()
+        assert not result.full and result.upserted == 1
+        assert client.bodies[-1]["filter"]["last_edited_time"] == {
+            "on_or_after": "2024-01-02T00:00:00.000Z"
+        }
+
+        client.pages = client.pages[1:]
+        assert replica.sync().removed == 0
+        assert replica.sync(full=True).removed == 1
+        assert [p["id"] for p in replica.query()] == ["p2"]
+        replica.close()
+    finally:
+        BaseService.client = original
+
+
+def test_filter_runs_against_replica(tmp_path):
+    replica = LocalReplica("d-b", str(tmp_path / "replica.db"))
+    for page in [
+        make_page("p1", 10, "t", username="Alice", tags=["x"], done=True),
+        make_page("p2", 50, "t", username="bob", tags=["x", "y"]),
+        make_page("p3", None, "t", username="carol"),
+    ]:
+        replica.upsert(page)
+
+    def ids(**kwargs):
+        return sorted(
+            m.page_id for m in ReplicaModel.filter("db", _replica=replica, **kwargs)
+        )
+
+    assert ids(number={"greater_than": 20}) == ["p2"]
+    assert ids(number={"does_not_equal": 10}) == ["p2", "p3"]
+    assert ids(username={"contains": "ALI"}) == ["p1"]
+    assert ids(tags={"contains": "x"}, done={"equals": False}) == ["p2"]
+    assert ids(_operator="or", number={"equals": 10}, tags={"contains": "y"}) == [
+        "p1",
+        "p2",
+    ]
+    assert ReplicaModel.filter("db", _replica=replica, number={"equals": 50})[
+        0
+    ].tags == ["x", "y"]
+    replica.close()
@@ -0,0 +1,61 @@
+import os
+import sys
+
+module_path = os.path.join(os.path.dirname(__file__), "..", "..")
+sys.path.append(module_path)
+
+import pytest
+
+from conftest import PARENT_ID, Stock
+from notion_api.services.v1.v1_base_service import BaseService
+
+
+@pytest.fixture
+def patches(server, monkeypatch):
+    """The database id and the PATCH v1/pages bodies sent to the fake server."""
+    client = BaseService.client
+    bodies = []
+    patch = client.patch
+
+    def recording_patch(endpoint, data=None, **kwargs):
+        if endpoint.startswith("v1/pages"):
+            bodies.append(data)
+        return patch(endpoint, data, **kwargs)
+
+    monkeypatch.setattr(client, "patch", recording_patch)
+    database_id = Stock.migrate(parent_id=PARENT_ID)["database_id"]
+    return database_id, bodies
+
+
+def test_update_sends_only_changed_properties(patches):
+    database_id, bodies = patches
+    stock = Stock(ticker="T0", price=1, kind="a")
+    stock.save(database_id)
+
+    assert stock.update(database_id) is None
+    assert bodies == []
+
+    stock.price = 2
+    stock.update(database_id)
+    fetched = Stock.filter(database_id)[0]
+    fetched.kind = "b"
+    fetched.update(database_id)
+
+    assert [b["properties"] for b in bodies] == [
+        {"Price": {"number": 2}},
+        {"Kind": {"select": {"name": "b"}}},
+    ]
+    assert (Stock.filter(database_id)[0].price, fetched.price) == (2, 2)
+
+
+def test_bulk_update_without_fields_sends_dirty_fields(patches):
+    database_id, bodies = patches
+    stocks = [Stock(ticker=f"T{i}", price=i) for i in range(2)]
+    Stock.bulk_create(database_id, stocks)
+    stocks[0].price = 10
+
+    results = Stock.bulk_update(database_id, stocks)
+
+    assert all(r.ok for r in results)
+    # 変更のないインスタンスにはリクエストを送らない
+    assert [b["properties"] for b in bodies] == [{"Price": {"number": 10}}]
@@ -21,16 +21,53 @@ from notion_api.orm.fields import (
 import json
 import logging
 
+import pytest
+
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
-database_id = "6ef167bccb674124810c99f06ea1da8f"
+DATABASE_ID = "6ef167bccb674124810c99f06ea1da8f"
+
+
+@pytest.fixture
+def database_id(server):
+    """The 財務諸表 database, recreated on the fake server."""
+    server.add_database(
+        {
+            "Name": {"title": {}},
+            "株価(3/1)": {"number": {}},
+            "ROE": {"number": {}},
+            "決算": {
+                "select": {"options": [{"name": "年次決算"}, {"name": "四半期決算"}]}
+            },
+            "is_test": {"checkbox": {}},
+        },
+        title="財務諸表",
+        parent_id="00f4b5a76828414b8f56ab0eb2a6c0ea",
+        id=DATABASE_ID,
+    )
+    for price, roe, settlement in [
+        (800, 8, "四半期決算"),
+        (3000, 25, "年次決算"),
+        (6000, 15, "年次決算"),
+        (12000, 10, "四半期決算"),
+    ]:
+        server.add_page(
+            DATABASE_ID,
+            {
+                "株価(3/1)": {"number": price},
+                "ROE": {"number": roe},
+                "決算": {"select": {"name": settlement}},
+                "is_test": {"checkbox": False},
+            },
+        )
+    return DATABASE_ID
 
 
-def test_get_databases_detail():
+def test_get_databases_detail(database_id):
 
     d = DataBaseService()
-    data = d.get_notion_databases("6ef167bccb674124810c99f06ea1da8f")
+    data = d.get_notion_databases(database_id)
 
     assert data.title[0].plain_text == "財務諸表"
     assert data.parent["type"] == "page_id"
@@ -41,7 +78,7 @@ def test_get_databases_detail():
     assert data.properties["決算"].select["options"][0]["name"] == "年次決算"
 
 
-def test_create_database():
+def test_create_database(server):
     d = DataBaseService()
     parent_id = "a214e6c2d6e044d39cb5b98dc438c5dc"
     database_property = {
@@ -53,7 +90,7 @@ def test_create_database():
     assert response["code"] == 200
 
 
-def test_get_all_records():
+def test_get_all_records(database_id):
     d = DataBaseService()
 
     for i in d.get_database_records(database_id):
@@ -62,7 +99,7 @@ def test_get_all_records():
             assert True
 
 
-def test_filter_records():
+def test_filter_records(database_id):
     d = DataBaseService()
 
     stock_price_threshold = 5000
@@ -87,9 +124,8 @@ def test_filter_records():
 
 
 # 複数条件のテストケース
-def test_filter_records_multiple_conditions():
+def test_filter_records_multiple_conditions(database_id):
     d = DataBaseService()
-    database_id = "6ef167bccb674124810c99f06ea1da8f"
     stock_price = 1000
     roe = 12
 
@@ -110,9 +146,8 @@ def test_filter_records_multiple_conditions():
         assert record.properties["ROE"]["number"] > roe
 
 
-def test_filter_records_or_condition():
+def test_filter_records_or_condition(database_id):
     d = DataBaseService()
-    database_id = "6ef167bccb674124810c99f06ea1da8f"
     stock_price_threshold = 10000
     roe_threshold = 20
 
@@ -159,7 +194,7 @@ def test_filter_records_or_condition():
     ), "OR condition is not working as expected"
 
 
-def test_insert_record():
+def test_insert_record(database_id):
     d = DataBaseService()
 
     record = DatabaseRecord(database_id)
@@ -183,9 +218,8 @@ def test_insert_record():
     assert result["is_test"]["checkbox"] == True
 
 
-def test_update_record():
+def test_update_record(database_id):
     d = DataBaseService()
-    database_id = "6ef167bccb674124810c99f06ea1da8f"
 
     insert_record = DatabaseRecord(database_id)
     insert_record.add_property("株価(3/1)", 1000, IntegerField("株価(3/1)"))
@@ -216,9 +250,8 @@ def test_update_record():
     assert result["is_test"]["checkbox"] == True
 
 
-def test_delete_record():
+def test_delete_record(database_id):
     d = DataBaseService()
-    database_id = "6ef167bccb674124810c99f06ea1da8f"
 
     # First, insert a new record
     insert_record = DatabaseRecord(database_id)
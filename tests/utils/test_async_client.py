@@ -0,0 +1,83 @@
+import os
+import sys
+
+module_path = os.path.join(os.path.dirname(__file__), "..", "..")
+sys.path.append(module_path)
+
+import asyncio
+
+from conftest import PARENT_ID, Stock
+from notion_api.services.v1.async_databases import AsyncDataBaseService
+from notion_api.services.v1.v1_base_service import AsyncBaseService
+
+
+def test_async_model_round_trip(server):
+    database_id = Stock.migrate(parent_id=PARENT_ID)["database_id"]
+
+    async def run():
+        for i in range(4):
+            await Stock(ticker=f"T{i}", price=i * 10).asave(database_id)
+        stocks = await Stock.afilter(database_id, price={"greater_than": 5})
+        assert sorted(s.ticker for s in stocks) == ["T1", "T2", "T3"]
+
+        stock = (await Stock.afilter(database_id, ticker={"equals": "T1"}))[0]
+        stock.price = 0
+        await stock.aupdate(database_id)
+        assert await stock.adelete()
+        t2 = (await Stock.afilter(database_id, ticker={"equals": "T2"}))[0]
+        assert await Stock.adelete_by_id(database_id, t2.page_id)
+        stocks = await Stock.afilter(database_id, order_by="price")
+        await AsyncBaseService.client.aclose()
+        return stocks
+
+    assert [(s.ticker, s.price) for s in asyncio.run(run())] == [
+        ("T0", 0),
+        ("T3", 30),
+    ]
+
+
+def test_async_query_follows_cursors_and_retries(server):
+    server.max_page_size = 2
+    database_id = server.add_database({"Name": {"title": {}}})
+    for i in range(5):
+        server.add_page(
+            database_id, {"Name": {"title": [{"text": {"content": str(i)}}]}}
+        )
+    server.fail_next(429)
+
+    async def run():
+        async with AsyncBaseService.client:
+            d = AsyncDataBaseService()
+            return [p async for p in d.iter_query_results(database_id, page_size=2)]
+
+    pages = asyncio.run(run())
+
+    assert [p["properties"]["Name"]["title"][0]["plain_text"] for p in pages] == [
+        "0",
+        "1",
+        "2",
+        "3",
+        "4",
+    ]
+    assert server.requests.count(("POST", f"v1/databases/{database_id}/query")) == 4
+
+
+def test_session_from_another_loop_is_closed(server):
+    client = AsyncBaseService.client
+    database_id = server.add_database({"Name": {"title": {}}})
+
+    async def get():
+        await client.get(f"v1/databases/{database_id}")
+        return client._session
+
+    loop = asyncio.new_event_loop()
+    try:
+        first = loop.run_until_complete(get())
+        second = asyncio.run(get())
+    finally:
+        loop.close()
+
+    assert first is not second
+    assert first.is_closed
+    asyncio.run(client.aclose())
+    assert second.is_closed
@@ -0,0 +1,104 @@
+import gc
+import os
+import sys
+import threading
+
+module_path = os.path.join(os.path.dirname(__file__), "..", "..")
+sys.path.append(module_path)
+
+import pytest
+import requests
+
+from notion_api.orm.bulk import run_bulk
+from notion_api.utils.client import BaseAPIClient
+
+
+class RecordingClient(BaseAPIClient):
+    def __init__(self, **kwargs):
+        super().__init__(api_key="test", rate_limiter=None, **kwargs)
+        self.kwargs = None
+
+    def request(self, method, url, **kwargs):
+        self.kwargs = kwargs
+        response = requests.Response()
+        response.status_code = 200
+        response._content = b"{}"
+        return response
+
+
+def test_pool_settings_are_applied_to_adapters():
+    client = BaseAPIClient(api_key="test", pool_connections=3, pool_maxsize=7)
+
+    adapter = client.get_adapter("https://api.notion.com/v1/pages")
+
+    assert adapter._pool_connections == 3
+    assert adapter._pool_maxsize == 7
+
+
+def test_connect_and_read_timeouts_are_sent():
+    client = RecordingClient(connect_timeout=2, read_timeout=9)
+
+    client.get("v1/databases/db")
+    assert client.kwargs["timeout"] == (2, 9)
+
+    client.get("v1/databases/db", timeout=1)
+    assert client.kwargs["timeout"] == 1
+
+
+def test_keep_alive_can_be_disabled():
+    assert BaseAPIClient(api_key="test", keep_alive=False).headers["Connection"] == (
+        "close"
+    )
+
+
+def test_per_thread_sessions_are_not_shared():
+    client = BaseAPIClient(api_key="test", session_mode="per_thread", pool_maxsize=5)
+    sessions = []
+
+    def worker():
+        sessions.append(client._session())
+        sessions.append(client._session())
+
+    threads = [threading.Thread(target=worker) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sessions[0] is sessions[1] and sessions[2] is sessions[3]
+    assert sessions[0] is not sessions[2]
+    assert sessions[0].headers is client.headers
+    assert sessions[0].get_adapter("https://x")._pool_maxsize == 5
+    client.close()
+    assert len(client._thread_sessions) == 0
+
+
+def test_sessions_of_finished_threads_are_closed(monkeypatch):
+    client = BaseAPIClient(api_key="test", session_mode="per_thread")
+    closed = []
+    close = requests.Session.close
+
+    def recording_close(session):
+        closed.append(session)
+        close(session)
+
+    monkeypatch.setattr(requests.Session, "close", recording_close)
+    used = set()
+
+    def use_session(item):
+        used.add(client._session())
+        return {}
+
+    # run_bulk は呼び出しごとに新しいスレッドプールを作る
+    for _ in range(5):
+        run_bulk(use_session, range(8), 4)
+    gc.collect()
+
+    assert len(used) >= 5
+    assert set(closed) == used
+    assert len(client._thread_sessions) == 0
+
+
+def test_unknown_session_mode_is_rejected():
+    with pytest.raises(ValueError):
+        BaseAPIClient(api_key="test", session_mode="pooled")
@@ -0,0 +1,156 @@
+import os
+import sys
+
+module_path = os.path.join(os.path.dirname(__file__), "..", "..")
+sys.path.append(module_path)
+
+import json
+import time
+
+import pytest
+import requests
+
+from notion_api.utils.client import BaseAPIClient
+from notion_api.utils.exceptions import (
+    APIResponseError,
+    RateLimitedError,
+    ServerError,
+)
+from notion_api.services.v1.databases import DataBaseService
+from notion_api.services.v1.v1_base_service import BaseService
+from notion_api.testing import FakeNotionServer
+from notion_api.utils.rate_limit import TokenBucket
+from notion_api.utils.retry import RetryPolicy, is_idempotent, parse_retry_after
+
+
+def make_response(status_code, body, headers=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = json.dumps(body).encode()
+    response.headers.update(headers or {})
+    return response
+
+
+class ScriptedClient(BaseAPIClient):
+    def __init__(self, responses, **kwargs):
+        kwargs.setdefault("rate_limiter", None)
+        kwargs.setdefault("retry_policy", RetryPolicy(max_retries=3, backoff_base=0))
+        super().__init__(api_key="test", **kwargs)
+        self.responses = list(responses)
+        self.calls = 0
+
+    def request(self, method, url, **kwargs):
+        self.calls += 1
+        return self.responses.pop(0)
+
+
+def test_retries_rate_limited_requests():
+    client = ScriptedClient(
+        [
+            make_response(429, {"code": "rate_limited"}, {"Retry-After": "0"}),
+            make_response(503, {"code": "service_unavailable"}),
+            make_response(200, {"object": "list", "results": []}),
+        ]
+    )
+
+    response = client.post("v1/databases/db/query")
+
+    assert response == {"code": 200, "body": {"object": "list", "results": []}}
+    assert client.calls == 3
+
+
+def test_raises_typed_error_when_retries_are_exhausted():
+    client = ScriptedClient(
+        [make_response(429, {"code": "rate_limited"}, {"Retry-After": "0"})] * 4
+    )
+
+    with pytest.raises(RateLimitedError) as e:
+        client.get("v1/databases/db")
+
+    assert e.value.status_code == 429
+    assert e.value.code == "rate_limited"
+    assert e.value.retry_after == 0
+    assert e.value.attempts == 4
+    assert client.calls == 4
+
+
+def test_does_not_retry_client_errors():
+    client = ScriptedClient(
+        [make_response(400, {"code": "validation_error", "message": "bad"})]
+    )
+
+    with pytest.raises(APIResponseError) as e:
+        client.patch("v1/pages/page", {})
+
+    assert not isinstance(e.value, ServerError)
+    assert e.value.status_code == 400
+    assert client.calls == 1
+
+
+def test_writes_are_only_retried_when_rate_limited():
+    client = ScriptedClient(
+        [
+            make_response(429, {"code": "rate_limited"}, {"Retry-After": "0"}),
+            make_response(503, {"code": "service_unavailable"}),
+        ]
+    )
+
+    with pytest.raises(ServerError):
+        client.post("v1/pages", {})
+
+    assert client.calls == 2
+    assert is_idempotent("POST", "v1/databases/db/query?filter_properties=title")
+    assert not is_idempotent("PATCH", "v1/pages/page")
+
+
+def test_timed_out_insert_is_not_sent_again(monkeypatch):
+    with FakeNotionServer(latency=0.3) as server:
+        database_id = server.add_database({"Name": {"title": {}}})
+        client = server.client(
+            read_timeout=0.1,
+            retry_policy=RetryPolicy(max_retries=3, backoff_base=0, backoff_max=0),
+        )
+        monkeypatch.setattr(BaseService, "client", client)
+
+        with pytest.raises(requests.ReadTimeout):
+            DataBaseService().insert_record(
+                database_id,
+                {"parent": {"database_id": database_id}, "properties": {}},
+            )
+        with pytest.raises(requests.ReadTimeout):
+            client.get(f"v1/databases/{database_id}")
+        time.sleep(0.4)
+        client.close()
+
+    # ページ作成は 1 回だけ送り、読み取りは再試行する
+    assert server.requests.count(("POST", "v1/pages")) == 1
+    assert len(server.pages) == 1
+    assert server.requests.count(("GET", f"v1/databases/{database_id}")) == 4
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("not a date") is None
+
+
+def test_token_bucket_spaces_out_requests():
+    now = [0.0]
+    bucket = TokenBucket(rate=2, capacity=2, clock=lambda: now[0])
+
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == pytest.approx(0.5)
+    assert bucket.reserve() == pytest.approx(1.0)
+
+    now[0] = 10.0
+    assert bucket.reserve() == 0
+
+
+def test_token_bucket_pause_holds_back_callers():
+    now = [0.0]
+    bucket = TokenBucket(rate=10, capacity=10, clock=lambda: now[0])
+
+    bucket.pause(2)
+
+    assert bucket.reserve() == pytest.approx(2)
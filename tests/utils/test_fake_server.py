@@ -0,0 +1,74 @@
+import os
+import sys
+
+module_path = os.path.join(os.path.dirname(__file__), "..", "..")
+sys.path.append(module_path)
+
+import pytest
+
+from conftest import PARENT_ID, Stock
+from notion_api.services.v1.databases import DataBaseService
+from notion_api.services.v1.v1_base_service import BaseService
+from notion_api.utils.exceptions import APIResponseError
+from notion_api.utils.retry import RetryPolicy
+
+
+def test_model_round_trip(server):
+    database_id = Stock.migrate(parent_id=PARENT_ID)["database_id"]
+    for i in range(5):
+        Stock(ticker=f"T{i}", price=i * 10, kind="ab"[i % 2]).save(database_id)
+
+    stocks = Stock.filter(database_id, price={"greater_than_or_equal_to": 20})
+    assert sorted(s.ticker for s in stocks) == ["T2", "T3", "T4"]
+
+    stock = Stock.filter(database_id, ticker={"equals": "T3"})[0]
+    stock.price = 5
+    stock.update(database_id)
+    Stock.filter(database_id, ticker={"equals": "T4"})[0].delete()
+
+    stocks = Stock.filter(database_id, price={"greater_than_or_equal_to": 20})
+    assert [s.ticker for s in stocks] == ["T2"]
+    assert not Stock.migrate(database_id=database_id)["plan"].has_changes
+
+
+def test_query_paginates_with_cursors(server):
+    server.max_page_size = 2
+    database_id = server.add_database({"Name": {"title": {}}})
+    for i in range(5):
+        server.add_page(
+            database_id, {"Name": {"title": [{"text": {"content": str(i)}}]}}
+        )
+
+    pages = list(DataBaseService().iter_query_results(database_id, page_size=2))
+    titles = [p["properties"]["Name"]["title"][0]["plain_text"] for p in pages]
+    assert titles == ["0", "1", "2", "3", "4"]
+    assert server.requests.count(("POST", f"v1/databases/{database_id}/query")) == 3
+
+
+def test_injected_rate_limits_are_retried(server):
+    database_id = server.add_database({"Name": {"title": {}}})
+    server.fail_next(429, count=2)
+
+    response = BaseService.client.get(f"v1/databases/{database_id}")
+
+    assert response["body"]["id"] == database_id
+    assert len(server.requests) == 3
+
+
+def test_errors_use_notion_error_bodies(server):
+    client = server.client(retry_policy=RetryPolicy(max_retries=0))
+    with pytest.raises(APIResponseError) as e:
+        client.get("v1/databases/00000000000000000000000000000000")
+    assert e.value.status_code == 404
+
+    database_id = server.add_database({"Name": {"title": {}}})
+    with pytest.raises(APIResponseError) as e:
+        client.post(
+            "v1/pages",
+            {
+                "parent": {"database_id": database_id},
+                "properties": {"Missing": {"number": 1}},
+            },
+        )
+    assert e.value.status_code == 400
+    client.close()
@@ -0,0 +1,110 @@
+import os
+import sys
+
+module_path = os.path.join(os.path.dirname(__file__), "..", "..")
+sys.path.append(module_path)
+
+import pytest
+
+from notion_api.orm.replica import LocalReplica
+from notion_api.utils.databases_filter_builders import (
+    FilterComposer,
+    MultiSelectFilterBuilder,
+    NumberFilterBuilder,
+    TextFilterBuilder,
+)
+from notion_api.utils.filter_evaluator import filter_pages, matches, sort_pages
+
+
+def make_page(page_id, number=None, text=None, select=None, tags=(), date=None):
+    return {
+        "id": page_id,
+        "last_edited_time": "2024-01-01T00:00:00.000Z",
+        "properties": {
+            "Name": {"title": [{"plain_text": page_id}]},
+            "Text": {"rich_text": [{"plain_text": text}] if text else []},
+            "Number": {"number": number},
+            "Select": {"select": {"name": select} if select else None},
+            "Tags": {"multi_select": [{"name": tag} for tag in tags]},
+            "Date": {"date": {"start": date} if date else None},
+            "Done": {"checkbox": number is not None and number > 5},
+        },
+    }
+
+
+PAGES = [
+    make_page("p1", 1, "Hello World", "a", ["x"], "2024-01-01"),
+    make_page("p2", 10, "hello", "b", ["x", "y"], "2024-02-01T10:00:00.000Z"),
+    make_page("p3", None, None, None, [], None),
+]
+
+FILTERS = [
+    {"property": "Number", "number": {"greater_than": 1}},
+    {"property": "Number", "number": {"does_not_equal": 1}},
+    {"property": "Number", "number": {"is_empty": True}},
+    {"property": "Text", "rich_text": {"contains": "WORLD"}},
+    {"property": "Text", "rich_text": {"does_not_contain": "world"}},
+    {"property": "Text", "rich_text": {"starts_with": "hel"}},
+    {"property": "Text", "rich_text": {"equals": "hello"}},
+    {"property": "Name", "rich_text": {"ends_with": "2"}},
+    {"property": "Select", "select": {"equals": "a"}},
+    {"property": "Select", "select": {"does_not_equal": "a"}},
+    {"property": "Tags", "multi_select": {"contains": "y"}},
+    {"property": "Tags", "multi_select": {"does_not_contain": "y"}},
+    {"property": "Tags", "multi_select": {"is_empty": True}},
+    {"property": "Date", "date": {"on_or_after": "2024-02-01"}},
+    {"property": "Date", "date": {"equals": "2024-02-01"}},
+    {"property": "Date", "date": {"is_not_empty": True}},
+    {"property": "Done", "checkbox": {"equals": True}},
+    {
+        "or": [
+            {"property": "Select", "select": {"equals": "b"}},
+            {"property": "Number", "number": {"less_than": 5}},
+        ]
+    },
+    {"and": []},
+]
+
+
+def ids(pages):
+    return sorted(page["id"] for page in pages)
+
+
+@pytest.mark.parametrize("filter_", FILTERS)
+def test_evaluator_agrees_with_replica(filter_):
+    replica = LocalReplica("db", ":memory:")
+    for page in PAGES:
+        replica.upsert(page)
+
+    expected = ids(replica.query({"filter": filter_}))
+    assert ids(filter_pages({"filter": filter_}, PAGES)) == expected
+    replica.close()
+
+
+def test_builder_output_is_evaluated():
+    composer = FilterComposer()
+    composer.add_filter(NumberFilterBuilder("Number").greater_than(0).build())
+    composer.add_filter(TextFilterBuilder("Text").contains("hello").build())
+    composer.add_filter(MultiSelectFilterBuilder("Tags").contains("x").build())
+
+    assert ids(filter_pages(composer.build("and"), PAGES)) == ["p1", "p2"]
+    assert matches(composer.build("or"), PAGES[1])
+    assert not matches(composer.build("and"), PAGES[2])
+
+
+def test_unknown_condition_is_rejected():
+    with pytest.raises(ValueError):
+        matches({"filter": {"property": "Number", "number": {"near": 1}}}, PAGES[0])
+
+
+def test_sort_pages_puts_empty_values_last():
+    by_number = sort_pages([{"property": "Number", "direction": "descending"}], PAGES)
+    assert [p["id"] for p in by_number] == ["p2", "p1", "p3"]
+
+    sorts = [
+        {"property": "Done", "direction": "ascending"},
+        {"property": "Select", "direction": "descending"},
+    ]
+    assert [p["id"] for p in sort_pages(sorts, PAGES)] == ["p1", "p3", "p2"]
+    by_edit = sort_pages([{"timestamp": "last_edited_time"}], PAGES)
+    assert [p["id"] for p in by_edit] == ["p1", "p2", "p3"]
@@ -0,0 +1,140 @@
+import os
+import sys
+
+module_path = os.path.join(os.path.dirname(__file__), "..", "..")
+sys.path.append(module_path)
+
+import pytest
+
+from notion_api.utils.filter_evaluator import matches
+from notion_api.utils.filter_tree import (
+    MAX_COMPOUND_DEPTH,
+    combine,
+    depth,
+    negate,
+    simplify,
+    split_filter,
+)
+
+NUMBER = {"property": "Number", "number": {"greater_than": 5}}
+SELECT = {"property": "Select", "select": {"equals": "a"}}
+DATE = {"property": "Date", "date": {"equals": "2024-02-01"}}
+TEXT = {"property": "Text", "rich_text": {"contains": "x"}}
+
+
+def make_page(number=None, select=None, date=None, text=None):
+    return {
+        "last_edited_time": "2024-01-01T00:00:00.000Z",
+        "properties": {
+            "Number": {"number": number},
+            "Select": {"select": {"name": select} if select else None},
+            "Date": {"date": {"start": date} if date else None},
+            "Text": {"rich_text": [{"plain_text": text}] if text else []},
+        },
+    }
+
+
+PAGES = [
+    make_page(1, "a", "2024-01-01", "x"),
+    make_page(5, "b", "2024-02-01"),
+    make_page(9, None, None, "yx"),
+    make_page(),
+]
+
+
+@pytest.mark.parametrize(
+    "filter_",
+    [
+        NUMBER,
+        SELECT,
+        DATE,
+        TEXT,
+        {"property": "Number", "number": {"less_than_or_equal_to": 5}},
+        {"property": "Date", "date": {"on_or_after": "2024-02-01"}},
+        {"timestamp": "last_edited_time", "last_edited_time": {"after": "2023-12-31"}},
+        {"and": [NUMBER, SELECT]},
+        {"or": [DATE, {"and": [TEXT, NUMBER]}]},
+    ],
+)
+def test_negation_matches_the_complement(filter_):
+    negated = negate(filter_)
+    for page in PAGES:
+        assert matches({"filter": filter_}, page) != matches({"filter": negated}, page)
+
+
+def test_negation_includes_empty_cells_for_ranges():
+    assert negate(NUMBER) == {
+        "or": [
+            {"property": "Number", "number": {"less_than_or_equal_to": 5}},
+            {"property": "Number", "number": {"is_empty": True}},
+        ]
+    }
+
+
+def test_conditions_without_a_complement_are_rejected():
+    with pytest.raises(ValueError):
+        negate({"property": "Text", "rich_text": {"starts_with": "x"}})
+
+
+def test_combine_flattens_and_drops_empty_compounds():
+    assert combine("and", [{"and": [NUMBER, SELECT]}, {"or": []}, None, DATE]) == {
+        "and": [NUMBER, SELECT, DATE]
+    }
+    assert combine("or", [NUMBER]) == NUMBER
+    assert combine("and", []) is None
+
+
+def number(condition, value):
+    return {"property": "Number", "number": {condition: value}}
+
+
+def test_simplify_merges_ranges_on_the_same_field():
+    tree = {
+        "and": [
+            number("greater_than", 1),
+            {"and": [number("greater_than_or_equal_to", 3), SELECT]},
+            number("less_than", 9),
+            number("less_than_or_equal_to", 9),
+        ]
+    }
+    assert simplify(tree) == {
+        "and": [number("greater_than_or_equal_to", 3), SELECT, number("less_than", 9)]
+    }
+    assert simplify({"or": [number("greater_than", 1), number("greater_than", 3)]}) == (
+        number("greater_than", 1)
+    )
+
+
+def assert_equivalent(tree, filters):
+    assert all(depth(f) <= MAX_COMPOUND_DEPTH for f in filters)
+    for page in PAGES:
+        expected = matches({"filter": tree}, page)
+        assert any(matches({"filter": f}, page) for f in filters) == expected
+
+
+def test_deep_trees_are_rewritten_within_the_nesting_limit():
+    # and -> or -> and -> or は Notion のネスト制限を超える
+    tree = {
+        "and": [
+            SELECT,
+            {"or": [DATE, {"and": [TEXT, {"or": [NUMBER, number("equals", 1)]}]}]},
+        ]
+    }
+    assert depth(tree) > MAX_COMPOUND_DEPTH
+
+    filters = split_filter(tree)
+
+    assert len(filters) == 1
+    assert_equivalent(tree, filters)
+
+
+def test_large_rewrites_are_split_into_several_queries():
+    values = [number("equals", i) for i in range(60)]
+    tree = {"and": [SELECT, {"or": [DATE, {"and": [TEXT, {"or": values}]}]}]}
+
+    filters = split_filter(tree)
+
+    assert len(filters) == 2
+    assert_equivalent(tree, filters)
+    with pytest.raises(ValueError):
+        split_filter(tree, max_queries=1)
@@ -0,0 +1,141 @@
+import os
+import sys
+
+module_path = os.path.join(os.path.dirname(__file__), "..", "..")
+sys.path.append(module_path)
+
+import json
+
+import pytest
+import requests
+
+from notion_api.utils.client import BaseAPIClient
+from notion_api.utils.exceptions import ServerError
+from notion_api.utils.instrumentation import (
+    Exporter,
+    Instrumentation,
+    LatencyHistogram,
+    endpoint_template,
+)
+from notion_api.utils.retry import RetryPolicy
+
+
+def make_response(status_code, body):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = json.dumps(body).encode()
+    return response
+
+
+class ScriptedClient(BaseAPIClient):
+    def __init__(self, responses, instrumentation):
+        super().__init__(
+            api_key="test",
+            rate_limiter=None,
+            retry_policy=RetryPolicy(max_retries=1, backoff_base=0),
+            instrumentation=instrumentation,
+        )
+        self.responses = list(responses)
+
+    def request(self, method, url, **kwargs):
+        return self.responses.pop(0)
+
+
+def test_endpoint_template_replaces_ids():
+    assert (
+        endpoint_template("v1/databases/a214e6c2d6e044d39cb5b98dc438c5dc/query")
+        == "v1/databases/{id}/query"
+    )
+    assert (
+        endpoint_template("v1/pages/a214e6c2-d6e0-44d3-9cb5-b98dc438c5dc")
+        == "v1/pages/{id}"
+    )
+
+
+def test_histogram_percentiles_are_within_bucket_precision():
+    histogram = LatencyHistogram()
+    for ms in range(1, 1001):
+        histogram.record(ms / 1000)
+
+    assert histogram.percentile(50) == pytest.approx(0.5, rel=0.05)
+    assert histogram.percentile(99) == pytest.approx(0.99, rel=0.05)
+    assert histogram.percentile(100) == 1.0
+
+
+def test_hooks_and_stats_cover_retries_and_errors():
+    instrumentation = Instrumentation()
+    pre, post = [], []
+    instrumentation.add_pre_hook(lambda event: pre.append(event.key))
+    instrumentation.add_post_hook(post.append)
+    db = "a214e6c2d6e044d39cb5b98dc438c5dc"
+
+    client = ScriptedClient(
+        [make_response(429, {"code": "rate_limited"}), make_response(200, {"a": 1})],
+        instrumentation,
+    )
+    client.post(f"v1/databases/{db}/query", {"page_size": 1})
+
+    client = ScriptedClient([make_response(500, {})] * 2, instrumentation)
+    with pytest.raises(ServerError):
+        client.get(f"v1/pages/{db}")
+
+    assert pre == ["POST v1/databases/{id}/query", "GET v1/pages/{id}"]
+    assert post[0].retries == 1 and post[0].status_code == 200
+    # 全試行の合計
+    assert post[0].bytes_in == len(b'{"code": "rate_limited"}') + len(b'{"a": 1}')
+    assert isinstance(post[1].error, ServerError)
+
+    stats = instrumentation.stats()
+    query = stats["POST v1/databases/{id}/query"]
+    assert (query.count, query.retries, query.throttled) == (1, 1, 1)
+    assert stats["GET v1/pages/{id}"].errors == 1
+    assert stats["GET v1/pages/{id}"].status_codes == {500: 2}
+
+
+def test_failing_hook_does_not_break_requests():
+    instrumentation = Instrumentation()
+    instrumentation.add_post_hook(lambda event: 1 / 0)
+
+    class Collect(Exporter):
+        def export(self, stats):
+            self.stats = stats
+
+    exporter = Collect()
+    instrumentation.add_exporter(exporter)
+    client = ScriptedClient([make_response(200, {})], instrumentation)
+
+    assert client.get("v1/users")["code"] == 200
+    instrumentation.export()
+    assert exporter.stats["GET v1/users"].count == 1
+
+    class Incomplete(Exporter):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+def test_per_id_stats_are_bounded():
+    instrumentation = Instrumentation(max_ids=2)
+    ids = [f"{i:032x}" for i in range(3)]
+    for database_id in [ids[0], ids[1], ids[0], ids[2]]:
+        event = instrumentation.start("POST", f"v1/databases/{database_id}/query?a=b")
+        event.record_response(200, 10, 20)
+        instrumentation.finish(event)
+    instrumentation.finish(instrumentation.start("POST", "v1/pages"))
+
+    by_id = instrumentation.stats(by_id=True)
+    # 最も長く使われていない ids[1] が落ちる
+    assert sorted(by_id) == [
+        f"POST v1/databases/{ids[0]}/query",
+        f"POST v1/databases/{ids[2]}/query",
+    ]
+    assert by_id[f"POST v1/databases/{ids[0]}/query"].count == 2
+    stats = instrumentation.export()
+    assert stats["POST v1/databases/{id}/query"].count == 4
+    assert f"POST v1/databases/{ids[2]}/query" in stats
+
+    # 既定では ID ごとの集計は持たない
+    default = Instrumentation()
+    default.finish(default.start("POST", f"v1/databases/{ids[0]}/query"))
+    assert default.stats(by_id=True) == {}
@@ -0,0 +1,136 @@
+import os
+import sys
+import time
+
+module_path = os.path.join(os.path.dirname(__file__), "..", "..")
+sys.path.append(module_path)
+
+import pytest
+
+from notion_api.utils.pagination import (
+    build_query_body,
+    iter_query_pages,
+    read_ahead,
+)
+
+
+def make_post(pages):
+    calls = []
+
+    def post(endpoint, data=None):
+        calls.append((endpoint, dict(data)))
+        return {"code": 200, "body": pages[len(calls) - 1]}
+
+    return post, calls
+
+
+def test_iter_query_pages_follows_cursor():
+    pages = [
+        {"results": [1, 2], "has_more": True, "next_cursor": "c1"},
+        {"results": [3, 4], "has_more": True, "next_cursor": "c2"},
+        {"results": [5], "has_more": False, "next_cursor": None},
+    ]
+    post, calls = make_post(pages)
+
+    results = [
+        r
+        for page in iter_query_pages(post, "v1/databases/db/query", page_size=2)
+        for r in page["results"]
+    ]
+
+    assert results == [1, 2, 3, 4, 5]
+    assert [c[1].get("start_cursor") for c in calls] == [None, "c1", "c2"]
+    assert all(c[1]["page_size"] == 2 for c in calls)
+
+
+def test_iter_query_pages_is_lazy():
+    pages = [
+        {"results": [1], "has_more": True, "next_cursor": "c1"},
+        {"results": [2], "has_more": False, "next_cursor": None},
+    ]
+    post, calls = make_post(pages)
+
+    first = next(iter_query_pages(post, "v1/databases/db/query"))
+
+    assert first["results"] == [1]
+    assert len(calls) == 1
+
+
+def test_build_query_body_keeps_filter():
+    body = {"filter": {"property": "Number", "number": {"equals": 1}}}
+
+    query = build_query_body(body, page_size=50)
+
+    assert query["filter"] == body["filter"]
+    assert query["page_size"] == 50
+    assert "page_size" not in body
+
+
+def test_build_query_body_rejects_invalid_page_size():
+    with pytest.raises(ValueError):
+        build_query_body(page_size=101)
+    with pytest.raises(ValueError):
+        build_query_body(page_size=0)
+
+
+def test_iter_query_pages_prefetch_keeps_order():
+    pages = [
+        {"results": [i], "has_more": i < 9, "next_cursor": f"c{i}"} for i in range(10)
+    ]
+    post, calls = make_post(pages)
+
+    results = [
+        r
+        for page in iter_query_pages(post, "v1/databases/db/query", prefetch=2)
+        for r in page["results"]
+    ]
+
+    assert results == list(range(10))
+    assert len(calls) == 10
+
+
+def test_read_ahead_is_bounded():
+    produced = []
+
+    def source():
+        for i in range(100):
+            produced.append(i)
+            yield i
+
+    pages = read_ahead(source(), depth=2)
+    assert next(pages) == 0
+    time.sleep(0.2)
+
+    # 消費中の 1 件 + キュー 2 件 + put 待ちの 1 件
+    assert len(produced) <= 4
+    pages.close()
+
+
+def test_read_ahead_reraises_producer_errors():
+    def source():
+        yield 1
+        raise RuntimeError("boom")
+
+    pages = read_ahead(source())
+
+    assert next(pages) == 1
+    with pytest.raises(RuntimeError):
+        next(pages)
+
+
+def test_iter_query_pages_stops_at_limit():
+    pages = [
+        {"results": [1, 2, 3], "has_more": True, "next_cursor": "c1"},
+        {"results": [4, 5], "has_more": True, "next_cursor": "c2"},
+    ]
+    post, calls = make_post(pages)
+
+    results = [
+        r
+        for page in iter_query_pages(post, "v1/databases/db/query", limit=5)
+        for r in page["results"]
+    ]
+
+    assert results == [1, 2, 3, 4, 5]
+    # 2 回目は残り件数だけ要求し、3 回目のリクエストは送らない
+    assert [c[1]["page_size"] for c in calls] == [5, 2]
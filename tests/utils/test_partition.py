@@ -0,0 +1,77 @@
+import os
+import sys
+
+module_path = os.path.join(os.path.dirname(__file__), "..", "..")
+sys.path.append(module_path)
+
+import pytest
+
+from notion_api.utils.filter_evaluator import compile_filter
+from notion_api.utils.partition import partition_filters
+
+
+def _page(number=None, day=None, created_time="2024-01-01T00:00:00.000Z"):
+    return {
+        "id": f"{number}-{day}-{created_time}",
+        "created_time": created_time,
+        "properties": {
+            "Number": {"type": "number", "number": number},
+            "Date": {
+                "type": "date",
+                "date": {"start": day} if day else None,
+            },
+        },
+    }
+
+
+def _assert_disjoint_cover(filters, pages):
+    tests = [compile_filter(f) if f else (lambda page: True) for f in filters]
+    for page in pages:
+        assert sum(test(page) for test in tests) == 1, page
+
+
+def test_number_partitions_cover_every_value_once():
+    filters = partition_filters("Number", "number", 0, 100, 4)
+
+    assert len(filters) == 5
+    assert filters[0] == {"property": "Number", "number": {"less_than": 25}}
+    assert filters[-1] == {"property": "Number", "number": {"is_empty": True}}
+    # 観測した範囲外の値や空のセルも一度だけ一致する
+    numbers = [None, -5, 0, 24.5, 25, 50, 99, 100, 1000]
+    _assert_disjoint_cover(filters, [_page(number=n) for n in numbers])
+
+
+def test_date_partitions_use_day_boundaries():
+    filters = partition_filters("Date", "date", "2024-01-01", "2024-01-03", 8)
+
+    # 2 日の範囲は 8 分割できないので境界は重複を除いた日付になる
+    assert filters == [
+        {"property": "Date", "date": {"before": "2024-01-02"}},
+        {"property": "Date", "date": {"on_or_after": "2024-01-02"}},
+        {"property": "Date", "date": {"is_empty": True}},
+    ]
+    days = [None, "2023-12-31", "2024-01-01", "2024-01-02T23:00:00.000Z", "2024-02-01"]
+    _assert_disjoint_cover(filters, [_page(day=d) for d in days])
+
+
+def test_timestamp_partitions_have_no_empty_partition():
+    filters = partition_filters(
+        "created_time", "timestamp", "2024-01-01T00:00:00.000Z", "2024-01-05", 4
+    )
+
+    assert len(filters) == 4
+    assert filters[0] == {
+        "timestamp": "created_time",
+        "created_time": {"before": "2024-01-02T00:00:00.000Z"},
+    }
+    times = ["2023-01-01T00:00:00.000Z", "2024-01-02T00:00:00.000Z", "2025-01-01"]
+    _assert_disjoint_cover(filters, [_page(created_time=t) for t in times])
+
+
+def test_single_value_range_is_one_unfiltered_partition():
+    assert partition_filters("Number", "number", 3, 3, 4) == [None]
+    assert partition_filters("Number", "number", None, None, 4) == [None]
+    with pytest.raises(ValueError):
+        partition_filters("Number", "number", 0, 10, 0)
+    with pytest.raises(ValueError):
+        partition_filters("Name", "title", "a", "b", 2)
@@ -0,0 +1,84 @@
+import os
+import sys
+
+module_path = os.path.join(os.path.dirname(__file__), "..", "..")
+sys.path.append(module_path)
+
+from notion_api.utils.cache import SchemaCache
+
+
+def response(last_edited_time, properties=None):
+    body = {"last_edited_time": last_edited_time, "properties": properties or {}}
+    return {"code": 200, "body": body}
+
+
+class Parser:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, raw):
+        self.calls += 1
+        return {"parsed": raw["body"]["last_edited_time"], "n": self.calls}
+
+
+def test_fresh_entries_are_hits():
+    now = [0.0]
+    cache = SchemaCache(ttl=10, clock=lambda: now[0])
+    parse = Parser()
+
+    assert cache.get("db") is None
+    value = cache.put("db", response("t1"), parse)
+    now[0] = 5
+
+    assert cache.get("db") is value
+    assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+
+def test_expired_entry_is_revalidated_by_body():
+    now = [0.0]
+    cache = SchemaCache(ttl=10, clock=lambda: now[0])
+    parse = Parser()
+    value = cache.put("db", response("t1"), parse)
+
+    now[0] = 11
+    assert cache.get("db") is None
+    assert cache.put("db", response("t1"), parse) is value
+    assert parse.calls == 1
+    assert cache.stats.revalidations == 1
+
+    now[0] = 22
+    assert cache.put("db", response("t2"), parse)["parsed"] == "t2"
+    assert parse.calls == 2
+
+
+def test_edit_within_the_same_minute_is_not_revalidated():
+    now = [0.0]
+    cache = SchemaCache(ttl=10, clock=lambda: now[0])
+    parse = Parser()
+    cache.put("db", response("t1", {"Number": {"number": {}}}), parse)
+
+    # last_edited_time は分単位なので同じ分の変更では値が変わらない
+    now[0] = 11
+    cache.put("db", response("t1", {"Price": {"number": {}}}), parse)
+    assert parse.calls == 2
+    assert cache.stats.revalidations == 0
+
+
+def test_lru_eviction_and_invalidation():
+    cache = SchemaCache(ttl=60, max_entries=2)
+    parse = Parser()
+    invalidated = []
+    cache.add_invalidation_listener(invalidated.append)
+
+    cache.put("a", response("t"), parse)
+    cache.put("b", response("t"), parse)
+    cache.get("a")
+    cache.put("c", response("t"), parse)
+
+    assert "a" in cache and "c" in cache and "b" not in cache
+    assert cache.stats.evictions == 1
+
+    cache.invalidate("a")
+    cache.invalidate()
+    assert len(cache) == 0
+    assert invalidated == ["a", None]